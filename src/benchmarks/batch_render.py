@@ -0,0 +1,78 @@
+import argparse
+import time
+
+from vasya import InputConnectReport
+from vasya.input_connect.render import Report
+
+from typing import Callable, List
+
+
+def measure(fn: Callable[[], None], repeat: int) -> List[float]:
+    """
+    Замеряет время выполнения функции.
+
+    Parameters
+    ----------
+    fn: Callable[[], None]
+        Функция
+    repeat: int
+        Количество запусков
+
+    Returns
+    -------
+    List[float]
+        Время каждого запуска в секундах
+    """
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    """
+    Сравнивает отдельные отчёты по каждой профессии с пакетным отчётом:
+    python -m benchmarks.batch_render <путь> <профессия> ...
+    """
+
+    parser = argparse.ArgumentParser(description="Пакетный отчёт по профессиям")
+    parser.add_argument("path", help="директория с csv файлами или csv файл")
+    parser.add_argument("professions", nargs="+", help="профессии")
+    parser.add_argument("--repeat", type=int, default=1, help="количество запусков")
+    parser.add_argument("--backend", default="process", help="способ обработки csv")
+    parser.add_argument(
+        "--artifacts", default="xlsx,png", help="файлы отчёта через запятую"
+    )
+    parser.add_argument("--template", default="pdf_template.html", help="шаблон pdf")
+    parser.add_argument("--workers", type=int, help="потоки для excel и pdf")
+    args = parser.parse_args()
+    artifacts = args.artifacts.split(",")
+
+    def separate() -> None:
+        for profession in args.professions:
+            report = InputConnectReport(args.path, profession, backend=args.backend)
+            report.prepare_data()
+            Report.render_artifacts(report, artifacts, args.template)
+
+    def batch() -> None:
+        report = InputConnectReport(args.path, args.professions, backend=args.backend)
+        report.prepare_data()
+        Report.render_batch(
+            report,
+            artifacts=artifacts,
+            template_name=args.template,
+            workers=args.workers,
+        )
+
+    results = {}
+    for name, fn in (("отдельно", separate), ("пакетом", batch)):
+        results[name] = min(measure(fn, args.repeat))
+        print(f"{name}: {results[name]:.3f} с")
+    print(f"ускорение: {results['отдельно'] / results['пакетом']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import os
+import tempfile
+import time
+
+from vasya import InputConnectReport, InputConnectReportSQLite
+from vasya.salary_db import SalaryDatabase
+
+from typing import Callable, List
+
+
+def measure(fn: Callable[[], None], repeat: int) -> List[float]:
+    """
+    Замеряет время выполнения функции.
+
+    Parameters
+    ----------
+    fn: Callable[[], None]
+        Функция
+    repeat: int
+        Количество запусков
+
+    Returns
+    -------
+    List[float]
+        Время каждого запуска в секундах
+    """
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    """
+    Сравнивает отчёт по csv файлам и по базе SQLite, созданной из них:
+    python -m benchmarks.sqlite_report <путь> <профессия>.
+    """
+
+    parser = argparse.ArgumentParser(description="Отчёт по csv и по SQLite")
+    parser.add_argument("path", help="директория с csv файлами или csv файл")
+    parser.add_argument("professions", nargs="+", help="профессии")
+    parser.add_argument("--repeat", type=int, default=5, help="количество запусков")
+    parser.add_argument("--backend", default="process", help="способ обработки csv")
+    parser.add_argument("--db", help="файл базы (по умолчанию - временный)")
+    args = parser.parse_args()
+
+    def csv_report() -> InputConnectReport:
+        report = InputConnectReport(args.path, args.professions, backend=args.backend)
+        report.prepare_data()
+        return report
+
+    def sqlite_report() -> InputConnectReport:
+        report = InputConnectReportSQLite(db_name, args.professions)
+        report.prepare_data()
+        return report
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_name = args.db or os.path.join(tmp, "salary.sqlite")
+        files = InputConnectReport(args.path, args.professions).get_files()
+        (build,) = measure(lambda: SalaryDatabase.from_csv(files, db_name).close(), 1)
+
+        if csv_report().to_dict() != sqlite_report().to_dict():
+            parser.exit(1, "Отчёты по csv и по SQLite отличаются\n")
+
+        print(f"создание базы: {build:.3f} с")
+        for name, fn in (("csv", csv_report), ("sqlite", sqlite_report)):
+            times = measure(fn, args.repeat)
+            print(
+                f"{name}: лучшее {min(times):.4f} с, "
+                f"среднее {sum(times) / len(times):.4f} с"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import subprocess
+import sys
+
+from typing import Dict, List, Tuple
+
+HEAVY_MODULES = ("matplotlib", "openpyxl", "jinja2", "pdfkit")
+"""Зависимости отчёта, которые не нужны режиму таблицы"""
+
+
+def import_time(module: str) -> Tuple[int, List[str]]:
+    """
+    Замеряет время импорта модуля в новом интерпретаторе через -X importtime.
+
+    Parameters
+    ----------
+    module: str
+        Импортируемый модуль
+
+    Returns
+    -------
+    Tuple[int, List[str]]
+        Суммарное время импорта в микросекундах
+        и загруженные зависимости отчёта
+    """
+
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total = 0
+    loaded = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if name == module:
+            total = int(cumulative)
+        if name in HEAVY_MODULES:
+            loaded.add(name)
+    return total, sorted(loaded)
+
+
+def main() -> None:
+    """
+    Замеряет время запуска режимов программы:
+    python -m benchmarks.startup [модуль ...] [--max-ms N].
+    Завершается с ошибкой, если импорт дольше --max-ms.
+    """
+
+    parser = argparse.ArgumentParser(description="Время импорта модулей")
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=["vasya", "vasya.input_connect.table", "vasya.client"],
+        help="модули",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="количество запусков")
+    parser.add_argument("--max-ms", type=float, help="допустимое время импорта")
+    args = parser.parse_args()
+
+    slow: Dict[str, float] = {}
+    for module in args.modules:
+        times = []
+        for _ in range(args.repeat):
+            total, loaded = import_time(module)
+            times.append(total / 1000)
+        best = min(times)
+        print(
+            f"{module}: {best:.1f} мс, зависимости отчёта: {', '.join(loaded) or 'нет'}"
+        )
+        if args.max_ms is not None and best > args.max_ms:
+            slow[module] = best
+
+    if slow:
+        parser.exit(1, f"Импорт дольше {args.max_ms} мс: {', '.join(slow)}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,441 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from vasya.dataset import DataSet
+from vasya.errors import VasyaException
+from vasya.input_connect.report import InputConnectReport
+from vasya.input_connect.report_cube import InputConnectReportCube
+from vasya.input_connect.report_sqlite import InputConnectReportSQLite
+from vasya.input_connect.table import InputConnectTable
+from vasya.salary_db import SalaryDatabase
+from vasya.synthetic import generate
+from vasya.vacancy import Vacancy
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SIZES = (10_000, 100_000, 1_000_000, 10_000_000)
+"""Размеры наборов данных по умолчанию (строк)"""
+
+PROFESSIONS = ["Программист", "Аналитик", "Менеджер"]
+"""Профессии отчётов"""
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Возвращает пиковый объём памяти процесса и его дочерних процессов.
+
+    Returns
+    -------
+    Optional[float]
+        Пиковый RSS в МБ или None, если модуль resource недоступен
+    """
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # В Linux ru_maxrss в КБ, в macOS - в байтах
+    return rss / (1 << 20 if sys.platform == "darwin" else 1 << 10)
+
+
+def make_dataset(source: str, rows: int, file_name: Path) -> None:
+    """
+    Создаёт csv файл из rows строк, повторяя строки исходного файла.
+
+    Parameters
+    ----------
+    source: str
+        Исходный csv файл
+    rows: int
+        Количество строк
+    file_name: Path
+        Создаваемый файл
+
+    Raises
+    ------
+    VasyaException
+        В исходном файле нет данных
+    """
+
+    with open(source, encoding="utf-8-sig", newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        data = [row for row in reader if row and all(row)]
+    if header is None or not data:
+        raise VasyaException(f"Нет данных: {source}")
+
+    tmp_name = file_name.with_suffix(".tmp")
+    with open(tmp_name, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(header)
+        writer.writerows(itertools.islice(itertools.cycle(data), rows))
+    os.replace(tmp_name, file_name)
+
+
+def prepare(
+    source: Optional[str], rows: int, work_dir: Path, seed: int = 0
+) -> Tuple[Path, Path]:
+    """
+    Создаёт набор данных и базу SQLite для размера rows, если их ещё нет.
+
+    Parameters
+    ----------
+    source: Optional[str]
+        Исходный csv файл. Если None, то создаются случайные вакансии
+    rows: int
+        Количество строк
+    work_dir: Path
+        Директория для наборов данных
+    seed: int
+        Начальное значение генератора случайных вакансий
+
+    Returns
+    -------
+    Tuple[Path, Path]
+        Путь до csv файла и до базы SQLite
+    """
+
+    name = f"vacancies_{rows}" if source else f"synthetic_{seed}_{rows}"
+    file_name, db_name = work_dir / f"{name}.csv", work_dir / f"{name}.sqlite"
+    if not file_name.exists() and source:
+        make_dataset(source, rows, file_name)
+    elif not file_name.exists():
+        generate(str(file_name), rows, seed)
+    if not db_name.exists():
+        SalaryDatabase.from_csv([file_name], str(db_name)).close()
+    return file_name, db_name
+
+
+def case_parse(file_name: Path, db_name: Path, backend: str) -> Callable[[], int]:
+    """Чтение файла в вакансии (DataSet.from_file)."""
+
+    return lambda: len(DataSet.from_file(str(file_name)).to_list())
+
+
+def case_vacancy(file_name: Path, db_name: Path, backend: str) -> Callable[[], int]:
+    """Создание вакансий из прочитанных строк и разбор даты публикации."""
+
+    with open(file_name, encoding="utf-8-sig", newline="") as file:
+        rows = [row for row in csv.DictReader(file) if all(row.values())]
+
+    def run() -> int:
+        for row in rows:
+            Vacancy(**row).published_at
+        return len(rows)
+
+    return run
+
+
+def case_table(file_name: Path, db_name: Path, backend: str) -> Callable[[], int]:
+    """Фильтрация, сортировка и диапазон вывода таблицы по прочитанным данным."""
+
+    vacancies = DataSet.from_file(str(file_name)).to_list()
+    queries = (
+        {"filter_by": f"Название региона: {vacancies[0].area_name}"},
+        {"sort_by": "Название", "reverse_sort": "Да", "limit": "1 50"},
+        {"filter_by": f"Название: {vacancies[0].name}", "sort_by": "Название"},
+    )
+
+    def run() -> int:
+        for query in queries:
+            data = DataSet.from_vacancies(str(file_name), vacancies)
+            InputConnectTable.from_strings(
+                str(file_name), **query, data=data
+            ).get_rows()
+        return len(vacancies) * len(queries)
+
+    return run
+
+
+def case_report_csv(file_name: Path, db_name: Path, backend: str) -> Callable[[], int]:
+    """Отчёт по csv файлу (InputConnectReport)."""
+
+    def run() -> int:
+        report = InputConnectReport(str(file_name), PROFESSIONS, backend=backend)
+        report.prepare_data()
+        return report.total_vacancies
+
+    return run
+
+
+def case_report_sqlite(
+    file_name: Path, db_name: Path, backend: str
+) -> Callable[[], int]:
+    """Отчёт по базе SQLite (InputConnectReportSQLite)."""
+
+    def run() -> int:
+        report = InputConnectReportSQLite(str(db_name), PROFESSIONS)
+        report.prepare_data()
+        return report.total_vacancies
+
+    return run
+
+
+def case_report_cube_cold(
+    file_name: Path, db_name: Path, backend: str
+) -> Callable[[], int]:
+    """Отчёт InputConnectReportCube с построением куба без сохранения."""
+
+    def run() -> int:
+        report = InputConnectReportCube(
+            str(file_name), PROFESSIONS, None, backend=backend
+        )
+        report.prepare_data()
+        return report.total_vacancies
+
+    return run
+
+
+def case_report_cube(file_name: Path, db_name: Path, backend: str) -> Callable[[], int]:
+    """Отчёт по сохранённому кубу (InputConnectReportCube), куб уже построен."""
+
+    cache_dir = tempfile.mkdtemp(prefix="vasya-bench-cube-")
+
+    def run() -> int:
+        report = InputConnectReportCube(
+            str(file_name), PROFESSIONS, cache_dir, backend=backend
+        )
+        report.prepare_data()
+        return report.total_vacancies
+
+    run()
+    return run
+
+
+CASES: Dict[str, Callable[[Path, Path, str], Callable[[], int]]] = {
+    "parse": case_parse,
+    "vacancy": case_vacancy,
+    "table": case_table,
+    "report_csv": case_report_csv,
+    "report_sqlite": case_report_sqlite,
+    "report_cube_cold": case_report_cube_cold,
+    "report_cube": case_report_cube,
+}
+"""Замеры по названиям. Замер готовит данные и возвращает функцию,
+время которой измеряется; функция возвращает количество обработанных строк"""
+
+
+def run_case(
+    name: str, file_name: Path, db_name: Path, backend: str, repeat: int
+) -> Dict[str, Any]:
+    """
+    Выполняет замер в текущем процессе.
+
+    Parameters
+    ----------
+    name: str
+        Название замера
+    file_name: Path
+        Csv файл
+    db_name: Path
+        База SQLite с теми же данными
+    backend: str
+        Способ обработки файлов в отчётах
+    repeat: int
+        Количество запусков
+
+    Returns
+    -------
+    Dict[str, Any]
+        Время запусков в секундах, обработанные строки и пиковый RSS
+    """
+
+    fn = CASES[name](file_name, db_name, backend)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        processed = fn()
+        times.append(time.perf_counter() - start)
+    return {"times": times, "processed": processed, "peak_rss_mb": peak_rss_mb()}
+
+
+def measure(
+    name: str, rows: int, file_name: Path, db_name: Path, backend: str, repeat: int
+) -> Dict[str, Any]:
+    """
+    Выполняет замер в отдельном процессе, чтобы пиковый RSS
+    относился только к нему.
+
+    Parameters
+    ----------
+    name: str
+        Название замера
+    rows: int
+        Размер набора данных
+    file_name: Path
+        Csv файл
+    db_name: Path
+        База SQLite
+    backend: str
+        Способ обработки файлов в отчётах
+    repeat: int
+        Количество запусков
+
+    Returns
+    -------
+    Dict[str, Any]
+        Результат замера: время, пропускная способность, задержка и RSS
+    """
+
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.suite",
+            "--run-case",
+            name,
+            str(file_name),
+            str(db_name),
+            "--backend",
+            backend,
+            "--repeat",
+            str(repeat),
+        ],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    case = json.loads(output)
+    times = case["times"]
+    median = statistics.median(times)
+    return {
+        "name": name,
+        "rows": rows,
+        "best_s": min(times),
+        "median_s": median,
+        "throughput_rows_s": case["processed"] / median if median else None,
+        "latency_ms": median * 1000,
+        "peak_rss_mb": case["peak_rss_mb"],
+    }
+
+
+def compare(
+    results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """
+    Сравнивает результаты с сохранёнными.
+
+    Parameters
+    ----------
+    results: List[Dict[str, Any]]
+        Результаты замеров
+    baseline: Dict[str, Any]
+        Сохранённый результат набора замеров
+    tolerance: float
+        Допустимое ухудшение времени и памяти (0.2 - на 20%)
+
+    Returns
+    -------
+    List[str]
+        Описания ухудшений
+    """
+
+    saved = {(i["name"], i["rows"]): i for i in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = saved.get((result["name"], result["rows"]))
+        if old is None:
+            continue
+        for key in ("median_s", "peak_rss_mb"):
+            if not old.get(key) or result.get(key) is None:
+                continue
+            ratio = result[key] / old[key]
+            print(f"  {result['name']} {result['rows']}: {key} x{ratio:.2f}")
+            if ratio > 1 + tolerance:
+                regressions.append(
+                    f"{result['name']} {result['rows']}: {key} "
+                    f"{old[key]:.3f} -> {result[key]:.3f}"
+                )
+    return regressions
+
+
+def main() -> None:
+    """
+    Набор замеров чтения, таблицы и отчётов на наборах данных разного
+    размера: python -m benchmarks.suite [--source <csv>] [--rows ...]
+    [--output result.json] [--baseline baseline.json].
+    Завершается с ошибкой, если результат хуже сохранённого больше,
+    чем на --tolerance.
+    """
+
+    parser = argparse.ArgumentParser(description="Набор замеров производительности")
+    parser.add_argument(
+        "--source", help="csv файл, строки которого повторяются (иначе - случайные)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="для случайных вакансий")
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=list(SIZES), help="размеры наборов"
+    )
+    parser.add_argument(
+        "--cases", nargs="+", choices=list(CASES), default=list(CASES), help="замеры"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="количество запусков")
+    parser.add_argument("--backend", default="inline", help="способ обработки csv")
+    parser.add_argument("--work-dir", help="директория для наборов данных")
+    parser.add_argument("--output", help="файл для результата в JSON")
+    parser.add_argument("--baseline", help="сохранённый результат для сравнения")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="допустимое ухудшение"
+    )
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("paths", nargs="*", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        file_name, db_name = map(Path, args.paths)
+        case = run_case(args.run_case, file_name, db_name, args.backend, args.repeat)
+        print(json.dumps(case))
+        return
+    work_dir = Path(args.work_dir or tempfile.mkdtemp(prefix="vasya-bench-"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    results = []
+    for rows in args.rows:
+        file_name, db_name = prepare(args.source, rows, work_dir, args.seed)
+        for name in args.cases:
+            result = measure(name, rows, file_name, db_name, args.backend, args.repeat)
+            results.append(result)
+            print(
+                f"{name} {rows}: {result['median_s']:.3f} с, "
+                f"{result['throughput_rows_s']:.0f} строк/с, "
+                f"{result['peak_rss_mb'] or 0:.0f} МБ"
+            )
+
+    suite = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "source": args.source or f"synthetic:{args.seed}",
+        "backend": args.backend,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(suite, file, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        if regressions:
+            parser.exit(1, "Ухудшения:\n" + "\n".join(regressions) + "\n")
+
+
+if __name__ == "__main__":
+    main()
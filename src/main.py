@@ -1,12 +1,9 @@
 #!./venv/bin/python
 
-from vasya import (
-    InputConnectReportSync,
-    InputConnectTable,
-    InputConnectReportMultiprocessing,
-    InputConnectReportConcurrent,
-    VasyaException,
-)
+import sys
+import vasya
+from vasya import VasyaException
+from vasya.cli import main as cli_main
 from pathlib import Path
 
 from typing import Dict, Type
@@ -16,13 +13,19 @@ current_dir = Path(__file__).parent
 
 
 def main():
-    """Основная функция программы."""
-
-    choices: Dict[str, Type[InputConnectBase]] = {
-        "вакансии": InputConnectTable,
-        "статистика": InputConnectReportConcurrent,
-        "old_stats": InputConnectReportSync,
-        "old_fast_stats": InputConnectReportMultiprocessing,
+    """
+    Основная функция программы. С аргументами командной строки работает
+    без диалога (см. python -m vasya --help).
+    """
+
+    if len(sys.argv) > 1:
+        cli_main([*sys.argv[1:], f"--template={current_dir / 'pdf_template.html'}"])
+        return
+
+    # Коннектор импортируется только после выбора действия
+    choices: Dict[str, str] = {
+        "вакансии": "InputConnectTable",
+        "статистика": "InputConnectReport",
     }
     while True:
         choice = input("Введите действие (вакансии / статистика): ").lower()
@@ -30,7 +33,8 @@ def main():
             print("Неверный ввод")
             continue
         try:
-            input_connect = choices[choice].from_input()
+            connector: Type[InputConnectBase] = getattr(vasya, choices[choice])
+            input_connect = connector.from_input()
             input_connect.prepare_data()
             input_connect.get_answer(
                 template_path=str(current_dir / "pdf_template.html")
@@ -1,17 +1,76 @@
+from importlib import import_module
+
 from .errors import VasyaException
-from .input_connect import (
-    InputConnectBase,
-    InputConnectTable,
-    InputConnectReportMultiprocessing,
-    InputConnectReportConcurrent,
-    InputConnectReportSync,
-)
+from .input_connect import CONNECTORS, InputConnectBase
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .input_connect import (
+        InputConnectTable,
+        InputConnectReport,
+        InputConnectReportMultiprocessing,
+        InputConnectReportConcurrent,
+        InputConnectReportSync,
+        InputConnectReportSQLite,
+        InputConnectReportCube,
+    )
+    from .jobs import JobRunner, load_jobs, run_jobs, run_report, run_table
+
+API: Dict[str, str] = {
+    "JobRunner": ".jobs",
+    "load_jobs": ".jobs",
+    "run_jobs": ".jobs",
+    "run_report": ".jobs",
+    "run_table": ".jobs",
+}
+"""Модули функций для запуска заданий из кода по их названиям"""
 
 __all__ = (
     "VasyaException",
     "InputConnectBase",
     "InputConnectTable",
+    "InputConnectReport",
     "InputConnectReportMultiprocessing",
     "InputConnectReportConcurrent",
     "InputConnectReportSync",
+    "InputConnectReportSQLite",
+    "InputConnectReportCube",
+    *API,
 )
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Импортирует коннектор (см. input_connect.CONNECTORS) или функцию
+    из API при первом обращении.
+
+    Parameters
+    ----------
+    name: str
+        Название коннектора или функции
+
+    Raises
+    ------
+    AttributeError
+        Коннектор или функция не найдены
+
+    Returns
+    -------
+    Any
+        Класс коннектора или функция
+    """
+
+    if name in CONNECTORS:
+        module = import_module(".input_connect", __name__)
+    elif name in API:
+        module = import_module(API[name], __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *CONNECTORS, *API})
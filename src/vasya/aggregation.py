@@ -0,0 +1,959 @@
+import csv
+import os
+import pickle
+import tempfile
+import uuid
+import zlib
+from abc import ABCMeta, abstractmethod
+from operator import attrgetter
+
+from .periods import period_key, period_label
+from .sketches import HyperLogLog, KLLSketch, SpaceSaving
+from .vacancy import Vacancy
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+Dimension = Union[str, Callable[[Vacancy], Hashable]]
+Key = Tuple[Hashable, ...]
+Partial = Dict[Key, List[Any]]
+
+
+def partition_of(key: Key, partitions: int) -> int:
+    """
+    Возвращает номер раздела для ключа группы.
+    Хэш не зависит от процесса, в отличие от встроенного hash для строк,
+    поэтому разделы разных процессов совпадают.
+
+    Parameters
+    ----------
+    key: Key
+        Ключ группы
+    partitions: int
+        Количество разделов
+
+    Returns
+    -------
+    int
+        Номер раздела
+    """
+
+    return zlib.crc32(repr(key).encode("utf-8")) % partitions
+
+
+class SpillingPartial(dict):
+    """
+    Частичный результат группировки, который при превышении
+    количества групп сбрасывается на диск, разбитый по разделам.
+
+    В памяти хранится только часть групп, остальные лежат в pickle-файлах
+    раздела. Ключ попадает в один и тот же раздел во всех процессах,
+    поэтому при объединении разделы можно обрабатывать по одному.
+
+    Attributes
+    ----------
+    spill_dir: Optional[str]
+        Директория для файлов разделов
+    partitions: int
+        Количество разделов
+    files: List[List[str]]
+        Пути до файлов каждого раздела
+    """
+
+    def __init__(self, spill_dir: Optional[str], partitions: int) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        spill_dir: Optional[str]
+            Директория для файлов разделов. Если не указана,
+            то при первом сбросе создаётся временная директория
+        partitions: int
+            Количество разделов
+        """
+
+        super().__init__()
+        self.spill_dir = spill_dir
+        self.partitions = partitions
+        self.files: List[List[str]] = [[] for _ in range(partitions)]
+
+    @property
+    def spilled(self) -> bool:
+        """
+        Сбрасывались ли группы на диск.
+        """
+
+        return any(self.files)
+
+    def spill(self) -> None:
+        """
+        Сбрасывает группы из памяти на диск, по одному файлу на раздел.
+        """
+
+        if not self:
+            return
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="vasya-spill-")
+
+        buckets: List[Partial] = [{} for _ in range(self.partitions)]
+        for key, states in self.items():
+            buckets[partition_of(key, self.partitions)][key] = states
+        self.clear()
+
+        prefix = uuid.uuid4().hex
+        for number, bucket in enumerate(buckets):
+            if not bucket:
+                continue
+            path = os.path.join(self.spill_dir, f"{prefix}-{number}.pickle")
+            with open(path, "wb") as file:
+                pickle.dump(bucket, file, protocol=pickle.HIGHEST_PROTOCOL)
+            self.files[number].append(path)
+
+
+class SpilledResults:
+    """
+    Результаты группировки, частично лежащие на диске.
+    Группы объединяются и выдаются по одному разделу за раз,
+    поэтому в памяти одновременно находится только один раздел.
+    Внутри раздела группы отсортированы по ключу.
+
+    Attributes
+    ----------
+    group_by: GroupBy
+        Группировка
+    partial: SpillingPartial
+        Объединённый частичный результат
+    """
+
+    def __init__(self, group_by: "GroupBy", partial: SpillingPartial) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        group_by: GroupBy
+            Группировка
+        partial: SpillingPartial
+            Объединённый частичный результат
+        """
+
+        self.group_by = group_by
+        self.partial = partial
+
+    def items(self) -> Iterator[Tuple[Key, Dict[str, Any]]]:
+        """
+        Выдаёт итоговые значения мер для каждой группы.
+
+        Returns
+        -------
+        Iterator[Tuple[Key, Dict[str, Any]]]
+            Ключи групп и значения мер по названиям
+        """
+
+        partial = self.partial
+        for number in range(partial.partitions):
+            bucket: Partial = {
+                key: states
+                for key, states in partial.items()
+                if partition_of(key, partial.partitions) == number
+            }
+            for path in partial.files[number]:
+                with open(path, "rb") as file:
+                    self.group_by.merge(bucket, pickle.load(file))
+            yield from self.group_by.results(bucket).items()
+
+    def __iter__(self) -> Iterator[Key]:
+        return (key for key, _ in self.items())
+
+    def write_csv(self, file_name: str) -> None:
+        """
+        Записывает результаты в CSV-файл.
+
+        Parameters
+        ----------
+        file_name: str
+            Путь до файла
+        """
+
+        with open(file_name, "w", encoding="utf-8-sig", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(
+                [
+                    *self.group_by.dimension_names,
+                    *(measure.name for measure in self.group_by.measures),
+                ]
+            )
+            for key, values in self.items():
+                writer.writerow([*key, *values.values()])
+
+
+def published_year(vacancy: Vacancy) -> int:
+    """Год публикации вакансии."""
+    return period_key(vacancy.published_at_raw, "year")
+
+
+def published_month(vacancy: Vacancy) -> Tuple[int, int]:
+    """Год и месяц публикации вакансии."""
+    year, month = divmod(period_key(vacancy.published_at_raw, "month"), 12)
+    return year, month + 1
+
+
+def published_week(vacancy: Vacancy) -> str:
+    """Понедельник недели публикации вакансии."""
+    return period_label(period_key(vacancy.published_at_raw, "week"), "week")
+
+
+DIMENSIONS: Dict[str, Callable[[Vacancy], Hashable]] = {
+    "year": published_year,
+    "month": published_month,
+    "week": published_week,
+}
+"""Именованные измерения, которые вычисляются по вакансии"""
+
+
+class Measure(metaclass=ABCMeta):
+    """
+    Базовый класс меры для группировки.
+
+    Состояние меры для каждой группы создаётся методом create,
+    обновляется методом update и объединяется методом merge,
+    поэтому частичные результаты разных процессов можно складывать.
+
+    Attributes
+    ----------
+    field: Optional[str]
+        Поле вакансии, по которому считается мера
+    name: str
+        Название меры в результатах
+    """
+
+    kind = "measure"
+
+    def __init__(self, field: Optional[str] = None, name: Optional[str] = None) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        field: Optional[str]
+            Поле вакансии, по которому считается мера
+        name: Optional[str]
+            Название меры в результатах, по умолчанию kind(field)
+        """
+
+        self.field = field
+        self.name = name or (f"{self.kind}({field})" if field else self.kind)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.field!r}, {self.name!r})"
+
+    @property
+    def key(self) -> Hashable:
+        """
+        Ключ, однозначно описывающий меру (для кэша частичных результатов).
+        """
+
+        return repr(self)
+
+    @abstractmethod
+    def create(self) -> Any:
+        """
+        Создаёт пустое состояние меры.
+
+        Returns
+        -------
+        Any
+            Состояние меры группы без значений
+        """
+        ...
+
+    @abstractmethod
+    def update(self, state: Any, value: Any) -> Any:
+        """
+        Добавляет значение к состоянию.
+
+        Parameters
+        ----------
+        state: Any
+            Состояние меры
+        value: Any
+            Значение поля вакансии
+
+        Returns
+        -------
+        Any
+            Новое состояние (может быть тем же изменённым объектом)
+        """
+        ...
+
+    @abstractmethod
+    def merge(self, state: Any, other: Any) -> Any:
+        """
+        Объединяет два состояния меры.
+
+        Parameters
+        ----------
+        state: Any
+            Состояние меры
+        other: Any
+            Состояние меры по другой части данных
+
+        Returns
+        -------
+        Any
+            Объединённое состояние (может быть тем же изменённым объектом state)
+        """
+        ...
+
+    def result(self, state: Any) -> Any:
+        """
+        Возвращает итоговое значение меры.
+
+        Parameters
+        ----------
+        state: Any
+            Состояние меры
+
+        Returns
+        -------
+        Any
+            Значение меры в результатах группировки
+        """
+
+        return state
+
+
+class Count(Measure):
+    """
+    Количество вакансий в группе. Поле вакансии не используется.
+
+    Состояние - количество вакансий.
+
+    Attributes
+    ----------
+    field: Optional[str]
+        Поле вакансии, по которому считается мера
+    name: str
+        Название меры в результатах
+    """
+
+    kind = "count"
+
+    def create(self) -> int:
+        return 0
+
+    def update(self, state: int, value: Any) -> int:
+        return state + 1
+
+    def merge(self, state: int, other: int) -> int:
+        return state + other
+
+
+class Sum(Measure):
+    """
+    Сумма значений поля.
+
+    Состояние - сумма значений.
+
+    Attributes
+    ----------
+    field: Optional[str]
+        Поле вакансии, по которому считается мера
+    name: str
+        Название меры в результатах
+    """
+
+    kind = "sum"
+
+    def create(self) -> float:
+        return 0
+
+    def update(self, state: float, value: float) -> float:
+        return state + value
+
+    def merge(self, state: float, other: float) -> float:
+        return state + other
+
+
+class Min(Measure):
+    """
+    Минимальное значение поля.
+
+    Состояние - минимальное значение или None, если значений не было.
+
+    Attributes
+    ----------
+    field: Optional[str]
+        Поле вакансии, по которому считается мера
+    name: str
+        Название меры в результатах
+    """
+
+    kind = "min"
+
+    def create(self) -> Any:
+        return None
+
+    def update(self, state: Any, value: Any) -> Any:
+        return value if state is None or value < state else state
+
+    def merge(self, state: Any, other: Any) -> Any:
+        return other if state is None else self.update(state, other)
+
+
+class Max(Measure):
+    """
+    Максимальное значение поля.
+
+    Состояние - максимальное значение или None, если значений не было.
+
+    Attributes
+    ----------
+    field: Optional[str]
+        Поле вакансии, по которому считается мера
+    name: str
+        Название меры в результатах
+    """
+
+    kind = "max"
+
+    def create(self) -> Any:
+        return None
+
+    def update(self, state: Any, value: Any) -> Any:
+        return value if state is None or value > state else state
+
+    def merge(self, state: Any, other: Any) -> Any:
+        return other if state is None else self.update(state, other)
+
+
+class Mean(Measure):
+    """
+    Среднее значение поля (с округлением вниз, как в отчётах).
+
+    Состояние - список из суммы и количества значений,
+    результат - None, если значений не было.
+
+    Attributes
+    ----------
+    field: Optional[str]
+        Поле вакансии, по которому считается мера
+    name: str
+        Название меры в результатах
+    """
+
+    kind = "mean"
+
+    def create(self) -> List[float]:
+        return [0, 0]
+
+    def update(self, state: List[float], value: float) -> List[float]:
+        state[0] += value
+        state[1] += 1
+        return state
+
+    def merge(self, state: List[float], other: List[float]) -> List[float]:
+        state[0] += other[0]
+        state[1] += other[1]
+        return state
+
+    def result(self, state: List[float]) -> Optional[int]:
+        return int(state[0] // state[1]) if state[1] else None
+
+
+class Quantiles(Measure):
+    """
+    Квантили значений поля, оцениваемые скетчем KLL.
+
+    Состояние - скетч KLLSketch, результат - словарь из уровня
+    квантиля в его оценку (None, если значений не было).
+
+    Attributes
+    ----------
+    field: str
+        Поле вакансии, по которому считается мера
+    name: str
+        Название меры в результатах
+    quantiles: Tuple[float, ...]
+        Уровни квантилей
+    k: int
+        Параметр точности скетча
+    """
+
+    kind = "quantiles"
+
+    def __init__(
+        self,
+        field: str,
+        quantiles: Sequence[float] = (0.1, 0.5, 0.9),
+        name: Optional[str] = None,
+        k: int = 200,
+    ) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        field: str
+            Поле вакансии, по которому считается мера
+        quantiles: Sequence[float]
+            Уровни квантилей
+        name: Optional[str]
+            Название меры в результатах
+        k: int
+            Параметр точности скетча
+        """
+
+        super().__init__(field, name)
+        self.quantiles = tuple(quantiles)
+        self.k = k
+
+    def __repr__(self) -> str:
+        return f"Quantiles({self.field!r}, {self.quantiles!r}, {self.name!r}, {self.k})"
+
+    def create(self) -> KLLSketch:
+        return KLLSketch(self.k)
+
+    def update(self, state: KLLSketch, value: float) -> KLLSketch:
+        state.update(value)
+        return state
+
+    def merge(self, state: KLLSketch, other: KLLSketch) -> KLLSketch:
+        return state.merge(other)
+
+    def result(self, state: KLLSketch) -> Dict[float, Optional[float]]:
+        return {q: state.quantile(q) for q in self.quantiles}
+
+
+class Distinct(Measure):
+    """
+    Количество уникальных значений поля, оцениваемое HyperLogLog.
+
+    Состояние - скетч HyperLogLog, результат - оценка количества.
+
+    Attributes
+    ----------
+    field: str
+        Поле вакансии, по которому считается мера
+    name: str
+        Название меры в результатах
+    precision: int
+        Точность скетча
+    """
+
+    kind = "distinct"
+
+    def __init__(
+        self, field: str, name: Optional[str] = None, precision: int = 12
+    ) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        field: str
+            Поле вакансии, по которому считается мера
+        name: Optional[str]
+            Название меры в результатах
+        precision: int
+            Точность скетча
+        """
+
+        super().__init__(field, name)
+        self.precision = precision
+
+    def __repr__(self) -> str:
+        return f"Distinct({self.field!r}, {self.name!r}, {self.precision})"
+
+    def create(self) -> HyperLogLog:
+        return HyperLogLog(self.precision)
+
+    def update(self, state: HyperLogLog, value: Any) -> HyperLogLog:
+        state.add(str(value))
+        return state
+
+    def merge(self, state: HyperLogLog, other: HyperLogLog) -> HyperLogLog:
+        return state.merge(other)
+
+    def result(self, state: HyperLogLog) -> int:
+        return state.count()
+
+
+class TopK(Measure):
+    """
+    Самые частые значения поля, оцениваемые скетчем Space-Saving.
+    Если значение поля - список, то учитывается каждый его элемент.
+
+    Состояние - скетч SpaceSaving, результат - список из n пар
+    значения и оценки его частоты по убыванию частоты.
+
+    Attributes
+    ----------
+    field: str
+        Поле вакансии, по которому считается мера
+    name: str
+        Название меры в результатах
+    n: int
+        Количество значений в результате
+    """
+
+    kind = "top"
+
+    def __init__(self, field: str, n: int = 10, name: Optional[str] = None) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        field: str
+            Поле вакансии, по которому считается мера
+        n: int
+            Количество значений в результате
+        name: Optional[str]
+            Название меры в результатах
+        """
+
+        super().__init__(field, name)
+        self.n = n
+
+    def __repr__(self) -> str:
+        return f"TopK({self.field!r}, {self.n}, {self.name!r})"
+
+    def create(self) -> SpaceSaving:
+        return SpaceSaving(self.n * 50)
+
+    def update(self, state: SpaceSaving, value: Any) -> SpaceSaving:
+        if isinstance(value, list):
+            for item in value:
+                state.add(item)
+        else:
+            state.add(str(value))
+        return state
+
+    def merge(self, state: SpaceSaving, other: SpaceSaving) -> SpaceSaving:
+        return state.merge(other)
+
+    def result(self, state: SpaceSaving) -> List[Tuple[str, int]]:
+        return state.top(self.n)
+
+
+class GroupBy:
+    """
+    Группировка вакансий по набору измерений с набором мер.
+
+    Частичный результат группировки - словарь из ключа группы
+    в список состояний мер; частичные результаты разных файлов
+    и процессов объединяются методом merge.
+
+    Attributes
+    ----------
+    name: str
+        Название группировки
+    dimensions: Tuple[Dimension, ...]
+        Измерения: названия полей вакансии, названия из DIMENSIONS
+        или функции от вакансии (для процессов - функции уровня модуля)
+    measures: Tuple[Measure, ...]
+        Меры, которые считаются для каждой группы
+    max_groups: Optional[int]
+        Количество групп (не байт) в памяти процесса, после которого
+        группы сбрасываются на диск
+    partitions: int
+        Количество разделов, на которые делятся сброшенные группы
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dimensions: Sequence[Dimension],
+        measures: Sequence[Measure],
+        max_groups: Optional[int] = None,
+        partitions: int = 16,
+    ) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        name: str
+            Название группировки
+        dimensions: Sequence[Dimension]
+            Измерения группировки
+        measures: Sequence[Measure]
+            Меры, которые считаются для каждой группы
+        max_groups: Optional[int]
+            Количество групп (а не размер в байтах): когда в памяти процесса
+            накапливается больше групп, они сбрасываются на диск по разделам,
+            а разделы в конце объединяются по одному. Память на группу
+            зависит от мер (скетчи квантилей и навыков намного больше
+            счётчиков), поэтому значение подбирается под набор мер.
+            Нужен для группировок с миллионами ключей (например,
+            по работодателю). Если не указан, то все группы хранятся в памяти
+        partitions: int
+            Количество разделов, на которые делятся сброшенные группы.
+            При объединении в памяти находится примерно 1 / partitions групп
+        """
+
+        self.name = name
+        self.dimensions = tuple(dimensions)
+        self.measures = tuple(measures)
+        self.max_groups = max_groups
+        self.partitions = partitions
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_key_getter", None)
+        state.pop("_value_getters", None)
+        return state
+
+    @property
+    def key(self) -> Hashable:
+        """
+        Ключ, однозначно описывающий группировку (для кэша частичных результатов).
+        """
+
+        return (
+            self.name,
+            tuple(
+                i if isinstance(i, str) else f"{i.__module__}.{i.__qualname__}"
+                for i in self.dimensions
+            ),
+            tuple(measure.key for measure in self.measures),
+            self.max_groups,
+            self.partitions,
+        )
+
+    @property
+    def dimension_names(self) -> List[str]:
+        """
+        Названия измерений.
+        """
+
+        return [i if isinstance(i, str) else i.__name__ for i in self.dimensions]
+
+    def _compile(self) -> None:
+        """
+        Подготавливает функции для получения ключа группы и значений мер.
+        """
+
+        getters = [
+            (DIMENSIONS.get(i) or attrgetter(i)) if isinstance(i, str) else i
+            for i in self.dimensions
+        ]
+        if len(getters) == 1:
+            getter = getters[0]
+            self._key_getter = lambda vacancy: (getter(vacancy),)
+        else:
+            self._key_getter = lambda vacancy: tuple(i(vacancy) for i in getters)
+
+        self._value_getters = [
+            attrgetter(measure.field) if measure.field else None
+            for measure in self.measures
+        ]
+
+    def new_partial(self, spill_dir: Optional[str] = None) -> Partial:
+        """
+        Создаёт пустой частичный результат.
+
+        Parameters
+        ----------
+        spill_dir: Optional[str]
+            Директория для сброса групп на диск, если задан max_groups
+
+        Returns
+        -------
+        Partial
+            Пустой частичный результат
+        """
+
+        if self.max_groups is not None:
+            return SpillingPartial(spill_dir, self.partitions)
+        return {}
+
+    def finish(self, partial: Partial) -> None:
+        """
+        Завершает заполнение частичного результата в процессе.
+        Если часть групп уже на диске, то сбрасывает туда и остальные,
+        чтобы в родительский процесс передавались только пути до файлов.
+
+        Parameters
+        ----------
+        partial: Partial
+            Частичный результат
+        """
+
+        if isinstance(partial, SpillingPartial) and partial.spilled:
+            partial.spill()
+
+    def load(self, partial: Partial) -> None:
+        """
+        Загружает сброшенные на диск группы обратно в память и удаляет
+        их файлы. Нужен перед передачей частичного результата на другую
+        машину, где файлов разделов нет. Все группы частичного результата
+        после этого находятся в памяти, независимо от max_groups.
+
+        Parameters
+        ----------
+        partial: Partial
+            Частичный результат
+        """
+
+        if not isinstance(partial, SpillingPartial) or not partial.spilled:
+            return
+
+        paths = [path for files in partial.files for path in files]
+        for files in partial.files:
+            files.clear()
+        for path in paths:
+            with open(path, "rb") as file:
+                bucket: Partial = pickle.load(file)
+            os.remove(path)
+            for key, other_states in bucket.items():
+                states = partial.get(key)
+                if states is None:
+                    partial[key] = other_states
+                    continue
+                for n, measure in enumerate(self.measures):
+                    states[n] = measure.merge(states[n], other_states[n])
+
+    def update(self, partial: Partial, vacancy: Vacancy) -> None:
+        """
+        Добавляет вакансию в частичный результат.
+
+        Parameters
+        ----------
+        partial: Partial
+            Частичный результат
+        vacancy: Vacancy
+            Вакансия
+        """
+
+        if not hasattr(self, "_key_getter"):
+            self._compile()
+
+        key = self._key_getter(vacancy)
+        states = partial.get(key)
+        if states is None:
+            states = partial[key] = [measure.create() for measure in self.measures]
+
+        for n, (measure, getter) in enumerate(zip(self.measures, self._value_getters)):
+            value = getter(vacancy) if getter else None
+            if getter is None or value is not None:
+                states[n] = measure.update(states[n], value)
+
+        if self.max_groups is not None and len(partial) > self.max_groups:
+            partial.spill()
+
+    def merge(self, partial: Partial, other: Partial) -> Partial:
+        """
+        Добавляет к частичному результату другой частичный результат.
+
+        Parameters
+        ----------
+        partial: Partial
+            Частичный результат, в который добавляются данные
+        other: Partial
+            Добавляемый частичный результат
+
+        Returns
+        -------
+        Partial
+            Объединённый частичный результат
+        """
+
+        if isinstance(other, SpillingPartial):
+            for files, other_files in zip(partial.files, other.files):
+                files.extend(other_files)
+
+        for key, other_states in other.items():
+            states = partial.get(key)
+            if states is None:
+                partial[key] = other_states
+                if isinstance(partial, SpillingPartial) and len(partial) > (
+                    self.max_groups or 0
+                ):
+                    partial.spill()
+                continue
+            for n, measure in enumerate(self.measures):
+                states[n] = measure.merge(states[n], other_states[n])
+        return partial
+
+    def results(
+        self, partial: Partial
+    ) -> Union[Dict[Key, Dict[str, Any]], SpilledResults]:
+        """
+        Возвращает итоговые значения мер для каждой группы.
+
+        Parameters
+        ----------
+        partial: Partial
+            Частичный результат
+
+        Returns
+        -------
+        Union[Dict[Key, Dict[str, Any]], SpilledResults]
+            Значения мер по названиям для каждой группы,
+            группы отсортированы по ключу. Если группы сбрасывались
+            на диск, то результаты выдаются лениво по разделам
+        """
+
+        if isinstance(partial, SpillingPartial) and partial.spilled:
+            return SpilledResults(self, partial)
+
+        return {
+            key: {
+                measure.name: measure.result(state)
+                for measure, state in zip(self.measures, partial[key])
+            }
+            for key in sorted(partial, key=_sort_key)
+        }
+
+
+def _sort_key(key: Key) -> Tuple[Tuple[bool, Any], ...]:
+    """
+    Ключ сортировки групп, в котором None идёт после остальных значений.
+    """
+
+    return tuple((i is None, i if i is not None else 0) for i in key)
+
+
+def merge_partials(
+    group_by: Iterable[GroupBy],
+    partials: Iterable[Dict[str, Partial]],
+    spill_dir: Optional[str] = None,
+) -> Dict[str, Partial]:
+    """
+    Объединяет частичные результаты нескольких группировок.
+
+    Parameters
+    ----------
+    group_by: Iterable[GroupBy]
+        Группировки
+    partials: Iterable[Dict[str, Partial]]
+        Частичные результаты по названиям группировок
+    spill_dir: Optional[str]
+        Директория для сброса групп на диск
+
+    Returns
+    -------
+    Dict[str, Partial]
+        Объединённые частичные результаты по названиям группировок
+    """
+
+    group_by = list(group_by)
+    result = {i.name: i.new_partial(spill_dir) for i in group_by}
+    for partial in partials:
+        for i in group_by:
+            result[i.name] = i.merge(result[i.name], partial.get(i.name, {}))
+    return result
@@ -0,0 +1,139 @@
+from collections import deque
+
+from typing import Deque, Dict, FrozenSet, Iterable, List, Tuple
+
+
+class AhoCorasick:
+    """
+    Автомат Ахо-Корасик для поиска всех подстрок из набора
+    за один проход по строке
+
+    Attributes
+    ----------
+    patterns: Tuple[str, ...]
+        Искомые подстроки
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """
+        Инициализация класса, строит автомат по набору подстрок
+
+        Parameters
+        ----------
+        patterns: Iterable[str]
+            Искомые подстроки
+        """
+
+        self.patterns = tuple(dict.fromkeys(patterns))
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        outputs: List[set] = [set()]
+
+        for pattern in self.patterns:
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(pattern)
+
+        queue: Deque[int] = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(char, 0)
+                self._fail[next_state] = fail
+                outputs[next_state] |= outputs[fail]
+
+        self._outputs: List[FrozenSet[str]] = [frozenset(i) for i in outputs]
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """
+        Находит все подстроки из набора, которые входят в строку
+
+        Parameters
+        ----------
+        text: str
+            Строка для поиска
+
+        Returns
+        -------
+        FrozenSet[str]
+            Найденные подстроки
+        """
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        found: FrozenSet[str] = frozenset()
+        if "" in self.patterns:
+            found = outputs[0]
+
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found = found | outputs[state]
+        return found
+
+
+class ProfessionMatcher:
+    """
+    Сопоставляет названия вакансий с набором профессий.
+    Результат запоминается для каждого названия, так как названия
+    вакансий часто повторяются
+
+    Attributes
+    ----------
+    professions: Tuple[str, ...]
+        Профессии, которые ищутся в названиях вакансий
+    """
+
+    def __init__(self, professions: Iterable[str]) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        professions: Iterable[str]
+            Профессии, которые ищутся в названиях вакансий
+        """
+
+        self._automaton = AhoCorasick(professions)
+        self.professions = self._automaton.patterns
+        self._cache: Dict[str, Tuple[str, ...]] = {}
+
+    def match(self, name: str) -> Tuple[str, ...]:
+        """
+        Возвращает профессии, которые входят в название вакансии
+
+        Parameters
+        ----------
+        name: str
+            Название вакансии
+
+        Returns
+        -------
+        Tuple[str, ...]
+            Найденные профессии в порядке их перечисления
+        """
+
+        result = self._cache.get(name)
+        if result is None:
+            found = self._automaton.find(name)
+            result = tuple(i for i in self.professions if i in found)
+            self._cache[name] = result
+        return result
@@ -0,0 +1,346 @@
+import concurrent.futures
+import os
+import sys
+from abc import ABCMeta, abstractmethod
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+from .distributed import Address, Coordinator
+from .errors import VasyaException
+
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+
+class InlineExecutor(Executor):
+    """
+    Исполнитель, который выполняет задачу сразу в текущем потоке
+    при её отправке. Нужен, чтобы последовательная обработка шла
+    тем же кодом, что и параллельная.
+    """
+
+    def submit(self, fn: Callable[..., Any], /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as ex:
+            future.set_exception(ex)
+        else:
+            future.set_result(result)
+        return future
+
+
+class Backend(metaclass=ABCMeta):
+    """
+    Базовый класс способа выполнения задач обработки файлов.
+
+    Attributes
+    ----------
+    name: str
+        Название способа
+    remote: bool
+        Могут ли исполнители работать на других машинах. Тогда у них нет
+        доступа к временным файлам координатора (например, к группам,
+        сброшенным на диск), и в результатах задач не должно быть путей к ним
+    workers: Optional[int]
+        Количество исполнителей (по умолчанию - количество процессоров)
+    """
+
+    name = ""
+    remote = False
+
+    def __init__(self, workers: Optional[int] = None) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        workers: Optional[int]
+            Количество исполнителей (по умолчанию - количество процессоров)
+        """
+
+        self.workers = workers
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(workers={self.workers!r})"
+
+    @classmethod
+    def available(cls) -> bool:
+        """
+        Поддерживается ли способ текущей версией Python.
+
+        Returns
+        -------
+        bool
+            Поддерживается ли способ
+        """
+
+        return True
+
+    @abstractmethod
+    def executor(self) -> Executor:
+        """
+        Создаёт исполнителя задач.
+
+        Returns
+        -------
+        Executor
+            Исполнитель задач
+        """
+        ...
+
+
+class InlineBackend(Backend):
+    """
+    Последовательное выполнение в текущем потоке.
+    """
+
+    name = "inline"
+
+    def executor(self) -> Executor:
+        return InlineExecutor()
+
+
+class ThreadBackend(Backend):
+    """
+    Пул потоков. Под GIL ускоряет только ожидание ввода-вывода.
+    """
+
+    name = "thread"
+
+    def executor(self) -> Executor:
+        return ThreadPoolExecutor(self.workers)
+
+
+class ProcessBackend(Backend):
+    """
+    Пул процессов. Задачи и результаты передаются через pickle.
+    """
+
+    name = "process"
+
+    def executor(self) -> Executor:
+        return ProcessPoolExecutor(self.workers)
+
+
+class InterpreterBackend(Backend):
+    """
+    Пул субинтерпретаторов со своим GIL у каждого (Python 3.14+).
+    """
+
+    name = "interpreter"
+
+    @classmethod
+    def available(cls) -> bool:
+        return hasattr(concurrent.futures, "InterpreterPoolExecutor")
+
+    def executor(self) -> Executor:
+        return concurrent.futures.InterpreterPoolExecutor(self.workers)
+
+
+class FreeThreadedBackend(ThreadBackend):
+    """
+    Пул потоков в сборке Python без GIL, где потоки
+    выполняют код на Python параллельно.
+    """
+
+    name = "free-threaded"
+
+    @classmethod
+    def available(cls) -> bool:
+        is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+        return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class SharedExecutor(Executor):
+    """
+    Обёртка над исполнителем, которая не закрывает его при выходе
+    из контекста. Задачи отправляются в общий исполнитель.
+    """
+
+    def __init__(self, executor: Executor) -> None:
+        self._executor = executor
+
+    def submit(self, fn: Callable[..., Any], /, *args, **kwargs) -> Future:
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        pass
+
+
+class SharedBackend(Backend):
+    """
+    Выполнение в заранее созданном исполнителе, который не закрывается
+    после отчёта. Нужен долгоживущим процессам (например, демону),
+    чтобы пул процессов не создавался на каждый отчёт.
+    """
+
+    name = "shared"
+
+    def __init__(self, executor: Executor, workers: Optional[int] = None) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        executor: Executor
+            Общий исполнитель
+        workers: Optional[int]
+            Количество исполнителей в нём
+        """
+
+        super().__init__(workers)
+        self._executor: Optional[Executor] = executor
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Коннектор отчёта передаётся в процессы вместе со способом выполнения,
+        # а сам пул в них не нужен и не сериализуется
+        return {**self.__dict__, "_executor": None}
+
+    def executor(self) -> Executor:
+        if self._executor is None:
+            raise VasyaException("Общий исполнитель недоступен в этом процессе")
+        return SharedExecutor(self._executor)
+
+
+class DistributedBackend(Backend):
+    """
+    Раздача задач исполнителям по TCP, в том числе на других машинах
+    с общим хранилищем файлов. Исполнители подключаются к координатору
+    командой python -m vasya.worker host:port с ключом
+    в переменной окружения VASYA_AUTHKEY.
+
+    Attributes
+    ----------
+    address: Address
+        Адрес, на котором координатор ждёт исполнителей
+    authkey: bytes
+        Ключ для проверки подключений
+    max_attempts: int
+        Сколько раз задача отправляется исполнителям, если они отключаются
+    """
+
+    name = "distributed"
+    remote = True
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        address: Address = ("localhost", 0),
+        authkey: Optional[bytes] = None,
+        max_attempts: int = 3,
+    ) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        workers: Optional[int]
+            Количество исполнителей, запускаемых на этой машине
+            (по умолчанию - количество процессоров)
+        address: Address
+            Адрес, на котором координатор ждёт исполнителей.
+            Если порт 0, то выбирается свободный порт
+        authkey: Optional[bytes]
+            Ключ для проверки подключений. Если не указан, то берётся
+            из переменной окружения VASYA_AUTHKEY, а без неё создаётся
+            случайный и подключиться могут только локальные исполнители
+        max_attempts: int
+            Сколько раз задача отправляется исполнителям, если они отключаются
+        """
+
+        super().__init__(workers)
+        self.address = address
+        if authkey is None:
+            env_authkey = os.environ.get("VASYA_AUTHKEY")
+            authkey = env_authkey.encode() if env_authkey else os.urandom(32)
+        self.authkey = authkey
+        self.max_attempts = max_attempts
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(workers={self.workers!r}, "
+            f"address={self.address!r})"
+        )
+
+    def executor(self) -> Executor:
+        return Coordinator(
+            self.address,
+            self.authkey,
+            (os.cpu_count() or 1) if self.workers is None else self.workers,
+            self.max_attempts,
+        )
+
+
+BACKENDS: Dict[str, Type[Backend]] = {
+    backend.name: backend
+    for backend in (
+        InlineBackend,
+        ThreadBackend,
+        ProcessBackend,
+        InterpreterBackend,
+        FreeThreadedBackend,
+        DistributedBackend,
+    )
+}
+"""Способы выполнения по названиям"""
+
+
+def available_backends() -> List[str]:
+    """
+    Возвращает названия способов выполнения, доступных в текущей версии Python.
+
+    Returns
+    -------
+    List[str]
+        Названия способов
+    """
+
+    return [name for name, backend in BACKENDS.items() if backend.available()]
+
+
+def get_backend(
+    backend: Union[str, Backend] = "auto", workers: Optional[int] = None
+) -> Backend:
+    """
+    Возвращает способ выполнения по названию.
+    Для auto выбираются потоки в сборке без GIL, иначе процессы.
+
+    Parameters
+    ----------
+    backend: Union[str, Backend]
+        Название способа или сам способ
+    workers: Optional[int]
+        Количество исполнителей
+
+    Raises
+    ------
+    VasyaException
+        Неизвестный способ или способ не поддерживается текущей версией Python
+
+    Returns
+    -------
+    Backend
+        Способ выполнения
+    """
+
+    if isinstance(backend, Backend):
+        return backend
+
+    if backend == "auto":
+        backend = "free-threaded" if FreeThreadedBackend.available() else "process"
+
+    backend_class = BACKENDS.get(backend)
+    if backend_class is None:
+        raise VasyaException(
+            f"Неизвестный способ обработки: {backend}. "
+            f"Доступные: {', '.join(available_backends())}"
+        )
+    if not backend_class.available():
+        raise VasyaException(
+            f"Способ обработки {backend} не поддерживается этой версией Python"
+        )
+    return backend_class(workers)
@@ -0,0 +1,341 @@
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+CACHE_VERSION = 2
+"""Версия формата кэша, при изменении старые записи игнорируются"""
+
+
+def file_digest(file_name: Path, size: Optional[int] = None) -> str:
+    """
+    Считает хэш содержимого файла
+
+    Parameters
+    ----------
+    file_name: Path
+        Путь до файла
+    size: Optional[int]
+        Количество байт с начала файла, которые нужно учесть.
+        По умолчанию учитывается весь файл
+
+    Returns
+    -------
+    str
+        Хэш в шестнадцатеричном виде
+    """
+
+    digest = hashlib.blake2b(digest_size=20)
+    remaining = size
+    with open(file_name, "rb") as file:
+        while remaining is None or remaining > 0:
+            chunk_size = 1 << 20 if remaining is None else min(1 << 20, remaining)
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+class FileStatsCache:
+    """
+    Кэш частичной статистики по файлам.
+
+    Каждая запись хранится в отдельном pickle-файле и привязана к пути,
+    размеру, времени изменения и хэшу содержимого файла, а также
+    к ключу параметров обработки (например, профессии).
+    Запись может описывать только начало файла: тогда по ней можно
+    продолжить обработку дописанного в конец файла хвоста.
+
+    Attributes
+    ----------
+    cache_dir: Path
+        Путь до директории с кэшем
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        cache_dir: str
+            Путь до директории с кэшем
+        """
+
+        self.cache_dir = Path(cache_dir)
+
+    def _entry_path(self, file_name: Path, key: Hashable) -> Path:
+        """
+        Возвращает путь до записи кэша
+
+        Parameters
+        ----------
+        file_name: Path
+            Путь до обрабатываемого файла
+        key: Hashable
+            Ключ параметров обработки
+
+        Returns
+        -------
+        Path
+            Путь до записи кэша
+        """
+
+        name = repr((str(Path(file_name).resolve()), key)).encode("utf-8")
+        return self.cache_dir / f"{hashlib.sha1(name).hexdigest()}.pickle"
+
+    def _load(self, entry_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Загружает запись кэша
+
+        Parameters
+        ----------
+        entry_path: Path
+            Путь до записи кэша
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Запись кэша или None, если её нет или она повреждена
+        """
+
+        try:
+            with open(entry_path, "rb") as file:
+                entry = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != CACHE_VERSION:
+            return None
+        return entry
+
+    def _save(self, entry_path: Path, entry: Dict[str, Any]) -> None:
+        """
+        Атомарно сохраняет запись кэша
+
+        Parameters
+        ----------
+        entry_path: Path
+            Путь до записи кэша
+        entry: Dict[str, Any]
+            Запись кэша
+        """
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as file:
+            pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, entry_path)
+
+    def get(self, file_name: Path, key: Hashable) -> Optional[Any]:
+        """
+        Возвращает сохранённый результат обработки файла,
+        если файл не изменился с момента сохранения
+
+        Parameters
+        ----------
+        file_name: Path
+            Путь до обрабатываемого файла
+        key: Hashable
+            Ключ параметров обработки
+
+        Returns
+        -------
+        Optional[Any]
+            Сохранённый результат или None
+        """
+
+        checkpoint = self.get_checkpoint(file_name, key)
+        if checkpoint is None or checkpoint[0] != os.stat(file_name).st_size:
+            return None
+        return checkpoint[1]
+
+    def get_checkpoint(
+        self, file_name: Path, key: Hashable
+    ) -> Optional[Tuple[int, Any]]:
+        """
+        Возвращает сохранённый результат обработки начала файла
+        и позицию, до которой файл был обработан.
+        Результат возвращается, только если начало файла
+        не изменилось с момента сохранения (файл мог лишь дописываться)
+
+        Parameters
+        ----------
+        file_name: Path
+            Путь до обрабатываемого файла
+        key: Hashable
+            Ключ параметров обработки
+
+        Returns
+        -------
+        Optional[Tuple[int, Any]]
+            Позиция в байтах и сохранённый результат или None
+        """
+
+        entry_path = self._entry_path(file_name, key)
+        entry = self._load(entry_path)
+        if entry is None or entry["key"] != key:
+            return None
+
+        stat = os.stat(file_name)
+        if stat.st_size < entry["size"]:
+            return None
+        if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime_ns"]:
+            if file_digest(file_name, entry["size"]) != entry["digest"]:
+                return None
+            if stat.st_size == entry["size"]:
+                entry["mtime_ns"] = stat.st_mtime_ns
+                self._save(entry_path, entry)
+
+        return entry["size"], entry["result"]
+
+    def put(
+        self,
+        file_name: Path,
+        key: Hashable,
+        result: Any,
+        size: Optional[int] = None,
+    ) -> None:
+        """
+        Сохраняет результат обработки файла
+
+        Parameters
+        ----------
+        file_name: Path
+            Путь до обрабатываемого файла
+        key: Hashable
+            Ключ параметров обработки
+        result: Any
+            Результат обработки
+        size: Optional[int]
+            Позиция в байтах, до которой файл был обработан.
+            По умолчанию считается, что файл обработан целиком
+        """
+
+        stat = os.stat(file_name)
+        if size is None:
+            size = stat.st_size
+        entry = {
+            "version": CACHE_VERSION,
+            "path": str(file_name),
+            "key": key,
+            "size": size,
+            "mtime_ns": stat.st_mtime_ns,
+            "digest": file_digest(file_name, size),
+            "result": result,
+        }
+        self._save(self._entry_path(file_name, key), entry)
+
+
+class ArtifactCache:
+    """
+    Кэш готовых файлов отчёта (xlsx, png, pdf) по ключу содержимого.
+
+    Ключ - хэш итоговой статистики, шаблона и настроек отрисовки,
+    поэтому одинаковые отчёты не отрисовываются заново. Файл каждой
+    записи лежит в директории кэша под именем <ключ>.<тип>. При превышении
+    размера удаляются записи, которые дольше всего не использовались
+    (время использования - время изменения файла).
+
+    Attributes
+    ----------
+    cache_dir: Path
+        Путь до директории с кэшем
+    max_size: int
+        Максимальный суммарный размер файлов в байтах
+    """
+
+    def __init__(self, cache_dir: str, max_size: int = 256 << 20) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        cache_dir: str
+            Путь до директории с кэшем
+        max_size: int
+            Максимальный суммарный размер файлов в байтах
+        """
+
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+
+    def get(self, key: str, artifact: str) -> Optional[bytes]:
+        """
+        Возвращает сохранённый файл отчёта и отмечает его использование.
+
+        Parameters
+        ----------
+        key: str
+            Ключ содержимого отчёта
+        artifact: str
+            Тип файла: xlsx, png, pdf
+
+        Returns
+        -------
+        Optional[bytes]
+            Содержимое файла или None, если его нет в кэше
+        """
+
+        entry_path = self.cache_dir / f"{key}.{artifact}"
+        try:
+            with open(entry_path, "rb") as file:
+                content = file.read()
+            os.utime(entry_path)
+        except OSError:
+            return None
+        return content
+
+    def put(self, key: str, artifact: str, content: bytes) -> None:
+        """
+        Атомарно сохраняет файл отчёта и удаляет старые записи,
+        если кэш превысил максимальный размер.
+
+        Parameters
+        ----------
+        key: str
+            Ключ содержимого отчёта
+        artifact: str
+            Тип файла: xlsx, png, pdf
+        content: bytes
+            Содержимое файла
+        """
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry_path = self.cache_dir / f"{key}.{artifact}"
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as file:
+            file.write(content)
+        os.replace(tmp_path, entry_path)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Удаляет записи, которые дольше всего не использовались,
+        пока суммарный размер кэша больше максимального.
+        """
+
+        entries = []
+        for entry_path in self.cache_dir.iterdir():
+            if entry_path.suffix == ".tmp":
+                continue
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                entry_path.unlink()
+            except OSError:
+                continue
+            total -= size
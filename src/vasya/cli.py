@@ -0,0 +1,102 @@
+import argparse
+import base64
+import json
+
+from .client import add_stats_arguments, add_table_arguments
+from .errors import VasyaException
+
+from typing import Any, Optional, Sequence
+
+
+def to_json(value: Any) -> Any:
+    """
+    Преобразует значения, которые не сериализуются в JSON:
+    содержимое файлов отчёта - в base64, остальное - в строку.
+
+    Parameters
+    ----------
+    value: Any
+        Значение
+
+    Returns
+    -------
+    Any
+        Значение для JSON
+    """
+
+    if isinstance(value, bytes):
+        return base64.b64encode(value).decode("ascii")
+    return str(value)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Выполняет запрос или файл заданий без диалога и выводит ответ
+    в формате JSON: python -m vasya stats | table | jobs.
+    Код возврата 1, если хотя бы одно задание не выполнено.
+
+    Parameters
+    ----------
+    argv: Optional[Sequence[str]]
+        Аргументы командной строки (по умолчанию - sys.argv)
+    """
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--backend", default="process", help="способ обработки")
+    common.add_argument("--workers", type=int, help="количество процессов")
+    common.add_argument("--cache-dir", help="директория с кэшем статистики")
+    common.add_argument("--template", help="шаблон pdf по умолчанию")
+    common.add_argument("--artifact-cache", help="директория с кэшем файлов отчёта")
+    common.add_argument(
+        "--artifact-cache-size",
+        type=int,
+        default=256,
+        help="размер кэша файлов отчёта в МБ",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="vasya", description="Статистика и таблицы вакансий без диалога"
+    )
+    commands = parser.add_subparsers(dest="type", required=True)
+    add_stats_arguments(
+        commands.add_parser("stats", parents=[common], help="статистика по вакансиям")
+    )
+    add_table_arguments(
+        commands.add_parser("table", parents=[common], help="таблица вакансий")
+    )
+    jobs_parser = commands.add_parser(
+        "jobs", parents=[common], help="задания из файла JSON или TOML"
+    )
+    jobs_parser.add_argument("file", help="файл заданий")
+
+    args = vars(parser.parse_args(argv))
+    runner_options = {
+        "backend": args.pop("backend"),
+        "workers": args.pop("workers"),
+        "cache_dir": args.pop("cache_dir"),
+        "template_path": args.pop("template"),
+        "artifact_cache_dir": args.pop("artifact_cache"),
+        "artifact_cache_size": args.pop("artifact_cache_size") << 20,
+    }
+
+    from .jobs import JobRunner, load_jobs
+
+    try:
+        if args["type"] == "jobs":
+            jobs = load_jobs(args["file"])
+        else:
+            jobs = [{key: value for key, value in args.items() if value is not None}]
+        with JobRunner(**runner_options) as runner:
+            answers = runner.run_all(jobs)
+    except VasyaException as ex:
+        parser.exit(1, f"{ex}\n")
+
+    if args["type"] == "jobs":
+        output: Any = answers
+    elif answers[0]["ok"]:
+        output = answers[0]["result"]
+    else:
+        parser.exit(1, f"{answers[0]['error']}\n")
+    print(json.dumps(output, ensure_ascii=False, indent=2, default=to_json))
+    if not all(answer["ok"] for answer in answers):
+        parser.exit(1)
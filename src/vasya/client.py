@@ -0,0 +1,160 @@
+import argparse
+import json
+import os
+import socket
+
+from .errors import VasyaException
+
+from typing import Any, Dict, Optional
+
+
+def request(
+    message: Dict[str, Any],
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    socket_path: Optional[str] = None,
+    timeout: Optional[float] = None,
+    authkey: Optional[str] = None,
+) -> Any:
+    """
+    Отправляет запрос серверу статистики и возвращает результат.
+
+    Parameters
+    ----------
+    message: Dict[str, Any]
+        Запрос
+    host: str
+        Адрес сервера
+    port: int
+        Порт сервера
+    socket_path: Optional[str]
+        Путь до Unix-сокета сервера. Если указан, то используется вместо порта
+    timeout: Optional[float]
+        Сколько секунд ждать ответа
+    authkey: Optional[str]
+        Ключ сервера, если он задан
+
+    Raises
+    ------
+    VasyaException
+        Сервер недоступен или вернул ошибку
+
+    Returns
+    -------
+    Any
+        Результат запроса
+    """
+
+    if authkey:
+        message = {**message, "authkey": authkey}
+
+    try:
+        if socket_path:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(timeout)
+            connection.connect(socket_path)
+        else:
+            connection = socket.create_connection((host, port), timeout)
+        with connection, connection.makefile("rwb") as file:
+            file.write(json.dumps(message, ensure_ascii=False).encode() + b"\n")
+            file.flush()
+            line = file.readline()
+    except OSError as ex:
+        raise VasyaException(f"Сервер статистики недоступен: {ex}")
+
+    if not line:
+        raise VasyaException("Сервер статистики закрыл подключение")
+    response = json.loads(line)
+    if not response["ok"]:
+        raise VasyaException(response["error"])
+    return response["result"]
+
+
+def add_stats_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Добавляет аргументы запроса статистики.
+
+    Parameters
+    ----------
+    parser: argparse.ArgumentParser
+        Парсер команды
+    """
+
+    parser.add_argument("path", help="директория с csv файлами или csv файл")
+    parser.add_argument("professions", nargs="+", help="профессии")
+    parser.add_argument("--granularity", choices=("year", "month", "week"))
+    parser.add_argument("--quantiles", type=float, nargs="+")
+    parser.add_argument("--distinct-precision", type=int)
+    parser.add_argument("--top-skills", type=int)
+    parser.add_argument("--sample", type=float)
+    parser.add_argument(
+        "--rates",
+        action="store_const",
+        const=True,
+        help="переводить зарплаты по курсам ЦБ месяца публикации",
+    )
+    parser.add_argument(
+        "--cube",
+        action="store_const",
+        const=True,
+        help="считать по сохранённому кубу (любая профессия без чтения файлов)",
+    )
+    parser.add_argument("--output-dir", help="директория для файлов отчёта")
+    parser.add_argument("--artifacts", nargs="+", choices=("xlsx", "png", "pdf"))
+    parser.add_argument("--template-path", help="шаблон pdf")
+
+
+def add_table_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Добавляет аргументы запроса таблицы.
+
+    Parameters
+    ----------
+    parser: argparse.ArgumentParser
+        Парсер команды
+    """
+
+    parser.add_argument("path", help="csv файл")
+    parser.add_argument("--filter-by", help='параметр фильтрации, "Ключ: значение"')
+    parser.add_argument("--sort-by", help="параметр сортировки")
+    parser.add_argument("--reverse-sort", help="обратный порядок (Да / Нет)")
+    parser.add_argument("--limit", help='диапазон вывода, например "1 20"')
+    parser.add_argument("--needed-columns", help="требуемые столбцы через запятую")
+
+
+def main() -> None:
+    """
+    Отправляет запрос серверу статистики из командной строки
+    и выводит ответ в формате JSON: python -m vasya.client.
+    Ключ сервера берётся из переменной окружения VASYA_AUTHKEY.
+    """
+
+    parser = argparse.ArgumentParser(description="Клиент сервера статистики")
+    parser.add_argument("--host", default="127.0.0.1", help="адрес сервера")
+    parser.add_argument("--port", type=int, default=8765, help="порт сервера")
+    parser.add_argument("--socket", help="путь до Unix-сокета сервера")
+    commands = parser.add_subparsers(dest="type", required=True)
+
+    commands.add_parser("ping", help="проверить сервер")
+
+    add_stats_arguments(commands.add_parser("stats", help="статистика по вакансиям"))
+    add_table_arguments(commands.add_parser("table", help="таблица вакансий"))
+
+    args = vars(parser.parse_args())
+    connection = {
+        "host": args.pop("host"),
+        "port": args.pop("port"),
+        "socket_path": args.pop("socket"),
+        "authkey": os.environ.get("VASYA_AUTHKEY"),
+    }
+    message = {key: value for key, value in args.items() if value is not None}
+
+    try:
+        result = request(message, **connection)
+    except VasyaException as ex:
+        parser.exit(1, f"{ex}\n")
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
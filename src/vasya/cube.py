@@ -0,0 +1,142 @@
+from .vacancy import Vacancy
+
+from typing import Dict, Iterable, List, Sequence
+
+Cell = List[float]
+"""Сумма зарплат и количество вакансий"""
+
+
+def add_cells(cells: Dict, other: Dict) -> None:
+    """
+    Добавляет ячейки к другим. Ячейки с новыми ключами копируются.
+
+    Parameters
+    ----------
+    cells: Dict
+        Ячейки, к которым добавляются другие
+    other: Dict
+        Добавляемые ячейки
+    """
+
+    for key, (salary, count) in other.items():
+        cell = cells.get(key)
+        if cell is None:
+            cells[key] = [salary, count]
+        else:
+            cell[0] += salary
+            cell[1] += count
+
+
+class SalaryCube:
+    """
+    Суммы зарплат и количество вакансий по годам и названиям вакансий,
+    а также итоги по годам и по городам.
+
+    Профессия - подстрока названия, а названия часто повторяются,
+    поэтому статистика по любой профессии складывается из ячеек
+    подходящих названий без повторного чтения вакансий.
+    Доли городов в отчёте не зависят от профессии, поэтому город
+    хранится отдельным итогом, а не ещё одним измерением ячеек.
+    Итоги по годам и городам считаются в порядке вакансий,
+    как в InputConnectReport, поэтому совпадают с ним.
+
+    Attributes
+    ----------
+    years: Dict[int, Cell]
+        Итоги по годам
+    cities: Dict[str, Cell]
+        Итоги по городам
+    names: Dict[str, Dict[int, Cell]]
+        Ячейки по названиям вакансий и годам
+    """
+
+    def __init__(self) -> None:
+        """
+        Инициализация класса
+        """
+
+        self.years: Dict[int, Cell] = {}
+        self.cities: Dict[str, Cell] = {}
+        self.names: Dict[str, Dict[int, Cell]] = {}
+
+    def add(self, vacancies: Iterable[Vacancy]) -> "SalaryCube":
+        """
+        Добавляет вакансии в куб.
+
+        Parameters
+        ----------
+        vacancies: Iterable[Vacancy]
+            Вакансии
+
+        Returns
+        -------
+        SalaryCube
+            Этот же куб
+        """
+
+        years = self.years
+        cities = self.cities
+        names = self.names
+        for vacancy in vacancies:
+            year = int(vacancy.published_at_raw[:4])
+            salary = vacancy.salary_rub
+            for cells, key in (
+                (years, year),
+                (cities, vacancy.area_name),
+                (names.get(vacancy.name) or names.setdefault(vacancy.name, {}), year),
+            ):
+                cell = cells.get(key)
+                if cell is None:
+                    cells[key] = [salary, 1]
+                else:
+                    cell[0] += salary
+                    cell[1] += 1
+        return self
+
+    def merge(self, other: "SalaryCube") -> "SalaryCube":
+        """
+        Добавляет к кубу другой куб.
+
+        Parameters
+        ----------
+        other: SalaryCube
+            Добавляемый куб
+
+        Returns
+        -------
+        SalaryCube
+            Этот же куб
+        """
+
+        add_cells(self.years, other.years)
+        add_cells(self.cities, other.cities)
+        for name, cells in other.names.items():
+            add_cells(self.names.setdefault(name, {}), cells)
+        return self
+
+    def professions(self, professions: Sequence[str]) -> Dict[str, Dict[int, Cell]]:
+        """
+        Возвращает итоги по годам для профессий. Просматриваются только
+        уникальные названия вакансий, поэтому профессии ищутся простым
+        поиском подстроки, без автомата ProfessionMatcher.
+
+        Parameters
+        ----------
+        professions: Sequence[str]
+            Профессии, которые ищутся в названиях вакансий
+
+        Returns
+        -------
+        Dict[str, Dict[int, Cell]]
+            Итоги по всем годам куба для каждой профессии
+        """
+
+        result = {
+            profession: {year: [0, 0] for year in self.years}
+            for profession in professions
+        }
+        for name, cells in self.names.items():
+            for profession in professions:
+                if profession in name:
+                    add_cells(result[profession], cells)
+        return result
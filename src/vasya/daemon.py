@@ -0,0 +1,622 @@
+import argparse
+import asyncio
+import base64
+import hmac
+import ipaddress
+import json
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from .backends import SharedBackend
+from .cache import ArtifactCache
+from .dataset import DataSet
+from .errors import VasyaException
+from .input_connect import InputConnectReport
+from .jobs import (
+    create_report,
+    create_table,
+    file_signature,
+    render,
+    report_key,
+)
+from .vacancy import Vacancy
+
+from typing import Any, Dict, Hashable, List, Optional, Union
+
+
+class StatsDaemon:
+    """
+    Долгоживущий сервер статистики. Принимает запросы в формате JSON
+    (по одному на строку) и отвечает тоже строкой JSON.
+
+    Между запросами сервер держит готовыми пул процессов, прочитанные
+    файлы для таблиц и посчитанные отчёты, поэтому повторный запрос
+    не читает данные заново. Записи сбрасываются, если файл изменился.
+    С "cube" отчёт по новой профессии считается по сохранённому кубу
+    (см. InputConnectReportCube).
+
+    Запросы:
+    {"type": "ping"},
+    {"type": "stats", "path": ..., "professions": [...], ...параметры отчёта,
+    "cube": true, "output_dir": ..., "artifacts": ["xlsx", "png", "pdf"]},
+    {"type": "table", "path": ..., "filter_by": "Ключ: значение", ...}
+    Если у сервера есть ключ, то он передаётся в каждом запросе: "authkey": ...
+
+    На ошибку любого запроса сервер отвечает
+    {"ok": false, "error": текст, "error_type": класс исключения}.
+
+    Attributes
+    ----------
+    workers: Optional[int]
+        Количество процессов в пуле
+    cache_dir: Optional[str]
+        Директория с кэшем частичной статистики по файлам
+    template_path: Optional[str]
+        Путь к шаблону pdf по умолчанию
+    max_reports: int
+        Сколько отчётов держать в памяти
+    max_datasets: int
+        Сколько прочитанных файлов держать в памяти
+    artifact_cache: Optional[ArtifactCache]
+        Кэш готовых файлов отчёта
+    root: Optional[Path]
+        Директория, вне которой запросы не могут читать и создавать файлы
+    authkey: Optional[str]
+        Ключ, который должен быть в каждом запросе
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        template_path: Optional[str] = None,
+        max_reports: int = 32,
+        max_datasets: int = 8,
+        artifact_cache_dir: Optional[str] = None,
+        artifact_cache_size: int = 256 << 20,
+        root: Optional[str] = None,
+        authkey: Optional[str] = None,
+    ) -> None:
+        """
+        Инициализация класса. Процессы пула запускаются сразу.
+
+        Parameters
+        ----------
+        workers: Optional[int]
+            Количество процессов в пуле (по умолчанию - количество процессоров)
+        cache_dir: Optional[str]
+            Директория с кэшем частичной статистики по файлам
+        template_path: Optional[str]
+            Путь к шаблону pdf по умолчанию
+        max_reports: int
+            Сколько отчётов держать в памяти
+        max_datasets: int
+            Сколько прочитанных файлов держать в памяти
+        artifact_cache_dir: Optional[str]
+            Директория с кэшем готовых файлов отчёта
+        artifact_cache_size: int
+            Максимальный размер кэша файлов отчёта в байтах
+        root: Optional[str]
+            Директория, вне которой запросы не могут читать и создавать файлы
+            (path, output_dir, template_path, rates). Если не указана,
+            то пути не ограничиваются
+        authkey: Optional[str]
+            Ключ, который должен быть в каждом запросе. Без ключа сервер
+            принимает подключения только через Unix-сокет или loopback
+        """
+
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_dir = cache_dir
+        self.template_path = template_path
+        self.max_reports = max_reports
+        self.max_datasets = max_datasets
+        self.artifact_cache = (
+            ArtifactCache(artifact_cache_dir, artifact_cache_size)
+            if artifact_cache_dir
+            else None
+        )
+
+        self.root = Path(root).resolve() if root is not None else None
+        self.authkey = authkey
+
+        self._start_pool()
+        self._threads = ThreadPoolExecutor(4)
+        self._renderer = ThreadPoolExecutor(1)
+
+        self._reports: "OrderedDict[Hashable, InputConnectReport]" = OrderedDict()
+        self._datasets: "OrderedDict[Hashable, List[Vacancy]]" = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    def _start_pool(self) -> None:
+        """
+        Запускает процессы пула и создаёт способ обработки на нём.
+        """
+
+        self._pool = ProcessPoolExecutor(self.workers)
+        for future in [self._pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+        self._backend = SharedBackend(self._pool, self.workers)
+
+    def _restart_pool(self) -> None:
+        """
+        Заменяет сломанный пул процессов (например, после падения
+        процесса по памяти) новым, чтобы следующие запросы выполнялись.
+        """
+
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._start_pool()
+
+    def check_path(self, path: str) -> str:
+        """
+        Проверяет, что путь из запроса находится внутри root.
+
+        Parameters
+        ----------
+        path: str
+            Путь из запроса
+
+        Raises
+        ------
+        VasyaException
+            Путь вне root
+
+        Returns
+        -------
+        str
+            Тот же путь
+        """
+
+        if self.root is not None and not Path(path).resolve().is_relative_to(self.root):
+            raise VasyaException(f"Путь вне корневой директории сервера: {path}")
+        return path
+
+    def close(self) -> None:
+        """
+        Останавливает пул процессов и потоки.
+        """
+
+        self._threads.shutdown()
+        self._renderer.shutdown()
+        self._pool.shutdown()
+
+    @staticmethod
+    def _remember(cache: OrderedDict, key: Hashable, value: Any, size: int) -> None:
+        """
+        Сохраняет значение и удаляет самые давно использованные записи.
+
+        Parameters
+        ----------
+        cache: OrderedDict
+            Записи от давно использованных к недавним
+        key: Hashable
+            Ключ
+        value: Any
+            Значение
+        size: int
+            Сколько записей хранить
+        """
+
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > size:
+            cache.popitem(last=False)
+
+    async def _cached(self, cache: OrderedDict, key: Hashable, size: int, func) -> Any:
+        """
+        Возвращает значение из памяти или считает его в потоке.
+        Одинаковые запросы, пришедшие одновременно, считаются один раз.
+
+        Parameters
+        ----------
+        cache: OrderedDict
+            Записи от давно использованных к недавним
+        key: Hashable
+            Ключ
+        size: int
+            Сколько записей хранить
+        func: Callable[[], Any]
+            Функция, которая считает значение
+
+        Returns
+        -------
+        Any
+            Значение
+        """
+
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        loop = asyncio.get_running_loop()
+        pending = self._pending[key] = loop.run_in_executor(self._threads, func)
+        try:
+            value = await pending
+        finally:
+            del self._pending[key]
+        self._remember(cache, key, value, size)
+        return value
+
+    async def get_report(self, request: Dict[str, Any]) -> InputConnectReport:
+        """
+        Возвращает посчитанный отчёт по запросу.
+
+        Parameters
+        ----------
+        request: Dict[str, Any]
+            Запрос статистики
+
+        Raises
+        ------
+        VasyaException
+            Неверный запрос или файлы не найдены
+
+        Returns
+        -------
+        InputConnectReport
+            Отчёт
+        """
+
+        if "path" in request:
+            self.check_path(request["path"])
+        if isinstance(request.get("rates"), str):
+            self.check_path(request["rates"])
+        report = create_report(request, self._backend, self.cache_dir)
+        key = ("stats", tuple(report.professions), *report_key(request, report))
+
+        def prepare() -> InputConnectReport:
+            report.prepare_data()
+            return report
+
+        return await self._cached(self._reports, key, self.max_reports, prepare)
+
+    async def get_vacancies(self, file_name: str) -> List[Vacancy]:
+        """
+        Возвращает прочитанные вакансии из файла.
+
+        Parameters
+        ----------
+        file_name: str
+            Путь до файла
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет данных
+
+        Returns
+        -------
+        List[Vacancy]
+            Вакансии
+        """
+
+        return await self._cached(
+            self._datasets,
+            ("table", *file_signature(Path(file_name))),
+            self.max_datasets,
+            lambda: DataSet.from_file(file_name).to_list(),
+        )
+
+    async def handle_stats(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Отвечает на запрос статистики. Если указана output_dir,
+        то в неё записываются файлы отчёта, а если указаны только artifacts,
+        то файлы возвращаются в ответе в base64 без записи на диск.
+
+        Parameters
+        ----------
+        request: Dict[str, Any]
+            Запрос статистики
+
+        Raises
+        ------
+        VasyaException
+            Неверный запрос или файлы не найдены
+
+        Returns
+        -------
+        Dict[str, Any]
+            Статистика и пути до созданных файлов
+        """
+
+        output_dir = request.get("output_dir")
+        if output_dir:
+            self.check_path(output_dir)
+        if request.get("template_path"):
+            self.check_path(request["template_path"])
+
+        report = await self.get_report(request)
+        answer = report.to_dict()
+
+        if output_dir or "artifacts" in request:
+            artifacts = request.get("artifacts", ("xlsx", "png", "pdf"))
+            template_path = request.get("template_path", self.template_path)
+            loop = asyncio.get_running_loop()
+            answer["artifacts"] = await loop.run_in_executor(
+                self._renderer,
+                self.render,
+                report,
+                Path(output_dir) if output_dir else None,
+                artifacts,
+                template_path,
+                self.artifact_cache,
+            )
+        return answer
+
+    @staticmethod
+    def render(
+        report: InputConnectReport,
+        output_dir: Optional[Path],
+        artifacts: List[str],
+        template_path: Optional[str],
+        cache: Optional[ArtifactCache] = None,
+    ) -> Union[List[str], Dict[str, str]]:
+        """
+        Создаёт файлы отчёта.
+
+        Parameters
+        ----------
+        report: InputConnectReport
+            Отчёт
+        output_dir: Optional[Path]
+            Директория для файлов. Если не указана, то файлы
+            создаются только в памяти
+        artifacts: List[str]
+            Какие файлы создать: xlsx, png, pdf
+        template_path: Optional[str]
+            Путь к шаблону pdf
+        cache: Optional[ArtifactCache]
+            Кэш готовых файлов отчёта
+
+        Raises
+        ------
+        VasyaException
+            Для pdf не указан шаблон или указан неизвестный файл отчёта
+
+        Returns
+        -------
+        Union[List[str], Dict[str, str]]
+            Пути до созданных файлов или содержимое файлов в base64 по их типам
+        """
+
+        artifacts = render(report, output_dir, artifacts, template_path, cache)
+        if output_dir is None:
+            return {
+                key: base64.b64encode(content).decode("ascii")
+                for key, content in artifacts.items()
+            }
+        return list(artifacts.values())
+
+    async def handle_table(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Отвечает на запрос таблицы вакансий.
+
+        Parameters
+        ----------
+        request: Dict[str, Any]
+            Запрос таблицы, параметры в том же формате, что и ввод пользователя
+
+        Raises
+        ------
+        VasyaException
+            Неверный запрос, файл не найден или ничего не найдено
+
+        Returns
+        -------
+        Dict[str, Any]
+            Строки таблицы
+        """
+
+        if "path" not in request:
+            raise VasyaException("В запросе таблицы нужен path")
+        self.check_path(request["path"])
+        table = create_table(request, await self.get_vacancies(request["path"]))
+
+        loop = asyncio.get_running_loop()
+        rows = await loop.run_in_executor(self._threads, table.get_rows)
+        if not rows:
+            raise VasyaException("Ничего не найдено")
+        return {"rows": rows}
+
+    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Отвечает на запрос.
+
+        Parameters
+        ----------
+        request: Dict[str, Any]
+            Запрос
+
+        Returns
+        -------
+        Dict[str, Any]
+            Ответ: ok, result или error с error_type и время обработки
+            в секундах. Ошибка любого запроса возвращается в ответе,
+            а сломанный пул процессов заменяется новым
+        """
+
+        start = time.perf_counter()
+        handlers = {
+            "stats": self.handle_stats,
+            "table": self.handle_table,
+        }
+        try:
+            if not isinstance(request, dict):
+                raise VasyaException("Запрос должен быть объектом JSON")
+            if self.authkey is not None and not hmac.compare_digest(
+                str(request.get("authkey", "")).encode(), self.authkey.encode()
+            ):
+                raise VasyaException("Неверный ключ запроса")
+            if request.get("type") == "ping":
+                result: Any = {"workers": self.workers}
+            elif request.get("type") in handlers:
+                result = await handlers[request["type"]](request)
+            else:
+                raise VasyaException(f"Неизвестный тип запроса: {request.get('type')}")
+        except Exception as ex:
+            if isinstance(ex, BrokenProcessPool):
+                self._restart_pool()
+            return {
+                "ok": False,
+                "error": str(ex) or type(ex).__name__,
+                "error_type": type(ex).__name__,
+                "elapsed": time.perf_counter() - start,
+            }
+        return {"ok": True, "result": result, "elapsed": time.perf_counter() - start}
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Обслуживает одно подключение: читает запросы по строкам
+        и отвечает на каждый.
+
+        Parameters
+        ----------
+        reader: asyncio.StreamReader
+            Поток чтения
+        writer: asyncio.StreamWriter
+            Поток записи
+        """
+
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {
+                        "ok": False,
+                        "error": "Неверный JSON",
+                        "error_type": "ValueError",
+                    }
+                else:
+                    response = await self.handle_request(request)
+                writer.write(
+                    json.dumps(response, ensure_ascii=False, default=str).encode()
+                    + b"\n"
+                )
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        socket_path: Optional[str] = None,
+    ) -> None:
+        """
+        Принимает подключения, пока задача не будет отменена.
+
+        Parameters
+        ----------
+        host: str
+            Адрес
+        port: int
+            Порт
+        socket_path: Optional[str]
+            Путь до Unix-сокета. Если указан, то используется вместо порта
+
+        Raises
+        ------
+        VasyaException
+            Адрес не loopback, а ключ не задан
+        """
+
+        if not socket_path and self.authkey is None and not is_loopback(host):
+            raise VasyaException(
+                f"Без ключа VASYA_AUTHKEY сервер слушает только loopback: {host}"
+            )
+
+        if socket_path:
+            server = await asyncio.start_unix_server(
+                self.handle_connection, socket_path, limit=1 << 24
+            )
+        else:
+            server = await asyncio.start_server(
+                self.handle_connection, host, port, limit=1 << 24
+            )
+        async with server:
+            await server.serve_forever()
+
+
+def is_loopback(host: str) -> bool:
+    """
+    Проверяет, что адрес доступен только с этой машины.
+
+    Parameters
+    ----------
+    host: str
+        Адрес или имя хоста
+
+    Returns
+    -------
+    bool
+        Адрес - localhost или loopback
+    """
+
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def main() -> None:
+    """
+    Запускает сервер статистики: python -m vasya.daemon.
+    Ключ запросов берётся из переменной окружения VASYA_AUTHKEY.
+    """
+
+    parser = argparse.ArgumentParser(description="Сервер статистики вакансий")
+    parser.add_argument("--host", default="127.0.0.1", help="адрес")
+    parser.add_argument("--port", type=int, default=8765, help="порт")
+    parser.add_argument("--socket", help="путь до Unix-сокета вместо порта")
+    parser.add_argument("--workers", type=int, help="количество процессов")
+    parser.add_argument("--cache-dir", help="директория с кэшем статистики")
+    parser.add_argument("--template", help="шаблон pdf по умолчанию")
+    parser.add_argument(
+        "--root",
+        default=".",
+        help="директория, вне которой запросы не читают и не создают файлы",
+    )
+    parser.add_argument("--artifact-cache", help="директория с кэшем файлов отчёта")
+    parser.add_argument(
+        "--artifact-cache-size",
+        type=int,
+        default=256,
+        help="размер кэша файлов отчёта в МБ",
+    )
+    args = parser.parse_args()
+
+    daemon = StatsDaemon(
+        args.workers,
+        args.cache_dir,
+        args.template,
+        artifact_cache_dir=args.artifact_cache,
+        artifact_cache_size=args.artifact_cache_size << 20,
+        root=args.root,
+        authkey=os.environ.get("VASYA_AUTHKEY") or None,
+    )
+    try:
+        asyncio.run(daemon.serve(args.host, args.port, args.socket))
+    except KeyboardInterrupt:
+        pass
+    except VasyaException as ex:
+        parser.exit(1, f"{ex}\n")
+    finally:
+        daemon.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,23 @@
 import csv
+import io
+import os
 
+from .rates import RateTable
 from .vacancy import Vacancy
 from .errors import VasyaException
 
-from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, List
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -11,6 +25,166 @@ else:
     Self = Any
 
 
+class _ByteRange(io.RawIOBase):
+    """
+    Поток для чтения файла в заданных границах
+
+    Attributes
+    ----------
+    file: BinaryIO
+        Файл, открытый в бинарном режиме
+    end: Optional[int]
+        Позиция, до которой нужно читать файл
+    """
+
+    def __init__(self, file: BinaryIO, start: int, end: Optional[int]) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        file: BinaryIO
+            Файл, открытый в бинарном режиме
+        start: int
+            Позиция, с которой нужно читать файл
+        end: Optional[int]
+            Позиция, до которой нужно читать файл
+        """
+
+        self.file = file
+        self.file.seek(start)
+        self.end = end
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: memoryview) -> int:
+        size = len(buffer)
+        if self.end is not None:
+            size = max(0, min(size, self.end - self.file.tell()))
+        data = self.file.read(size)
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        self.file.close()
+        super().close()
+
+
+def _count_quotes(file: BinaryIO, start: int, end: int) -> int:
+    """
+    Считает кавычки в байтах файла от start до end.
+
+    Parameters
+    ----------
+    file: BinaryIO
+        Файл, открытый в бинарном режиме
+    start: int
+        Начальная позиция
+    end: int
+        Конечная позиция (не включается)
+
+    Returns
+    -------
+    int
+        Количество кавычек
+    """
+
+    file.seek(start)
+    quotes = 0
+    while start < end:
+        chunk = file.read(min(1 << 20, end - start))
+        if not chunk:
+            break
+        quotes += chunk.count(b'"')
+        start += len(chunk)
+    return quotes
+
+
+class _RowScanner:
+    """
+    Поиск начала строк CSV с учётом кавычек.
+
+    Перевод строки внутри поля в кавычках (например, в списке навыков)
+    не заканчивает строку CSV. Перевод строки заканчивает строку, только
+    если до него в файле чётное количество кавычек (экранированная
+    кавычка "" не меняет чётность), поэтому кавычки считаются блоками
+    с начала файла, а позиции запрашиваются по неубыванию.
+
+    Attributes
+    ----------
+    file: BinaryIO
+        Файл, открытый в бинарном режиме
+    """
+
+    BLOCK = 1 << 20
+
+    def __init__(self, file: BinaryIO) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        file: BinaryIO
+            Файл, открытый в бинарном режиме
+        """
+
+        self.file = file
+        self._reset()
+
+    def _reset(self) -> None:
+        self._scanned = 0
+        self._quotes = 0
+        self._position = 0
+        self._found = 0
+
+    def row_start(self, position: int) -> int:
+        """
+        Возвращает позицию начала первой строки CSV, которая начинается
+        не раньше position (или конец файла, если такой строки нет).
+
+        Parameters
+        ----------
+        position: int
+            Позиция в байтах
+
+        Returns
+        -------
+        int
+            Позиция начала строки
+        """
+
+        if position < self._position:
+            self._reset()
+        self._position = position
+        if position <= self._found:
+            return self._found
+
+        # Строка начинается после перевода строки в позиции position - 1
+        # или позже
+        if self._scanned < position - 1:
+            self._quotes += _count_quotes(self.file, self._scanned, position - 1)
+            self._scanned = position - 1
+        self.file.seek(self._scanned)
+        while True:
+            chunk = self.file.read(self.BLOCK)
+            if not chunk:
+                self._found = self._scanned
+                return self._found
+            begin = 0
+            index = chunk.find(b"\n")
+            while index != -1:
+                self._quotes += chunk.count(b'"', begin, index)
+                begin = index + 1
+                if self._quotes % 2 == 0:
+                    self._scanned += begin
+                    self._found = self._scanned
+                    return self._found
+                index = chunk.find(b"\n", begin)
+            self._quotes += chunk.count(b'"', begin)
+            self._scanned += len(chunk)
+
+
 class DataSet:
     """
     Универсальный парсер CSV
@@ -21,7 +195,12 @@ class DataSet:
         Путь до файла
     """
 
-    def __init__(self, file_name: str, reader: csv.DictReader) -> None:
+    def __init__(
+        self,
+        file_name: str,
+        reader: csv.DictReader,
+        rates: Optional[RateTable] = None,
+    ) -> None:
         """
         Инициализация класса
 
@@ -31,12 +210,16 @@ class DataSet:
             Путь до файла
         reader: csv.DictReader
             Объект для чтения CSV
+        rates: Optional[RateTable]
+            Курсы валют по месяцам для перевода зарплат в рубли
         """
 
         self.file_name = file_name
         self._reader = reader
         self._vacancies = (
-            Vacancy(**row) for row in reader if all(row) and all(row.values())
+            Vacancy(**row, rates=rates)
+            for row in reader
+            if all(row) and all(row.values())
         )
 
     def __iter__(self) -> Iterator[Vacancy]:
@@ -49,7 +232,13 @@ class DataSet:
         return len(self._vacancies)
 
     @classmethod
-    def from_file(cls, file_name: str) -> "DataSet":
+    def from_file(
+        cls,
+        file_name: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        rates: Optional[RateTable] = None,
+    ) -> "DataSet":
         """
         Создает экземпляр класса из CSV-файла
 
@@ -57,6 +246,16 @@ class DataSet:
         ----------
         file_name: str
             Путь до файла
+        start: int
+            Позиция в байтах, с которой начинаются читаемые строки.
+            Должна указывать на начало строки; заголовок всегда
+            берётся из начала файла
+        end: Optional[int]
+            Позиция в байтах, на которой заканчиваются читаемые строки.
+            По умолчанию файл читается до конца
+        rates: Optional[RateTable]
+            Курсы валют по месяцам. Если указаны, то зарплаты переводятся
+            в рубли по курсу месяца публикации
 
         Raises
         ------
@@ -73,12 +272,174 @@ class DataSet:
 
         if not file.readline():
             raise VasyaException("Пустой файл")
-        if not file.readline():
-            raise VasyaException("Нет данных")
 
-        file.seek(0)
-        reader = csv.DictReader(file)
-        return cls(file_name, reader)
+        if not start and end is None:
+            if not file.readline():
+                raise VasyaException("Нет данных")
+
+            file.seek(0)
+            reader = csv.DictReader(file)
+            return cls(file_name, reader, rates)
+
+        fieldnames = None
+        if start:
+            file.seek(0)
+            fieldnames = next(csv.reader(file))
+        file.close()
+
+        binary = _ByteRange(open(file_name, "rb"), start, end)
+        text = io.TextIOWrapper(io.BufferedReader(binary), encoding="utf-8-sig")
+        reader = csv.DictReader(text, fieldnames=fieldnames)
+        return cls(file_name, reader, rates)
+
+    @classmethod
+    def from_vacancies(cls, file_name: str, vacancies: List[Vacancy]) -> "DataSet":
+        """
+        Создает экземпляр класса из уже прочитанных вакансий.
+        Фильтры и сортировка не изменяют переданный список
+
+        Parameters
+        ----------
+        file_name: str
+            Путь до файла, из которого прочитаны вакансии
+        vacancies: List[Vacancy]
+            Вакансии
+
+        Returns
+        -------
+        DataSet
+            Экземпляр класса
+        """
+
+        data = cls.__new__(cls)
+        data.file_name = file_name
+        data._reader = None
+        data._vacancies = list(vacancies)
+        return data
+
+    @classmethod
+    def row_start(cls, file_name: str, position: int) -> int:
+        """
+        Возвращает позицию в байтах начала первой строки с данными,
+        которая начинается не раньше указанной позиции.
+        Переводы строки внутри полей в кавычках не учитываются
+
+        Parameters
+        ----------
+        file_name: str
+            Путь до файла
+        position: int
+            Позиция в байтах
+
+        Returns
+        -------
+        int
+            Позиция начала строки (не меньше конца заголовка)
+        """
+
+        return cls.row_starts(file_name, [position])[0]
+
+    @staticmethod
+    def row_starts(file_name: str, positions: Iterable[int]) -> List[int]:
+        """
+        Возвращает позиции начала строк с данными для нескольких позиций
+        (см. row_start) за один проход по файлу, если позиции
+        идут по неубыванию
+
+        Parameters
+        ----------
+        file_name: str
+            Путь до файла
+        positions: Iterable[int]
+            Позиции в байтах
+
+        Returns
+        -------
+        List[int]
+            Позиции начала строк
+        """
+
+        with open(file_name, "rb") as file:
+            scanner = _RowScanner(file)
+            header_end = scanner.row_start(1)
+            return [
+                header_end if position <= header_end else scanner.row_start(position)
+                for position in positions
+            ]
+
+    @classmethod
+    def split(cls, file_name: str, chunk_size: int) -> List[Tuple[int, Optional[int]]]:
+        """
+        Делит строки файла на части примерно по chunk_size байт.
+        Границы частей выравниваются по началу строк CSV
+        (строки с переводом строки внутри полей в кавычках не делятся)
+
+        Parameters
+        ----------
+        file_name: str
+            Путь до файла
+        chunk_size: int
+            Примерный размер части в байтах
+
+        Returns
+        -------
+        List[Tuple[int, Optional[int]]]
+            Позиции начала и конца частей. Последняя часть
+            читается до конца файла (конец равен None)
+        """
+
+        end = cls.rows_end(file_name)
+        with open(file_name, "rb") as file:
+            scanner = _RowScanner(file)
+            bounds = [scanner.row_start(1)]
+            while bounds[-1] + chunk_size < end:
+                position = scanner.row_start(bounds[-1] + chunk_size)
+                if position >= end:
+                    break
+                bounds.append(position)
+        return [*zip(bounds, bounds[1:]), (bounds[-1], None)]
+
+    @staticmethod
+    def rows_end(file_name: str, start: int = 0) -> int:
+        """
+        Возвращает позицию в байтах сразу после последней завершённой строки
+        CSV. Недописанный хвост файла без перевода строки, в том числе
+        строка с незакрытыми кавычками, не учитывается
+
+        Parameters
+        ----------
+        file_name: str
+            Путь до файла
+        start: int
+            Позиция начала строки CSV, с которой считаются кавычки
+            (например, конец уже обработанной части файла)
+
+        Returns
+        -------
+        int
+            Позиция конца последней завершённой строки (не меньше start)
+        """
+
+        with open(file_name, "rb") as file:
+            position = file.seek(0, os.SEEK_END)
+            # Чётность кавычек после перевода строки в конце завершённой
+            # строки такая же, как в начале (в позиции start)
+            quotes = _count_quotes(file, start, position)
+            while position > start:
+                size = min(1 << 16, position - start)
+                file.seek(position - size)
+                chunk = file.read(size)
+                end = len(chunk)
+                index = chunk.rfind(b"\n")
+                while index != -1:
+                    quotes -= chunk.count(b'"', index, end)
+                    if quotes % 2 == 0:
+                        return position - size + index + 1
+                    end = index
+                    index = chunk.rfind(b"\n", 0, end)
+                quotes -= chunk.count(b'"', 0, end)
+                position -= size
+        return start
 
     def apply_filter(self, filter: Callable[[Vacancy], bool]) -> Self:
         """
@@ -0,0 +1,419 @@
+import multiprocessing
+import os
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import Executor, Future, wait
+from multiprocessing.connection import Client, Connection, Listener
+
+from .errors import VasyaException
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Address = Tuple[str, int]
+
+WORKERS_EXIT_TIMEOUT = 5.0
+"""Сколько секунд ждать завершения локальных исполнителей при закрытии
+координатора, прежде чем завершить их принудительно"""
+
+
+class _Task:
+    """
+    Задача координатора
+
+    Attributes
+    ----------
+    future: Future
+        Результат задачи
+    fn: Callable[..., Any]
+        Выполняемая функция
+    args: Tuple[Any, ...]
+        Позиционные аргументы функции
+    kwargs: Dict[str, Any]
+        Именованные аргументы функции
+    attempts: int
+        Количество отправок задачи исполнителям
+    """
+
+    def __init__(
+        self,
+        future: Future,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.attempts = 0
+
+
+class Coordinator(Executor):
+    """
+    Исполнитель, который раздаёт задачи исполнителям, подключённым по TCP.
+
+    Каждому подключённому исполнителю отправляется по одной задаче
+    (функция и аргументы через pickle), следующая - после получения
+    результата, поэтому быстрые исполнители получают больше задач.
+    Если исполнитель отключился, не вернув результат, задача отправляется
+    другому. Исполнители на других машинах должны видеть файлы
+    по тем же путям (общее хранилище).
+
+    Attributes
+    ----------
+    address: Address
+        Адрес, на котором координатор ждёт исполнителей
+    authkey: bytes
+        Ключ для проверки подключений
+    max_attempts: int
+        Сколько раз задача отправляется исполнителям, прежде чем
+        считается невыполненной
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        authkey: bytes,
+        local_workers: int = 0,
+        max_attempts: int = 3,
+    ) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        address: Address
+            Адрес, на котором координатор ждёт исполнителей.
+            Если порт 0, то выбирается свободный порт
+        authkey: bytes
+            Ключ для проверки подключений
+        local_workers: int
+            Количество исполнителей, запускаемых на этой машине
+        max_attempts: int
+            Сколько раз задача отправляется исполнителям, прежде чем
+            считается невыполненной
+        """
+
+        self._listener = Listener(address, authkey=authkey)
+        self.address: Address = self._listener.address
+        self.authkey = authkey
+        self.max_attempts = max_attempts
+
+        self._tasks: "queue.Queue[Optional[_Task]]" = queue.Queue()
+        self._futures: List[Future] = []
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stopped = threading.Event()
+
+        # При fork исполнители наследуют сокет координатора и закрывают его
+        # при запуске: иначе после закрытия координатора опоздавший исполнитель
+        # подключается к унаследованному сокету и ждёт рукопожатия вечно
+        inherited = (
+            self._listener if multiprocessing.get_start_method() == "fork" else None
+        )
+        self._processes = [
+            multiprocessing.Process(
+                target=_run_local_worker,
+                args=(self.address, authkey, inherited),
+                daemon=True,
+            )
+            for _ in range(local_workers)
+        ]
+        for process in self._processes:
+            process.start()
+
+        self._accept_thread = threading.Thread(target=self._accept, daemon=True)
+        self._accept_thread.start()
+
+    def submit(self, fn: Callable[..., Any], /, *args, **kwargs) -> Future:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            future: Future = Future()
+            self._futures.append(future)
+        self._tasks.put(_Task(future, fn, args, kwargs))
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        if cancel_futures:
+            for future in self._futures:
+                future.cancel()
+        if wait:
+            self._close()
+        else:
+            threading.Thread(target=self._close, daemon=True).start()
+
+    def _close(self) -> None:
+        """
+        Дожидается выполнения всех задач, отключает исполнителей
+        и перестаёт принимать подключения.
+        """
+
+        wait(self._futures)
+        self._tasks.put(None)
+
+        self._stopped.set()
+        # Будим поток приёма подключений без рукопожатия: если поток уже
+        # завершился, подключение Client ждало бы ответа бесконечно
+        try:
+            socket.create_connection(self.address).close()
+        except OSError:
+            pass
+        self._accept_thread.join()
+        self._listener.close()
+
+        for thread in self._threads:
+            thread.join()
+
+        # Подключённые исполнители уже получили None и завершаются сами,
+        # а не успевшие подключиться ждали бы координатора до таймаута
+        deadline = time.monotonic() + WORKERS_EXIT_TIMEOUT
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+    def _accept(self) -> None:
+        """
+        Принимает подключения исполнителей и обслуживает каждого
+        в отдельном потоке.
+        """
+
+        while True:
+            try:
+                connection = self._listener.accept()
+            except (OSError, EOFError, multiprocessing.AuthenticationError):
+                if self._stopped.is_set():
+                    return
+                continue
+
+            if self._stopped.is_set():
+                connection.close()
+                return
+
+            thread = threading.Thread(
+                target=self._serve, args=(connection,), daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _serve(self, connection: Connection) -> None:
+        """
+        Отправляет задачи одному исполнителю, пока задачи не закончатся
+        или исполнитель не отключится.
+
+        Parameters
+        ----------
+        connection: Connection
+            Подключение исполнителя
+        """
+
+        with connection:
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    self._tasks.put(None)
+                    try:
+                        connection.send(None)
+                    except OSError:
+                        pass
+                    return
+
+                if not task.attempts and not task.future.set_running_or_notify_cancel():
+                    continue
+                task.attempts += 1
+
+                try:
+                    connection.send((task.fn, task.args, task.kwargs))
+                except OSError:
+                    self._retry(task)
+                    return
+                except Exception as ex:
+                    task.future.set_exception(ex)
+                    continue
+
+                try:
+                    ok, result = connection.recv()
+                except (EOFError, OSError):
+                    self._retry(task)
+                    return
+                except Exception as ex:
+                    task.future.set_exception(ex)
+                    continue
+
+                if ok:
+                    task.future.set_result(result)
+                else:
+                    task.future.set_exception(result)
+
+    def _retry(self, task: _Task) -> None:
+        """
+        Возвращает задачу отключившегося исполнителя в очередь.
+
+        Parameters
+        ----------
+        task: _Task
+            Задача
+        """
+
+        if task.attempts >= self.max_attempts:
+            task.future.set_exception(
+                VasyaException(
+                    f"Задача не выполнена: исполнители отключились {task.attempts} раз"
+                )
+            )
+        else:
+            self._tasks.put(task)
+
+
+def connect(address: Address, authkey: bytes, timeout: float = 10.0) -> Connection:
+    """
+    Подключается к координатору, повторяя попытки, пока он не запустится.
+
+    Parameters
+    ----------
+    address: Address
+        Адрес координатора
+    authkey: bytes
+        Ключ для проверки подключения
+    timeout: float
+        Сколько секунд ждать координатора
+
+    Raises
+    ------
+    VasyaException
+        Координатор не ответил за timeout секунд
+
+    Returns
+    -------
+    Connection
+        Подключение к координатору
+    """
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return Client(address, authkey=authkey)
+        except (OSError, EOFError):
+            if time.monotonic() > deadline:
+                raise VasyaException(
+                    f"Не удалось подключиться к координатору {address[0]}:{address[1]}"
+                )
+            time.sleep(0.1)
+
+
+def _run_local_worker(
+    address: Address, authkey: bytes, listener: Optional[Listener]
+) -> None:
+    """
+    Выполняет задачи координатора в процессе, запущенном координатором.
+
+    Parameters
+    ----------
+    address: Address
+        Адрес координатора
+    authkey: bytes
+        Ключ для проверки подключения
+    listener: Optional[Listener]
+        Сокет координатора, унаследованный при fork
+    """
+
+    if listener is not None:
+        listener.close()
+    try:
+        # Координатор начинает принимать подключения до запуска исполнителей,
+        # поэтому отказ в подключении означает, что он уже закрыт
+        run_worker(address, authkey, timeout=0)
+    except VasyaException:
+        pass
+
+
+def run_worker(
+    address: Address, authkey: bytes, timeout: float = 10.0, forever: bool = False
+) -> None:
+    """
+    Выполняет задачи координатора, пока он не отключит исполнителя.
+
+    Parameters
+    ----------
+    address: Address
+        Адрес координатора
+    authkey: bytes
+        Ключ для проверки подключения
+    timeout: float
+        Сколько секунд ждать координатора
+    forever: bool
+        После отключения снова подключаться к координатору
+        (для обработки следующих отчётов)
+
+    Raises
+    ------
+    VasyaException
+        Координатор не ответил за timeout секунд
+    """
+
+    while True:
+        with connect(address, authkey, timeout) as connection:
+            while True:
+                try:
+                    message = connection.recv()
+                except (EOFError, OSError):
+                    break
+                except Exception as ex:
+                    connection.send((False, ex))
+                    continue
+                if message is None:
+                    break
+
+                fn, args, kwargs = message
+                try:
+                    result = (True, fn(*args, **kwargs))
+                except Exception as ex:
+                    result = (False, ex)
+
+                try:
+                    connection.send(result)
+                except (EOFError, OSError):
+                    break
+                except Exception as ex:
+                    connection.send(
+                        (False, VasyaException(f"Не удалось отправить результат: {ex}"))
+                    )
+
+        if not forever:
+            return
+
+
+def parse_address(address: str) -> Address:
+    """
+    Разбирает адрес в формате host:port.
+
+    Parameters
+    ----------
+    address: str
+        Адрес
+
+    Raises
+    ------
+    VasyaException
+        Неверный формат адреса
+
+    Returns
+    -------
+    Address
+        Хост и порт
+    """
+
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise VasyaException(f"Адрес должен быть в формате host:port: {address}")
+    return host, int(port)
@@ -1,13 +1,63 @@
+from importlib import import_module
+
 from .base import InputConnect as InputConnectBase
-from .table import InputConnectTable
-from .report_multiprocessing import InputConnectReportMultiprocessing
-from .report_concurrent import InputConnectReportConcurrent
-from .report_sync import InputConnectReportSync
-
-__all__ = (
-    "InputConnectBase",
-    "InputConnectTable",
-    "InputConnectReportMultiprocessing",
-    "InputConnectReportConcurrent",
-    "InputConnectReportSync",
-)
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from .table import InputConnectTable
+    from .report import InputConnectReport
+    from .report_multiprocessing import InputConnectReportMultiprocessing
+    from .report_concurrent import InputConnectReportConcurrent
+    from .report_sync import InputConnectReportSync
+    from .report_sqlite import InputConnectReportSQLite
+    from .report_cube import InputConnectReportCube
+
+CONNECTORS: Dict[str, str] = {
+    "InputConnectTable": ".table",
+    "InputConnectReport": ".report",
+    "InputConnectReportMultiprocessing": ".report_multiprocessing",
+    "InputConnectReportConcurrent": ".report_concurrent",
+    "InputConnectReportSync": ".report_sync",
+    "InputConnectReportSQLite": ".report_sqlite",
+    "InputConnectReportCube": ".report_cube",
+}
+"""
+Модули коннекторов по их названиям. Модуль импортируется при первом
+обращении к коннектору, поэтому режим таблицы не загружает зависимости
+отчёта.
+"""
+
+__all__ = ("InputConnectBase", *CONNECTORS)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Импортирует коннектор из CONNECTORS при первом обращении.
+
+    Parameters
+    ----------
+    name: str
+        Название коннектора
+
+    Raises
+    ------
+    AttributeError
+        Коннектор не найден
+
+    Returns
+    -------
+    Any
+        Класс коннектора
+    """
+
+    module = CONNECTORS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    connector = getattr(import_module(module, __name__), name)
+    globals()[name] = connector
+    return connector
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *CONNECTORS})
@@ -0,0 +1,1485 @@
+import openpyxl
+from openpyxl.styles import Font
+from openpyxl.styles.borders import Border, Side
+from openpyxl.utils import get_column_letter
+import matplotlib
+from matplotlib.axes import Axes
+from matplotlib.container import BarContainer
+from matplotlib.figure import Figure
+from jinja2 import Environment, FileSystemLoader
+import pdfkit
+import base64
+import hashlib
+import io
+import json
+import os
+from functools import lru_cache
+from itertools import islice
+from os import path
+from concurrent.futures import ThreadPoolExecutor
+
+from .report import ARTIFACT_FILES, InputConnectReport
+from ..aggregation import GroupBy, Key, SpilledResults
+from ..cache import ArtifactCache
+from ..errors import VasyaException
+
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.cell.cell import Cell
+
+__all__ = ("Report", "template_environment")
+
+
+@lru_cache(maxsize=None)
+def template_environment(directory: str) -> Environment:
+    """
+    Возвращает окружение jinja2 для шаблонов из директории. Окружение
+    общее, поэтому каждый шаблон компилируется один раз, а не при каждой
+    отрисовке, и перекомпилируется только после изменения файла.
+
+    Parameters
+    ----------
+    directory: str
+        Абсолютный путь до директории с шаблонами
+
+    Returns
+    -------
+    Environment
+        Окружение jinja2
+    """
+
+    return Environment(loader=FileSystemLoader(directory))
+
+
+class Report:
+    """
+    Класс. хранящий в себе статические методы для генерации отчётов.
+    """
+
+    thin_border = Border(
+        left=Side(style="thin"),
+        right=Side(style="thin"),
+        top=Side(style="thin"),
+        bottom=Side(style="thin"),
+    )
+    max_rows = 1048576
+    artifact_files = ARTIFACT_FILES
+    artifacts_version = 1
+    wkhtmltopdf = (
+        "C:\\Program Files\\wkhtmltopdf\\bin\\wkhtmltopdf.exe"
+        if os.name == "nt"
+        else "/usr/bin/wkhtmltopdf"
+    )
+
+    @classmethod
+    def create_header(
+        cls, data: Worksheet, letter: str, name: str, width: Optional[int] = None
+    ) -> int:
+        """
+        Метод для создания заголовка столбца.
+
+        Parameters
+        ----------
+        data: Worksheet
+            Лист, в котором будет создан заголовок
+        letter: str
+            Буква столбца
+        name: str
+            Название заголовка
+        width: Optional[int]
+            Ширина столбца
+
+        Returns
+        -------
+        int
+            Ширина столбца
+        """
+
+        cell = f"{letter}1"
+        data[cell] = name
+        data[cell].font = Font(bold=True)
+        data[cell].border = cls.thin_border
+        data.column_dimensions[letter].width = result = width or (len(name) + 2)
+        return result
+
+    @classmethod
+    def set_cell(cls, data: Worksheet, letter: str, row: int, value: Any) -> Cell:
+        """
+        Метод для создания ячейки.
+
+        Parameters
+        ----------
+        data: Worksheet
+            Лист, в котором будет создана ячейка
+        letter: str
+            Буква столбца
+        row: int
+            Номер строки
+        value: Any
+            Значение ячейки
+
+        Returns
+        -------
+        Cell
+            Созданная ячейка
+        """
+
+        cell = f"{letter}{row}"
+        data[cell] = value
+        data[cell].border = cls.thin_border
+        return data[cell]
+
+    @classmethod
+    def generate_excel(cls, input_connect: InputConnectReport, filename: str) -> None:
+        """
+        Метод для генерации excel-файла.
+        Создаёт файл filename в директории, из которой был запущен скрипт.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+        filename: str
+            Название файла
+        """
+
+        cls.create_workbook(input_connect).save(filename)
+
+    @classmethod
+    def excel_bytes(cls, input_connect: InputConnectReport) -> bytes:
+        """
+        Метод для генерации excel-файла в памяти.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+
+        Returns
+        -------
+        bytes
+            Содержимое xlsx-файла
+        """
+
+        buffer = io.BytesIO()
+        cls.create_workbook(input_connect).save(buffer)
+        return buffer.getvalue()
+
+    @classmethod
+    def create_workbook(cls, input_connect: InputConnectReport) -> openpyxl.Workbook:
+        """
+        Метод для создания книги excel со статистикой.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+
+        Returns
+        -------
+        openpyxl.Workbook
+            Книга excel
+        """
+
+        wb = openpyxl.Workbook()
+        wb.remove(wb["Sheet"])
+
+        data = wb.create_sheet("Статистика по годам")
+        cls.create_header(data, "A", "Год", 6)
+        cls.create_header(data, "B", "Средняя зарплата")
+        cls.create_header(data, "C", f"Средняя зарплата - {input_connect.profession}")
+        cls.create_header(data, "D", "Количество вакансий")
+        cls.create_header(
+            data, "E", f"Количество вакансий - {input_connect.profession}"
+        )
+
+        for i in input_connect.years_stats:
+            cls.set_cell(data, "A", i - 2005, i)
+            cls.set_cell(data, "B", i - 2005, input_connect.years_stats[i].salary)
+            cls.set_cell(data, "D", i - 2005, input_connect.years_stats[i].count)
+
+        for i in input_connect.vacancy_stats:
+            cls.set_cell(data, "C", i - 2005, input_connect.vacancy_stats[i].salary)
+            cls.set_cell(data, "E", i - 2005, input_connect.vacancy_stats[i].count)
+
+        if input_connect.distinct_precision is not None:
+            for letter, (key, name) in zip("FG", input_connect.distinct_fields.items()):
+                cls.create_header(data, letter, name)
+                for i in input_connect.years_stats:
+                    cls.set_cell(
+                        data, letter, i - 2005, input_connect.get_distinct_count(i, key)
+                    )
+
+        if len(input_connect.professions) > 1:
+            data = wb.create_sheet("Статистика по профессиям")
+            cls.create_header(data, "A", "Год", 6)
+            for n, profession in enumerate(input_connect.professions):
+                salary_letter = get_column_letter(2 + n * 2)
+                count_letter = get_column_letter(3 + n * 2)
+                cls.create_header(
+                    data, salary_letter, f"Средняя зарплата - {profession}"
+                )
+                cls.create_header(
+                    data, count_letter, f"Количество вакансий - {profession}"
+                )
+
+                vacancy_stats = input_connect.professions_stats[profession]
+                for i in vacancy_stats:
+                    cls.set_cell(data, "A", i - 2005, i)
+                    cls.set_cell(data, salary_letter, i - 2005, vacancy_stats[i].salary)
+                    cls.set_cell(data, count_letter, i - 2005, vacancy_stats[i].count)
+
+        data = wb.create_sheet("Статистика по городам")
+        len_a = cls.create_header(data, "A", "Город")
+        cls.create_header(data, "B", "Уровень зарплат")
+        len_d = cls.create_header(data, "D", "Город")
+        cls.create_header(data, "E", "Доля вакансий")
+
+        sorted_cities = input_connect.get_sorted_cities("salary")
+        for n, i in enumerate(sorted_cities, 2):
+            cls.set_cell(data, "A", n, i)
+            data.column_dimensions["A"].width = len_a = max(len_a, len(i) + 2)
+            cls.set_cell(data, "B", n, sorted_cities[i].salary)
+
+        sorted_cities = input_connect.get_sorted_cities("count")
+        for n, i in enumerate(sorted_cities, 2):
+            cls.set_cell(data, "D", n, i)
+            data.column_dimensions["D"].width = len_d = max(len_d, len(i) + 2)
+            cell = cls.set_cell(
+                data, "E", n, f"{round(sorted_cities[i].count * 100, 2)}%"
+            )
+            cell.number_format = "0.00%"
+
+        if input_connect.granularity != "year":
+            cls.add_periods_sheet(wb, input_connect)
+
+        if input_connect.sample is not None:
+            cls.add_sample_sheet(wb, input_connect)
+
+        if input_connect.quantiles:
+            cls.add_quantiles_sheets(wb, input_connect)
+
+        if input_connect.top_skills:
+            cls.add_skills_sheet(wb, input_connect)
+
+        for group_by in input_connect.group_by:
+            cls.add_group_by_sheet(wb, group_by, input_connect.groups_stats)
+
+        return wb
+
+    @classmethod
+    def add_sample_sheet(
+        cls, wb: openpyxl.Workbook, input_connect: InputConnectReport
+    ) -> None:
+        """
+        Метод для добавления первым листом подписи предварительного отчёта
+        и погрешностей оценок по годам и городам.
+
+        Parameters
+        ----------
+        wb: openpyxl.Workbook
+            Книга, в которую добавляется лист
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+        """
+
+        data = wb.create_sheet("Точность оценок", 0)
+        data["A1"] = input_connect.get_sample_label()
+        data["A1"].font = Font(bold=True)
+
+        profession = input_connect.profession
+        headers = [
+            "Год",
+            "Погрешность средней зарплаты",
+            f"Погрешность средней зарплаты - {profession}",
+            "Погрешность количества вакансий",
+            f"Погрешность количества вакансий - {profession}",
+            "Эффективный размер выборки",
+        ]
+        for n, header in enumerate(headers, 1):
+            data[f"{get_column_letter(n)}3"] = header
+            data[f"{get_column_letter(n)}3"].font = Font(bold=True)
+            data.column_dimensions[get_column_letter(n)].width = len(header) + 2
+
+        row = 4
+        for year in sorted(input_connect.years_stats):
+            stats = input_connect.years_stats[year]
+            salary_error, count_error = input_connect.get_sample_errors(stats)
+            vacancy_errors = (None, None)
+            if year in input_connect.vacancy_stats:
+                vacancy_errors = input_connect.get_sample_errors(
+                    input_connect.vacancy_stats[year]
+                )
+            values = [
+                year,
+                salary_error,
+                vacancy_errors[0],
+                count_error,
+                vacancy_errors[1],
+                stats.moments.effective_size(),
+            ]
+            for n, value in enumerate(values, 1):
+                cls.set_cell(data, get_column_letter(n), row, value)
+            row += 1
+
+        row += 1
+        data[f"A{row}"] = "Город"
+        data[f"B{row}"] = "Погрешность уровня зарплат"
+        data[f"A{row}"].font = data[f"B{row}"].font = Font(bold=True)
+        sorted_cities = input_connect.get_sorted_cities("salary")
+        for n, city in enumerate(sorted_cities, row + 1):
+            cls.set_cell(data, "A", n, city)
+            cls.set_cell(
+                data,
+                "B",
+                n,
+                input_connect.get_sample_errors(sorted_cities[city])[0],
+            )
+
+    @classmethod
+    def add_periods_sheet(
+        cls, wb: openpyxl.Workbook, input_connect: InputConnectReport
+    ) -> None:
+        """
+        Метод для добавления листа со статистикой по месяцам или неделям
+        и скользящими средними зарплатами.
+
+        Parameters
+        ----------
+        wb: openpyxl.Workbook
+            Книга, в которую добавляется лист
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+        """
+
+        names = input_connect.granularity_names[input_connect.granularity]
+        data = wb.create_sheet(f"Статистика по {names}")
+        cls.create_header(data, "A", "Период", 12)
+
+        columns = []
+        for suffix, periods_stats, rolling_stats in (
+            ("", input_connect.periods_stats, input_connect.rolling_stats),
+            (
+                f" - {input_connect.profession}",
+                input_connect.vacancy_periods_stats,
+                input_connect.vacancy_rolling_stats,
+            ),
+        ):
+            columns.append(
+                (
+                    f"Средняя зарплата{suffix}",
+                    {period: i.salary for period, i in periods_stats.items()},
+                )
+            )
+            for window, rolling in rolling_stats.items():
+                columns.append(
+                    (
+                        f"Скользящая средняя зарплата (окно {window}){suffix}",
+                        {period: salary for period, (salary, _) in rolling.items()},
+                    )
+                )
+            columns.append(
+                (
+                    f"Количество вакансий{suffix}",
+                    {period: i.count for period, i in periods_stats.items()},
+                )
+            )
+
+        for n, (header, _) in enumerate(columns, 2):
+            cls.create_header(data, get_column_letter(n), header)
+
+        for row, period in enumerate(input_connect.periods_stats, 2):
+            cls.set_cell(data, "A", row, input_connect.get_period_label(period))
+            for n, (_, values) in enumerate(columns, 2):
+                cls.set_cell(data, get_column_letter(n), row, values.get(period, 0))
+
+    @classmethod
+    def add_skills_sheet(
+        cls, wb: openpyxl.Workbook, input_connect: InputConnectReport
+    ) -> None:
+        """
+        Метод для добавления листа с самыми частыми навыками.
+        Для каждой оценки указывается её погрешность: настоящее количество
+        упоминаний не больше оценки и не меньше оценки минус погрешность.
+
+        Parameters
+        ----------
+        wb: openpyxl.Workbook
+            Книга, в которую добавляется лист
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+        """
+
+        data = wb.create_sheet("Навыки")
+        cls.create_header(data, "A", "Год", 6)
+        cls.create_header(data, "B", "Место", 7)
+        len_c = cls.create_header(data, "C", "Навык")
+        cls.create_header(data, "D", "Количество упоминаний")
+        cls.create_header(data, "E", "Погрешность")
+
+        row = 2
+        years = [*sorted(input_connect.years_stats), None]
+        for year in years:
+            sketch = input_connect.get_skills_sketch(year)
+            if sketch is None:
+                continue
+            for n, (skill, count) in enumerate(sketch.top(input_connect.top_skills), 1):
+                cls.set_cell(data, "A", row, year if year else input_connect.profession)
+                cls.set_cell(data, "B", row, n)
+                cls.set_cell(data, "C", row, skill)
+                data.column_dimensions["C"].width = len_c = max(len_c, len(skill) + 2)
+                cls.set_cell(data, "D", row, count)
+                cls.set_cell(data, "E", row, sketch.error)
+                row += 1
+
+    @classmethod
+    def add_group_by_sheet(
+        cls,
+        wb: openpyxl.Workbook,
+        group_by: GroupBy,
+        groups_stats: Dict[str, Union[Dict[Key, Dict[str, Any]], SpilledResults]],
+    ) -> None:
+        """
+        Метод для добавления листа с результатами группировки.
+
+        Parameters
+        ----------
+        wb: openpyxl.Workbook
+            Книга, в которую добавляется лист
+        group_by: GroupBy
+            Группировка
+        groups_stats: Dict[str, Union[Dict[Key, Dict[str, Any]], SpilledResults]]
+            Результаты группировок по их названиям. Если групп больше,
+            чем строк на листе Excel, то записываются только первые
+        """
+
+        data = wb.create_sheet(group_by.name[:31])
+        headers = [
+            *group_by.dimension_names,
+            *(measure.name for measure in group_by.measures),
+        ]
+        for n, header in enumerate(headers, 1):
+            cls.create_header(data, get_column_letter(n), header)
+
+        rows = islice(groups_stats[group_by.name].items(), cls.max_rows - 1)
+        for row, (key, values) in enumerate(rows, 2):
+            for n, value in enumerate([*key, *values.values()], 1):
+                if not isinstance(value, (int, float, str)) and value is not None:
+                    value = str(value)
+                cls.set_cell(data, get_column_letter(n), row, value)
+
+    @staticmethod
+    def quantile_name(q: float) -> str:
+        """
+        Метод для получения названия квантиля.
+
+        Parameters
+        ----------
+        q: float
+            Уровень квантиля
+
+        Returns
+        -------
+        str
+            Название квантиля
+        """
+
+        if q == 0.5:
+            return "Медиана"
+        return f"{round(q * 100, 2):g}-й процентиль"
+
+    @classmethod
+    def add_quantiles_sheets(
+        cls, wb: openpyxl.Workbook, input_connect: InputConnectReport
+    ) -> None:
+        """
+        Метод для добавления листов с квантилями зарплат.
+
+        Parameters
+        ----------
+        wb: openpyxl.Workbook
+            Книга, в которую добавляются листы
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+        """
+
+        quantiles = input_connect.quantiles
+
+        data = wb.create_sheet("Квантили зарплат по годам")
+        cls.create_header(data, "A", "Год", 6)
+        for n, q in enumerate(quantiles):
+            all_letter = get_column_letter(2 + n)
+            profession_letter = get_column_letter(2 + len(quantiles) + n)
+            name = cls.quantile_name(q)
+            cls.create_header(data, all_letter, name)
+            cls.create_header(
+                data, profession_letter, f"{name} - {input_connect.profession}"
+            )
+
+            for i in input_connect.years_stats:
+                cls.set_cell(data, "A", i - 2005, i)
+                cls.set_cell(
+                    data,
+                    all_letter,
+                    i - 2005,
+                    input_connect.years_stats[i].quantiles.get(q),
+                )
+            for i in input_connect.vacancy_stats:
+                cls.set_cell(
+                    data,
+                    profession_letter,
+                    i - 2005,
+                    input_connect.vacancy_stats[i].quantiles.get(q),
+                )
+
+        data = wb.create_sheet("Квантили зарплат по городам")
+        len_a = cls.create_header(data, "A", "Город")
+        for n, q in enumerate(quantiles):
+            cls.create_header(data, get_column_letter(2 + n), cls.quantile_name(q))
+
+        sorted_cities = input_connect.get_sorted_cities("salary")
+        for n, i in enumerate(sorted_cities, 2):
+            cls.set_cell(data, "A", n, i)
+            data.column_dimensions["A"].width = len_a = max(len_a, len(i) + 2)
+            for m, q in enumerate(quantiles):
+                cls.set_cell(
+                    data, get_column_letter(2 + m), n, sorted_cities[i].quantiles.get(q)
+                )
+
+    @classmethod
+    def add_simple_graph(
+        cls,
+        axes: Axes,
+        x_val: List[int],
+        y_val1: List[float],
+        y_val2: List[float],
+        name_values1: str,
+        name_values2: str,
+        title: str,
+    ) -> BarContainer:
+        """
+        Метод для добавления простого графика.
+
+        Parameters
+        ----------
+        axes: Axes
+            Объект, хранящий в себе данные для построения графика
+        x_val: List[int]
+            Список значений по оси X
+        y_val1: List[float]
+            Список значений по оси Y для первого графика
+        y_val2: List[float]
+            Список значений по оси Y для второго графика
+        name_values1: str
+            Название первого графика
+        name_values2: str
+            Название второго графика
+        title: str
+            Название графика
+
+        Returns
+        -------
+        BarContainer
+            Столбцы второго графика
+        """
+
+        axes.set_title(title, fontsize=16)
+        axes.grid(axis="y")
+        bars = axes.bar([v + 0.2 for v in x_val], y_val2, label=name_values2, width=0.4)
+        axes.bar([v - 0.2 for v in x_val], y_val1, label=name_values1, width=0.4)
+        axes.legend()
+        axes.tick_params(axis="x", labelrotation=90)
+        return bars
+
+    @classmethod
+    def add_period_graph(
+        cls,
+        axes: Axes,
+        x_val: List[str],
+        lines: Dict[str, List[float]],
+        title: str,
+    ) -> List[Any]:
+        """
+        Метод для добавления линейного графика по периодам.
+
+        Parameters
+        ----------
+        axes: Axes
+            Объект, хранящий в себе данные для построения графика
+        x_val: List[str]
+            Названия периодов по оси X
+        lines: Dict[str, List[float]]
+            Значения по оси Y для каждой линии по её названию
+        title: str
+            Название графика
+
+        Returns
+        -------
+        List[Any]
+            Линии в порядке lines
+        """
+
+        axes.set_title(title, fontsize=16)
+        axes.grid(axis="y")
+        plotted = []
+        for name, y_val in lines.items():
+            plotted.extend(axes.plot(x_val, y_val, label=name))
+        axes.legend()
+        step = max(1, len(x_val) // 24)
+        axes.set_xticks(range(0, len(x_val), step))
+        axes.set_xticklabels(x_val[::step])
+        axes.tick_params(axis="x", labelrotation=90)
+        return plotted
+
+    @classmethod
+    def add_horizontal_graph(
+        cls, axes: Axes, x_val: List[str], y_val: List[float], title: str
+    ) -> None:
+        """
+        Метод для добавления горизонтального графика.
+
+        Parameters
+        ----------
+        axes: Axes
+            Объект, хранящий в себе данные для построения графика
+        x_val: List[str]
+            Список значений по оси X
+        y_val: List[float]
+            Список значений по оси Y
+        title: str
+            Название графика
+        """
+
+        axes.set_title(title, fontsize=16)
+        axes.grid(axis="x")
+        axes.barh(x_val, y_val)
+        axes.invert_yaxis()
+
+    @classmethod
+    def add_circle_diagramm(
+        cls, axes: Axes, names: List[str], values: List[int], title: str
+    ) -> None:
+        """
+        Метод для добавления круговой диаграммы.
+
+        Parameters
+        ----------
+        axes: Axes
+            Объект, хранящий в себе данные для построения графика
+        names: List[str]
+            Список названий секторов
+        values: List[int]
+            Список значений секторов
+        title: str
+            Название графика
+        """
+
+        axes.set_title(title, fontsize=16)
+        names.append("Другие")
+        values.append(1 - sum(values))
+        axes.pie(values, labels=names)
+
+    @classmethod
+    def add_periods_graphs(
+        cls, axis: Any, input_connect: InputConnectReport
+    ) -> List[Any]:
+        """
+        Метод для добавления графиков зарплат и количества вакансий
+        по месяцам или неделям со скользящими средними.
+
+        Parameters
+        ----------
+        axis: Any
+            Сетка графиков изображения
+        input_connect: InputConnectReport
+            Объект, хранящий в себе данные для построения графика
+
+        Returns
+        -------
+        List[Any]
+            Линии зарплат и количества вакансий выбранной профессии
+        """
+
+        names = input_connect.granularity_names[input_connect.granularity]
+        periods = list(input_connect.periods_stats)
+        labels = [input_connect.get_period_label(i) for i in periods]
+        (salary_name, salary_values), (count_name, count_values) = (
+            cls.profession_series(input_connect)
+        )
+
+        salaries = {
+            "Средняя з/п": [input_connect.periods_stats[i].salary for i in periods],
+            salary_name: salary_values,
+        }
+        for window, rolling in input_connect.rolling_stats.items():
+            salaries[f"Скользящая средняя з/п (окно {window})"] = [
+                rolling[i][0] for i in periods
+            ]
+        salary_lines = cls.add_period_graph(
+            axis[0, 0], labels, salaries, f"Уровень зарплат по {names}"
+        )
+
+        counts = {
+            "Количество вакансий": [
+                input_connect.periods_stats[i].count for i in periods
+            ],
+            count_name: count_values,
+        }
+        count_lines = cls.add_period_graph(
+            axis[0, 1], labels, counts, f"Количество вакансий по {names}"
+        )
+        return [salary_lines[1], count_lines[1]]
+
+    @classmethod
+    def profession_series(
+        cls, input_connect: InputConnectReport
+    ) -> List[Tuple[str, List[float]]]:
+        """
+        Метод для получения названий и значений графиков выбранной профессии:
+        зарплат и количества вакансий по годам или по периодам.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе данные для построения графика
+
+        Returns
+        -------
+        List[Tuple[str, List[float]]]
+            Название и значения графика зарплат и графика количества вакансий
+        """
+
+        if input_connect.granularity != "year":
+            stats = [
+                input_connect.vacancy_periods_stats.get(i)
+                for i in input_connect.periods_stats
+            ]
+        else:
+            stats = list(input_connect.vacancy_stats.values())
+        return [
+            (
+                f"з/п {input_connect.profession}",
+                [getattr(i, "salary", 0) for i in stats],
+            ),
+            (
+                f"Количество вакансий {input_connect.profession}",
+                [getattr(i, "count", 0) for i in stats],
+            ),
+        ]
+
+    @classmethod
+    def update_graphs(
+        cls, axis: Any, artists: List[Any], input_connect: InputConnectReport
+    ) -> None:
+        """
+        Метод для замены графиков выбранной профессии на графики профессии
+        input_connect. Остальные графики от профессии не зависят,
+        поэтому не перестраиваются.
+
+        Parameters
+        ----------
+        axis: Any
+            Массив 2 x 2 объектов Axes, построенный add_graphs
+        artists: List[Any]
+            Графики профессии, которые вернул add_graphs
+        input_connect: InputConnectReport
+            Объект, хранящий в себе данные для построения графика
+        """
+
+        for axes, artist, (name, values) in zip(
+            (axis[0, 0], axis[0, 1]), artists, cls.profession_series(input_connect)
+        ):
+            if isinstance(artist, BarContainer):
+                for rect, value in zip(artist, values):
+                    rect.set_height(value)
+            else:
+                artist.set_ydata(values)
+            artist.set_label(name)
+            axes.relim()
+            axes.autoscale_view()
+            axes.legend()
+
+    @classmethod
+    def generate_image(cls, input_connect: InputConnectReport, filename: str) -> None:
+        """
+        Метод для генерации изображения.
+        Создаёт файл filename в директории, из которой был запущен скрипт.
+        График строится через Figure без глобального состояния pyplot,
+        поэтому метод можно вызывать не из главного потока.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе данные для построения графика
+        filename: str
+            Название файла
+        """
+
+        with open(filename, "wb") as file:
+            file.write(cls.image_bytes(input_connect))
+
+    @classmethod
+    def image_bytes(cls, input_connect: InputConnectReport) -> bytes:
+        """
+        Метод для генерации изображения png в памяти.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе данные для построения графика
+
+        Returns
+        -------
+        bytes
+            Содержимое png-файла
+        """
+
+        return next(cls.images_bytes([input_connect]))
+
+    @classmethod
+    def images_bytes(cls, reports: Iterable[InputConnectReport]) -> Iterator[bytes]:
+        """
+        Метод для генерации изображений png для нескольких отчётов
+        с одной статистикой по всем вакансиям (см. for_profession).
+        Изображение строится один раз, а для следующих отчётов
+        меняются только значения и названия графиков профессии.
+        Расположение графиков каждый раз считается от исходного,
+        поэтому изображения совпадают с image_bytes.
+
+        Parameters
+        ----------
+        reports: Iterable[InputConnectReport]
+            Отчёты по профессиям
+
+        Returns
+        -------
+        Iterator[bytes]
+            Содержимое png-файлов в порядке отчётов
+        """
+
+        fig = axis = artists = layout = None
+        for input_connect in reports:
+            buffer = io.BytesIO()
+            with matplotlib.rc_context({"font.size": 8}):
+                if fig is None:
+                    fig = Figure(figsize=(16, 9))
+                    axis = fig.subplots(2, 2)
+                    artists = cls.add_graphs(axis, input_connect)
+                    layout = vars(fig.subplotpars).copy()
+                else:
+                    cls.update_graphs(axis, artists, input_connect)
+                    fig.subplots_adjust(**layout)
+                fig.tight_layout(h_pad=1)
+                fig.savefig(buffer, format="png")
+            yield buffer.getvalue()
+
+    @classmethod
+    def add_graphs(cls, axis: Any, input_connect: InputConnectReport) -> List[Any]:
+        """
+        Метод для добавления всех графиков отчёта.
+
+        Parameters
+        ----------
+        axis: Any
+            Массив 2 x 2 объектов Axes
+        input_connect: InputConnectReport
+            Объект, хранящий в себе данные для построения графика
+
+        Returns
+        -------
+        List[Any]
+            Графики зарплат и количества вакансий выбранной профессии
+            (см. update_graphs)
+        """
+
+        if input_connect.granularity != "year":
+            artists = cls.add_periods_graphs(axis, input_connect)
+        else:
+            (salary_name, salary_values), (count_name, count_values) = (
+                cls.profession_series(input_connect)
+            )
+            artists = [
+                cls.add_simple_graph(
+                    axis[0, 0],
+                    input_connect.years_stats,
+                    [
+                        input_connect.years_stats[key].salary
+                        for key in input_connect.years_stats
+                    ],
+                    salary_values,
+                    "Средняя з/п",
+                    salary_name,
+                    "Уровень зарплат по годам",
+                ),
+                cls.add_simple_graph(
+                    axis[0, 1],
+                    input_connect.years_stats,
+                    [
+                        input_connect.years_stats[key].count
+                        for key in input_connect.years_stats
+                    ],
+                    count_values,
+                    "Количество вакансий",
+                    count_name,
+                    "Количество вакансий по годам",
+                ),
+            ]
+        sorted_cities_by_salary = input_connect.get_sorted_cities("salary")
+        cls.add_horizontal_graph(
+            axis[1, 0],
+            [key for key in sorted_cities_by_salary],
+            [sorted_cities_by_salary[key].salary for key in sorted_cities_by_salary],
+            "Уровень зарплат по городам",
+        )
+        sorted_cities_by_count = input_connect.get_sorted_cities("count")
+        cls.add_circle_diagramm(
+            axis[1, 1],
+            [key for key in sorted_cities_by_count],
+            [sorted_cities_by_count[key].count for key in sorted_cities_by_count],
+            "Доля вакансий по городам",
+        )
+        axis[1, 1].axis("equal")
+        return artists
+
+    @classmethod
+    def generate_artifacts(
+        cls,
+        input_connect: InputConnectReport,
+        artifacts: Sequence[str] = ("xlsx", "png", "pdf"),
+        output_dir: str = ".",
+        template_name: str = "pdf_template.html",
+        cache: Optional[ArtifactCache] = None,
+    ) -> Dict[str, str]:
+        """
+        Метод для генерации выбранных файлов отчёта.
+        Файлы создаются в памяти (см. render_artifacts) и записываются
+        в output_dir без промежуточных файлов.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+        artifacts: Sequence[str]
+            Какие файлы создать: xlsx, png, pdf
+        output_dir: str
+            Директория для файлов
+        template_name: str
+            Путь до файла шаблона pdf
+        cache: Optional[ArtifactCache]
+            Кэш готовых файлов отчёта
+
+        Raises
+        ------
+        VasyaException
+            Указан неизвестный файл отчёта
+
+        Returns
+        -------
+        Dict[str, str]
+            Пути до созданных файлов по их типам
+        """
+
+        return cls.write_artifacts(
+            cls.render_artifacts(input_connect, artifacts, template_name, cache),
+            output_dir,
+        )
+
+    @classmethod
+    def write_artifacts(
+        cls, contents: Dict[str, bytes], output_dir: str
+    ) -> Dict[str, str]:
+        """
+        Метод для записи файлов отчёта.
+
+        Parameters
+        ----------
+        contents: Dict[str, bytes]
+            Содержимое файлов по их типам
+        output_dir: str
+            Директория для файлов
+
+        Returns
+        -------
+        Dict[str, str]
+            Пути до созданных файлов по их типам
+        """
+
+        paths = {}
+        for key, content in contents.items():
+            paths[key] = path.join(output_dir, cls.artifact_files[key])
+            with open(paths[key], "wb") as file:
+                file.write(content)
+        return paths
+
+    @classmethod
+    def generate_batch(
+        cls,
+        input_connect: InputConnectReport,
+        professions: Optional[Sequence[str]] = None,
+        artifacts: Sequence[str] = ("xlsx", "png", "pdf"),
+        output_dir: str = ".",
+        template_name: str = "pdf_template.html",
+        cache: Optional[ArtifactCache] = None,
+        workers: Optional[int] = None,
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Метод для генерации файлов отчёта для нескольких профессий
+        (см. render_batch). Файлы каждой профессии записываются
+        в поддиректорию output_dir с её названием.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+        professions: Optional[Sequence[str]]
+            Профессии из input_connect.professions. По умолчанию все
+        artifacts: Sequence[str]
+            Какие файлы создать: xlsx, png, pdf
+        output_dir: str
+            Директория для файлов
+        template_name: str
+            Путь до файла шаблона pdf
+        cache: Optional[ArtifactCache]
+            Кэш готовых файлов отчёта
+        workers: Optional[int]
+            Количество потоков для excel и pdf
+
+        Raises
+        ------
+        VasyaException
+            Указан неизвестный файл отчёта или профессия не посчитана
+
+        Returns
+        -------
+        Dict[str, Dict[str, str]]
+            Пути до созданных файлов по профессиям и типам файлов
+        """
+
+        paths = {}
+        for profession, contents in cls.render_batch(
+            input_connect, professions, artifacts, template_name, cache, workers
+        ).items():
+            directory = path.join(output_dir, profession.replace(os.sep, "_"))
+            os.makedirs(directory, exist_ok=True)
+            paths[profession] = cls.write_artifacts(contents, directory)
+        return paths
+
+    @classmethod
+    def render_artifacts(
+        cls,
+        input_connect: InputConnectReport,
+        artifacts: Sequence[str] = ("xlsx", "png", "pdf"),
+        template_name: str = "pdf_template.html",
+        cache: Optional[ArtifactCache] = None,
+    ) -> Dict[str, bytes]:
+        """
+        Метод для генерации выбранных файлов отчёта в памяти.
+        Excel-файл не зависит от графика, поэтому создаётся в отдельном
+        потоке одновременно с графиком, а pdf создаётся сразу, как только
+        готово изображение. Время генерации близко к времени самого
+        долгого файла, а не к их сумме. График встраивается в pdf
+        как data URI, поэтому на диск ничего не записывается.
+        Если указан кэш, то файлы с тем же ключом (см. artifacts_key)
+        берутся из него без отрисовки.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+        artifacts: Sequence[str]
+            Какие файлы создать: xlsx, png, pdf
+        template_name: str
+            Путь до файла шаблона pdf
+        cache: Optional[ArtifactCache]
+            Кэш готовых файлов отчёта
+
+        Raises
+        ------
+        VasyaException
+            Указан неизвестный файл отчёта
+
+        Returns
+        -------
+        Dict[str, bytes]
+            Содержимое файлов по их типам
+        """
+
+        return cls._render_reports([input_connect], artifacts, template_name, cache)[0]
+
+    @classmethod
+    def render_batch(
+        cls,
+        input_connect: InputConnectReport,
+        professions: Optional[Sequence[str]] = None,
+        artifacts: Sequence[str] = ("xlsx", "png", "pdf"),
+        template_name: str = "pdf_template.html",
+        cache: Optional[ArtifactCache] = None,
+        workers: Optional[int] = None,
+    ) -> Dict[str, Dict[str, bytes]]:
+        """
+        Метод для генерации файлов отчёта для нескольких профессий в памяти.
+        Статистика считается один раз (см. for_profession), изображение
+        строится один раз, и для каждой профессии в нём меняются только её
+        графики (см. images_bytes), а шаблон pdf компилируется один раз.
+        Excel-файлы и pdf создаются в пуле потоков, каждый pdf - отдельным
+        процессом wkhtmltopdf, одновременно с отрисовкой следующих графиков.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+        professions: Optional[Sequence[str]]
+            Профессии из input_connect.professions. По умолчанию все
+        artifacts: Sequence[str]
+            Какие файлы создать: xlsx, png, pdf
+        template_name: str
+            Путь до файла шаблона pdf
+        cache: Optional[ArtifactCache]
+            Кэш готовых файлов отчёта
+        workers: Optional[int]
+            Количество потоков для excel и pdf
+
+        Raises
+        ------
+        VasyaException
+            Указан неизвестный файл отчёта или профессия не посчитана
+
+        Returns
+        -------
+        Dict[str, Dict[str, bytes]]
+            Содержимое файлов по профессиям и типам файлов
+        """
+
+        professions = list(professions or input_connect.professions)
+        reports = [input_connect.for_profession(i) for i in professions]
+        return dict(
+            zip(
+                professions,
+                cls._render_reports(reports, artifacts, template_name, cache, workers),
+            )
+        )
+
+    @classmethod
+    def _render_reports(
+        cls,
+        reports: List[InputConnectReport],
+        artifacts: Sequence[str],
+        template_name: str,
+        cache: Optional[ArtifactCache],
+        workers: Optional[int] = None,
+    ) -> List[Dict[str, bytes]]:
+        """
+        Метод для генерации файлов нескольких отчётов в памяти
+        (см. render_artifacts и render_batch).
+
+        Parameters
+        ----------
+        reports: List[InputConnectReport]
+            Отчёты с одной статистикой по всем вакансиям
+        artifacts: Sequence[str]
+            Какие файлы создать: xlsx, png, pdf
+        template_name: str
+            Путь до файла шаблона pdf
+        cache: Optional[ArtifactCache]
+            Кэш готовых файлов отчёта
+        workers: Optional[int]
+            Количество потоков для excel и pdf
+
+        Raises
+        ------
+        VasyaException
+            Указан неизвестный файл отчёта
+
+        Returns
+        -------
+        List[Dict[str, bytes]]
+            Содержимое файлов по их типам в порядке отчётов
+        """
+
+        if any(i not in cls.artifact_files for i in artifacts):
+            raise VasyaException(
+                f"Файлы отчёта должны быть из: {', '.join(cls.artifact_files)}"
+            )
+
+        results: List[Dict[str, bytes]] = []
+        keys = []
+        for report in reports:
+            key = cls.artifacts_key(report, template_name) if cache else None
+            result = {}
+            if key is not None:
+                needed = list(artifacts)
+                for artifact in needed:
+                    content = cache.get(key, artifact)
+                    if content is not None:
+                        result[artifact] = content
+                    elif artifact == "pdf" and "png" not in needed:
+                        needed.append("png")
+            keys.append(key)
+            results.append(result)
+
+        drawn = [
+            i
+            for i, result in enumerate(results)
+            if "png" not in result and ("png" in artifacts or "pdf" in artifacts)
+        ]
+        images = cls.images_bytes(reports[i] for i in drawn)
+        rendered: List[Dict[str, bytes]] = [{} for _ in reports]
+        futures = []
+        with ThreadPoolExecutor(workers or 2) as executor:
+            for i, (report, result) in enumerate(zip(reports, results)):
+                if "xlsx" in artifacts and "xlsx" not in result:
+                    futures.append(
+                        (i, "xlsx", executor.submit(cls.excel_bytes, report))
+                    )
+                if i in drawn:
+                    result["png"] = rendered[i]["png"] = next(images)
+                if "pdf" in artifacts and "pdf" not in result:
+                    futures.append(
+                        (
+                            i,
+                            "pdf",
+                            executor.submit(
+                                cls.pdf_bytes, report, template_name, result["png"]
+                            ),
+                        )
+                    )
+            for i, artifact, future in futures:
+                results[i][artifact] = rendered[i][artifact] = future.result()
+
+        if cache:
+            for key, contents in zip(keys, rendered):
+                if key is None:
+                    continue
+                for artifact, content in contents.items():
+                    cache.put(key, artifact, content)
+        return [
+            {i: result[i] for i in cls.artifact_files if i in artifacts}
+            for result in results
+        ]
+
+    @classmethod
+    def generate_pdf(
+        cls,
+        input_connect: InputConnectReport,
+        template_name: str,
+        filename: str,
+        image_path: str = "graph.png",
+    ) -> None:
+        """
+        Метод для генерации pdf-файла.
+        Создаёт файл filename в директории, из которой был запущен скрипт.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе данные для построения графика
+        template_name: str
+            Путь до файла шаблона
+        filename: str
+            Название файла
+        image_path: str
+            Путь до созданного изображения с графиками
+        """
+
+        pdfkit.from_string(
+            cls.render_html(input_connect, template_name, path.abspath(image_path)),
+            filename,
+            configuration=cls.pdf_configuration(),
+            options={"enable-local-file-access": True},
+        )
+
+    @classmethod
+    def pdf_bytes(
+        cls, input_connect: InputConnectReport, template_name: str, image: bytes
+    ) -> bytes:
+        """
+        Метод для генерации pdf-файла в памяти. Html передаётся
+        wkhtmltopdf через stdin, pdf читается из stdout.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе данные для построения графика
+        template_name: str
+            Путь до файла шаблона
+        image: bytes
+            Изображение png с графиками
+
+        Returns
+        -------
+        bytes
+            Содержимое pdf-файла
+        """
+
+        image_src = "data:image/png;base64," + base64.b64encode(image).decode("ascii")
+        return pdfkit.from_string(
+            cls.render_html(input_connect, template_name, image_src),
+            False,
+            configuration=cls.pdf_configuration(),
+            options={"quiet": ""},
+        )
+
+    @classmethod
+    def render_html(
+        cls, input_connect: InputConnectReport, template_name: str, image_src: str
+    ) -> str:
+        """
+        Метод для отрисовки html-шаблона отчёта.
+        Шаблон загружается из своей директории, а не из текущей.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе данные для построения графика
+        template_name: str
+            Путь до файла шаблона
+        image_src: str
+            Путь до изображения с графиками или его data URI
+
+        Returns
+        -------
+        str
+            Html отчёта
+        """
+
+        template_path = path.abspath(template_name)
+        env = template_environment(path.dirname(template_path))
+        template = env.get_template(path.basename(template_path))
+        return template.render(cls.get_render_rules(input_connect, image_src))
+
+    @classmethod
+    def pdf_configuration(cls) -> pdfkit.configuration:
+        """
+        Метод для получения настроек wkhtmltopdf.
+
+        Returns
+        -------
+        pdfkit.configuration
+            Настройки с путём до wkhtmltopdf
+        """
+
+        return pdfkit.configuration(wkhtmltopdf=cls.wkhtmltopdf)
+
+    @classmethod
+    def artifacts_key(
+        cls, input_connect: InputConnectReport, template_name: str
+    ) -> Optional[str]:
+        """
+        Метод для получения ключа кэша файлов отчёта: хэша итоговой
+        статистики, шаблона и настроек отрисовки. При изменении
+        отрисовки нужно увеличить artifacts_version.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе статистику
+        template_name: str
+            Путь до файла шаблона pdf
+
+        Returns
+        -------
+        Optional[str]
+            Ключ или None, если часть группировок сброшена на диск
+            и статистику нельзя описать ключом
+        """
+
+        if any(
+            isinstance(i, SpilledResults) for i in input_connect.groups_stats.values()
+        ):
+            return None
+
+        digest = hashlib.sha256()
+        settings = (
+            cls.artifacts_version,
+            matplotlib.__version__,
+            openpyxl.__version__,
+            cls.wkhtmltopdf,
+            input_connect.profession,
+            input_connect.to_dict(),
+        )
+        digest.update(json.dumps(settings, ensure_ascii=False, default=str).encode())
+        try:
+            with open(template_name, "rb") as file:
+                digest.update(file.read())
+        except OSError:
+            pass
+        return digest.hexdigest()
+
+    @classmethod
+    def get_render_rules(
+        cls, input_connect: InputConnectReport, image_src: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Метод для получения правил отрисовки шаблона.
+
+        Parameters
+        ----------
+        input_connect: InputConnectReport
+            Объект, хранящий в себе данные для построения графика
+        image_src: Optional[str]
+            Путь до изображения с графиками или его data URI.
+            По умолчанию graph.png в текущей директории
+
+        Returns
+        -------
+        Dict[str, Any]
+            Словарь с правилами отрисовки
+        """
+
+        rules = {
+            "profession": input_connect.profession,
+            "image_path": image_src or path.abspath("graph.png"),
+        }
+
+        if input_connect.sample is not None:
+            rules["sample_label"] = input_connect.get_sample_label()
+            rules["sample_years"] = [
+                (
+                    i,
+                    *input_connect.get_sample_errors(input_connect.years_stats[i]),
+                    input_connect.years_stats[i].moments.effective_size(),
+                )
+                for i in sorted(input_connect.years_stats)
+            ]
+
+        for i in input_connect.years_stats:
+            rules[f"all_avg_salary{i}"] = input_connect.years_stats[i].salary
+            rules[f"all_count{i}"] = input_connect.years_stats[i].count
+        for i in input_connect.vacancy_stats:
+            rules[f"profession_avg_salary{i}"] = input_connect.vacancy_stats[i].salary
+            rules[f"profession_count{i}"] = input_connect.vacancy_stats[i].count
+
+        cities = input_connect.get_sorted_cities("salary")
+        for n, i in enumerate(cities, start=1):
+            rules[f"table1_city{n}"] = i
+            rules[f"city_salary{n}"] = cities[i].salary
+
+        cities = input_connect.get_sorted_cities("count")
+        for n, i in enumerate(cities, start=1):
+            rules[f"table2_city{n}"] = i
+            rules[f"city_count{n}"] = f"{round(cities[i].count * 100, 2)}%"
+
+        if input_connect.distinct_precision is not None:
+            rules["distinct_names"] = list(input_connect.distinct_fields.values())
+            rules["distinct_years"] = [
+                (
+                    i,
+                    [
+                        input_connect.get_distinct_count(i, key)
+                        for key in input_connect.distinct_fields
+                    ],
+                )
+                for i in sorted(input_connect.years_stats)
+            ]
+
+        return rules
@@ -0,0 +1,1767 @@
+from dataclasses import dataclass, field
+import copy
+import os
+import shutil
+import tempfile
+import weakref
+from pathlib import Path
+from concurrent.futures import as_completed
+
+from .base import InputConnect
+from ..aggregation import GroupBy, Key, Partial, SpilledResults, merge_partials
+from ..aho_corasick import ProfessionMatcher
+from ..backends import Backend, available_backends, get_backend
+from ..cache import ArtifactCache, FileStatsCache
+from ..dataset import DataSet
+from ..errors import VasyaException
+from ..periods import GRANULARITIES, period_key, period_label, rolling_means
+from ..rates import RateTable, load_rates
+from ..sampling import BLOCK_SIZE, ClusterMoments, sample_ranges
+from ..sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple, Union
+
+ARTIFACT_FILES = {"xlsx": "report.xlsx", "png": "graph.png", "pdf": "report.pdf"}
+"""Файлы отчёта по их типам"""
+
+
+@dataclass
+class StatsData:
+    """
+    Класс для хранения данных для отчёта.
+
+    Attributes
+    ----------
+    salary: float
+        Сумма зарплат (после усреднения - средняя зарплата)
+    count: int
+        Количество вакансий (для городов после усреднения - доля вакансий)
+    salaries: Optional[KLLSketch]
+        Квантильный скетч зарплат
+    quantiles: Dict[float, int]
+        Квантили зарплат, посчитанные при усреднении
+    distinct: Dict[str, HyperLogLog]
+        Скетчи уникальных значений полей вакансий (по названию поля)
+    skills: Optional[SpaceSaving]
+        Скетч самых частых ключевых навыков
+    periods: Dict[int, StatsData]
+        Статистика по месяцам или неделям (по ключу периода)
+    squares: float
+        Сумма квадратов зарплат
+    moments: Optional[ClusterMoments]
+        Суммы по блокам выборки для доверительных интервалов
+    """
+
+    salary: float
+    count: int
+    salaries: Optional[KLLSketch] = None
+    quantiles: Dict[float, int] = field(default_factory=dict)
+    distinct: Dict[str, HyperLogLog] = field(default_factory=dict)
+    skills: Optional[SpaceSaving] = None
+    periods: Dict[int, "StatsData"] = field(default_factory=dict)
+    squares: float = 0.0
+    moments: Optional[ClusterMoments] = None
+
+    def copy(self) -> "StatsData":
+        """
+        Метод для копирования объекта.
+
+        Returns
+        -------
+        StatsData
+            Копия объекта
+        """
+
+        return StatsData(
+            self.salary,
+            self.count,
+            self.salaries.copy() if self.salaries is not None else None,
+            dict(self.quantiles),
+            {key: value.copy() for key, value in self.distinct.items()},
+            self.skills.copy() if self.skills is not None else None,
+            {key: value.copy() for key, value in self.periods.items()},
+            self.squares,
+            self.moments.copy() if self.moments is not None else None,
+        )
+
+    def merge(self, other: "StatsData") -> "StatsData":
+        """
+        Метод для добавления к объекту статистики из другого объекта.
+
+        Parameters
+        ----------
+        other: StatsData
+            Добавляемая статистика
+
+        Returns
+        -------
+        StatsData
+            Этот же объект
+        """
+
+        self.salary += other.salary
+        self.count += other.count
+        self.squares += other.squares
+        if other.moments is not None:
+            if self.moments is None:
+                self.moments = other.moments.copy()
+            else:
+                self.moments.merge(other.moments)
+        if other.salaries is not None:
+            if self.salaries is None:
+                self.salaries = other.salaries.copy()
+            else:
+                self.salaries.merge(other.salaries)
+        for key, value in other.distinct.items():
+            if key in self.distinct:
+                self.distinct[key].merge(value)
+            else:
+                self.distinct[key] = value.copy()
+        if other.skills is not None:
+            if self.skills is None:
+                self.skills = other.skills.copy()
+            else:
+                self.skills.merge(other.skills)
+        for key, value in other.periods.items():
+            if key in self.periods:
+                self.periods[key].merge(value)
+            else:
+                self.periods[key] = value.copy()
+        return self
+
+
+def merge_stats(
+    stats: Dict[Hashable, StatsData], other: Dict[Hashable, StatsData]
+) -> None:
+    """
+    Добавляет статистику по ключам (годам или городам) к другой.
+    Статистика с новыми ключами копируется.
+
+    Parameters
+    ----------
+    stats: Dict[Hashable, StatsData]
+        Статистика, к которой добавляется другая
+    other: Dict[Hashable, StatsData]
+        Добавляемая статистика
+    """
+
+    for key, value in other.items():
+        if key in stats:
+            stats[key].merge(value)
+        else:
+            stats[key] = value.copy()
+
+
+class InputConnectReport(InputConnect):
+    """
+    Класс-коннектор для создания отчёта.
+
+    Attributes
+    ----------
+    dir_name: Path
+        Путь до директории с csv файлами
+    professions: List[str]
+        Профессии, по которым будет производиться анализ
+    profession: str
+        Основная (первая) профессия, для которой строятся отчёты
+    years_stats: Dict[int, StatsData]
+        Статистика по годам
+    cities_stats: Dict[str, StatsData]
+        Статистика по городам
+    professions_stats: Dict[str, Dict[int, StatsData]]
+        Статистика по годам для каждой профессии
+    vacancy_stats: Dict[int, StatsData]
+        Статистика по годам по основной профессии
+    total_vacancies: int
+        Общее количество вакансий
+    cache: Optional[FileStatsCache]
+        Кэш частичной статистики по файлам
+    checkpoint: bool
+        Дообрабатывать только дописанный в конец файлов хвост
+    quantiles: Tuple[float, ...]
+        Уровни квантилей зарплат, которые нужно посчитать
+    distinct_precision: Optional[int]
+        Точность скетчей HyperLogLog для уникальных работодателей и городов
+    top_skills: int
+        Количество самых частых навыков в отчёте
+    group_by: Tuple[GroupBy, ...]
+        Дополнительные группировки, которые считаются в том же проходе
+    groups_stats: Dict[str, Union[Dict[Key, Dict[str, Any]], SpilledResults]]
+        Результаты дополнительных группировок по их названиям.
+        Результаты группировок, сброшенных на диск, читаются лениво
+    spill_dir: Optional[str]
+        Временная директория для групп, сброшенных на диск
+    granularity: str
+        Гранулярность временных рядов: year, month или week
+    periods_stats: Dict[int, StatsData]
+        Статистика по месяцам или неделям
+    vacancy_periods_stats: Dict[int, StatsData]
+        Статистика по месяцам или неделям по основной профессии
+    rolling_stats: Dict[int, Dict[int, Tuple[int, float]]]
+        Скользящие средние зарплаты и количества вакансий
+        по размеру окна и ключу периода
+    vacancy_rolling_stats: Dict[int, Dict[int, Tuple[int, float]]]
+        Скользящие средние по основной профессии
+    sample: Optional[float]
+        Доля блоков файлов, которые читаются в предварительном режиме
+    sample_seed: int
+        Зерно выбора блоков
+    sample_moments: Optional[ClusterMoments]
+        Суммы по всем блокам выборки
+    workers: Optional[int]
+        Количество исполнителей для обработки файлов
+    backend: Backend
+        Способ выполнения задач обработки файлов
+    rates: Optional[RateTable]
+        Курсы валют по месяцам для перевода зарплат в рубли
+    chunk_size: Optional[int]
+        Размер частей в байтах, на которые делятся большие файлы
+    artifacts: Tuple[str, ...]
+        Файлы отчёта, которые создаёт get_answer: xlsx, png, pdf
+    artifact_cache: Optional[ArtifactCache]
+        Кэш готовых файлов отчёта
+    """
+
+    distinct_fields = {
+        "employer_name": "Количество работодателей",
+        "area_name": "Количество городов",
+    }
+
+    granularity_names = {"year": "годам", "month": "месяцам", "week": "неделям"}
+
+    rolling_windows = {"year": (), "month": (3, 12), "week": (13, 52)}
+
+    sample_block_size = BLOCK_SIZE
+
+    ReturnType = Tuple[
+        Dict[int, StatsData],
+        Dict[str, StatsData],
+        Dict[str, Dict[int, StatsData]],
+        Dict[str, Partial],
+    ]
+
+    def __init__(
+        self,
+        dir_name: str,
+        profession: Union[str, Sequence[str]],
+        cache_dir: Optional[str] = None,
+        checkpoint: bool = False,
+        quantiles: Sequence[float] = (),
+        distinct_precision: Optional[int] = None,
+        top_skills: int = 0,
+        group_by: Sequence[GroupBy] = (),
+        granularity: str = "year",
+        sample: Optional[float] = None,
+        sample_seed: int = 0,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = 64 << 20,
+        backend: Union[str, Backend] = "process",
+        rates: Union[None, bool, str, RateTable] = None,
+        artifacts: Sequence[str] = ("xlsx", "png", "pdf"),
+        artifact_cache_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        dir_name: str
+            Путь до директории с csv файлами в формате name_year.csv
+            или до одного csv файла. Год каждой вакансии берётся
+            из даты публикации, поэтому файл может содержать несколько лет
+        profession: Union[str, Sequence[str]]
+            Профессия или список профессий, по которым будет производиться
+            анализ. Все профессии считаются за один проход по данным
+        cache_dir: Optional[str]
+            Путь до директории с кэшем частичной статистики по файлам.
+            Если не указан, то кэш не используется
+        checkpoint: bool
+            Запоминать в кэше позицию, до которой обработан каждый файл,
+            и при следующем запуске обрабатывать только дописанные строки.
+            Если начало файла изменилось, файл обрабатывается заново
+        quantiles: Sequence[float]
+            Уровни квантилей зарплат (например, 0.1, 0.5, 0.9), которые нужно
+            посчитать по годам, городам и профессиям. Квантили оцениваются
+            по скетчам KLL, которые строятся для каждого файла и объединяются.
+            Если не указаны, то считаются только средние зарплаты
+        distinct_precision: Optional[int]
+            Точность (от 4 до 18) скетчей HyperLogLog, по которым оценивается
+            количество уникальных работодателей и городов по годам.
+            Скетч занимает 2 ** distinct_precision байт на год.
+            Если не указана, то уникальные значения не считаются
+        top_skills: int
+            Количество самых частых ключевых навыков по годам и для выбранной
+            профессии. Частоты оцениваются скетчами Space-Saving
+            на 50 * top_skills счётчиков с известной погрешностью.
+            Если 0, то навыки не считаются
+        group_by: Sequence[GroupBy]
+            Дополнительные группировки (например, город и год, опыт работы,
+            валюта или работодатель) с произвольными мерами. Они считаются
+            в том же параллельном проходе по файлам, что и основная статистика.
+            Группировки с max_groups сбрасывают лишние группы во временную
+            директорию, которая удаляется вместе с объектом. У исполнителей
+            распределённой обработки своя временная директория, и группы
+            загружаются из неё в память перед отправкой координатору
+        granularity: str
+            Гранулярность временных рядов: year, month или week.
+            Для month и week в том же проходе считаются зарплаты
+            и количество вакансий по месяцам или неделям и скользящие
+            средние за 3 и 12 месяцев (13 и 52 недели). Период вакансии
+            определяется по строке даты без создания datetime
+        sample: Optional[float]
+            Доля блоков (от 0 до 1) для предварительного отчёта. Каждый файл
+            делится на блоки по sample_block_size байт, и читаются только
+            систематически выбранные блоки. Количества вакансий пересчитываются
+            на весь файл, для зарплат и количеств считаются 95% доверительные
+            интервалы и эффективный размер выборки, а отчёты помечаются
+            как приблизительные. Если не указана, то читаются все данные
+        sample_seed: int
+            Зерно выбора блоков для предварительного отчёта
+        workers: Optional[int]
+            Количество исполнителей для обработки файлов.
+            По умолчанию равно количеству процессоров
+        chunk_size: Optional[int]
+            Файлы больше chunk_size байт делятся на части по границам строк,
+            и части обрабатываются параллельно. Задачи раздаются процессам
+            от больших к меньшим, а результаты объединяются по мере готовности.
+            Если None, то файлы не делятся
+        backend: Union[str, Backend]
+            Способ выполнения задач: inline (последовательно), thread,
+            process, interpreter (Python 3.14+), free-threaded (сборка
+            без GIL) или auto. Результат не зависит от способа
+        rates: Union[None, bool, str, RateTable]
+            Курсы валют по месяцам для перевода зарплат в рубли по курсу
+            месяца публикации: таблица курсов, путь до csv файла с курсами
+            или True для курсов ЦБ из extra/rates.csv. Таблица загружается
+            один раз, перевод стоит одно обращение к массиву на вакансию.
+            Если не указаны, то используются постоянные курсы currency_dict
+        artifacts: Sequence[str]
+            Файлы отчёта, которые создаёт get_answer: xlsx (таблица),
+            png (графики) и pdf (графики и таблицы)
+        artifact_cache_dir: Optional[str]
+            Путь до директории с кэшем готовых файлов отчёта. Если статистика,
+            шаблон и настройки отрисовки не изменились, то файлы берутся
+            из кэша без отрисовки. Если не указан, то кэш не используется
+
+        Raises
+        ------
+        VasyaException
+            Режим checkpoint включён без директории с кэшем
+            или не указано ни одной профессии, или уровень квантиля
+            вне отрезка [0, 1], или точность HyperLogLog вне диапазона,
+            или названия группировок повторяются, или группировки
+            со сбросом на диск используются вместе с кэшем,
+            или неизвестная гранулярность, или доля выборки вне (0, 1],
+            или выборка используется в режиме checkpoint,
+            или количество процессов или размер части не положительные,
+            или способ выполнения неизвестен или недоступен,
+            или указан неизвестный файл отчёта
+        """
+        if checkpoint and not cache_dir:
+            raise VasyaException("Для режима checkpoint нужна директория с кэшем")
+
+        if isinstance(profession, str):
+            profession = [profession]
+        if not profession:
+            raise VasyaException("Не указано ни одной профессии")
+        if any(not 0 <= q <= 1 for q in quantiles):
+            raise VasyaException("Уровень квантиля должен быть от 0 до 1")
+        if distinct_precision is not None and not 4 <= distinct_precision <= 18:
+            raise VasyaException("Точность HyperLogLog должна быть от 4 до 18")
+        if sample is not None and not 0 < sample <= 1:
+            raise VasyaException("Доля выборки должна быть от 0 до 1")
+        if sample is not None and checkpoint:
+            raise VasyaException("Режим checkpoint нельзя использовать с выборкой")
+        if workers is not None and workers < 1:
+            raise VasyaException("Количество процессов должно быть положительным")
+        if chunk_size is not None and chunk_size < 1:
+            raise VasyaException("Размер части должен быть положительным")
+        if granularity not in GRANULARITIES:
+            raise VasyaException(
+                f"Гранулярность должна быть одной из: {', '.join(GRANULARITIES)}"
+            )
+        if any(i not in ARTIFACT_FILES for i in artifacts):
+            raise VasyaException(
+                f"Файлы отчёта должны быть из: {', '.join(ARTIFACT_FILES)}"
+            )
+
+        self.dir_name = Path(dir_name)
+        self.professions = list(dict.fromkeys(profession))
+        self.profession = self.professions[0]
+        self.cache = FileStatsCache(cache_dir) if cache_dir else None
+        self.checkpoint = checkpoint
+        self.quantiles = tuple(quantiles)
+        self.distinct_precision = distinct_precision
+        self.top_skills = top_skills
+        self.group_by = tuple(group_by)
+        self.granularity = granularity
+        self.sample = sample
+        self.sample_seed = sample_seed
+        self.workers = workers
+        self.backend = get_backend(backend, workers)
+        if rates is True:
+            rates = load_rates()
+        elif isinstance(rates, str):
+            rates = load_rates(rates)
+        self.rates: Optional[RateTable] = rates or None
+        self.chunk_size = chunk_size
+        self.artifacts = tuple(artifacts)
+        self.artifact_cache = (
+            ArtifactCache(artifact_cache_dir) if artifact_cache_dir else None
+        )
+        if len({i.name for i in self.group_by}) != len(self.group_by):
+            raise VasyaException("Названия группировок должны быть уникальными")
+
+        self.spill_dir: Optional[str] = None
+        if any(i.max_groups is not None for i in self.group_by):
+            if self.cache:
+                raise VasyaException(
+                    "Группировки со сбросом на диск нельзя использовать с кэшем"
+                )
+            self.spill_dir = tempfile.mkdtemp(prefix="vasya-spill-")
+            weakref.finalize(self, shutil.rmtree, self.spill_dir, True)
+
+        self.years_stats: Dict[int, StatsData] = {}
+        self.cities_stats: Dict[str, StatsData] = {}
+        self._proc_cities_stats: List[Dict[str, StatsData]] = []
+        self.professions_stats: Dict[str, Dict[int, StatsData]] = {
+            profession: {} for profession in self.professions
+        }
+        self.vacancy_stats = self.professions_stats[self.profession]
+        self._proc_groups_stats: List[Dict[str, Partial]] = []
+        self.groups_stats: Dict[
+            str, Union[Dict[Key, Dict[str, Any]], SpilledResults]
+        ] = {}
+        self.periods_stats: Dict[int, StatsData] = {}
+        self.vacancy_periods_stats: Dict[int, StatsData] = {}
+        self.rolling_stats: Dict[int, Dict[int, Tuple[int, float]]] = {}
+        self.vacancy_rolling_stats: Dict[int, Dict[int, Tuple[int, float]]] = {}
+        self.sample_moments: Optional[ClusterMoments] = None
+        self.total_vacancies = 0
+
+    @classmethod
+    def from_input(cls) -> "InputConnectReport":
+        """
+        Метод для создания объекта класса по вводу пользователя.
+
+        Returns
+        -------
+        InputConnectReport
+            Объект класса
+        """
+        dir_name = input("Введите путь до директории с файлами csv или до файла csv: ")
+        professions = input("Введите название профессии: ").split(", ")
+        backend = input(
+            f"Введите способ обработки ({' / '.join(available_backends())}): "
+        )
+        artifacts = input(f"Введите файлы отчёта ({', '.join(ARTIFACT_FILES)}): ")
+
+        return cls(
+            dir_name,
+            professions,
+            backend=backend or "process",
+            artifacts=artifacts.split(", ") if artifacts else ARTIFACT_FILES,
+        )
+
+    def get_files(self) -> List[Path]:
+        """
+        Метод для получения списка обрабатываемых файлов.
+        Если указан путь до файла, то обрабатывается только он,
+        иначе все файлы директории в формате name_year.csv.
+
+        Returns
+        -------
+        List[Path]
+            Пути до файлов
+        """
+
+        if self.dir_name.is_file():
+            return [self.dir_name]
+
+        files: List[Path] = []
+        for file_name in self.dir_name.glob("*.csv"):
+            try:
+                int(file_name.stem.rsplit("_", 1)[1])
+            except (ValueError, IndexError):
+                print(
+                    f"Пропускаем файл: {file_name} - "
+                    "должен быть в формате name_year.csv (например: data_2020.csv)"
+                )
+                continue
+
+            files.append(file_name)
+        return files
+
+    def prepare_data(self) -> None:
+        """
+        Метод для подготовки данных для отчёта.
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет данных
+        """
+
+        files = self.get_files()
+        results = self._collect_results(files)
+
+        for result_filename in files:
+            years_stats, cities_stats, vacancy_stats, groups_stats = results[
+                result_filename
+            ]
+            merge_stats(self.years_stats, years_stats)
+            self._proc_cities_stats.append(cities_stats)
+            for profession, stats in vacancy_stats.items():
+                merge_stats(self.professions_stats[profession], stats)
+            self._proc_groups_stats.append(groups_stats)
+
+        self.make_stats_as_average()
+
+    def _collect_results(self, files: List[Path]) -> Dict[Path, Any]:
+        """
+        Метод для получения статистики по каждому файлу: из кэша,
+        если она там есть, иначе обработкой файлов или их частей.
+
+        Parameters
+        ----------
+        files: List[Path]
+            Пути до файлов
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет данных
+
+        Returns
+        -------
+        Dict[Path, Any]
+            Статистика по файлам
+        """
+
+        results: Dict[Path, Any] = {}
+        if self.cache:
+            for file_name in files:
+                cached = self.cache.get(file_name, self._cache_key)
+                if cached is not None:
+                    results[file_name] = cached
+
+        tasks = self._make_tasks(
+            [file_name for file_name in files if file_name not in results]
+        )
+        if tasks:
+            split_files = {
+                file_name for file_name, start, _, _ in tasks if start is not None
+            }
+            with self.backend.executor() as executor:
+                futures = [
+                    executor.submit(self.process_file, file_name, start, end)
+                    for file_name, start, end, _ in tasks
+                ]
+                for future in as_completed(futures):
+                    result, result_filename = future.result()
+                    if result_filename in results:
+                        self._merge_results(results[result_filename], result)
+                    else:
+                        results[result_filename] = result
+
+            if self.cache:
+                for file_name in split_files:
+                    self.cache.put(file_name, self._cache_key, results[file_name])
+
+        return results
+
+    def _make_tasks(
+        self, files: List[Path]
+    ) -> List[Tuple[Path, Optional[int], Optional[int], int]]:
+        """
+        Метод для составления задач обработки файлов.
+        Файлы больше chunk_size делятся на части по границам строк
+        (кроме режимов checkpoint и выборки). Задачи упорядочены
+        от больших к меньшим, чтобы большой файл не обрабатывался последним.
+
+        Parameters
+        ----------
+        files: List[Path]
+            Пути до файлов
+
+        Returns
+        -------
+        List[Tuple[Path, Optional[int], Optional[int], int]]
+            Путь до файла, начало и конец части (None для целого файла)
+            и размер задачи в байтах
+        """
+
+        tasks: List[Tuple[Path, Optional[int], Optional[int], int]] = []
+        for file_name in files:
+            size = os.path.getsize(file_name)
+            if (
+                self.chunk_size is None
+                or size <= self.chunk_size
+                or self.checkpoint
+                or self.sample is not None
+            ):
+                tasks.append((file_name, None, None, size))
+                continue
+
+            for start, end in DataSet.split(str(file_name), self.chunk_size):
+                tasks.append(
+                    (file_name, start, end, (size if end is None else end) - start)
+                )
+
+        tasks.sort(key=lambda task: task[3], reverse=True)
+        return tasks
+
+    def _merge_results(self, result: ReturnType, other: ReturnType) -> ReturnType:
+        """
+        Метод для объединения статистики по частям одного файла.
+
+        Parameters
+        ----------
+        result: ReturnType
+            Статистика, к которой добавляется другая
+        other: ReturnType
+            Добавляемая статистика
+
+        Returns
+        -------
+        ReturnType
+            Объединённая статистика (первый аргумент)
+        """
+
+        years_stats, cities_stats, vacancy_stats, groups_stats = result
+        merge_stats(years_stats, other[0])
+        merge_stats(cities_stats, other[1])
+        for profession, stats in other[2].items():
+            merge_stats(vacancy_stats[profession], stats)
+        for group_by in self.group_by:
+            groups_stats[group_by.name] = group_by.merge(
+                groups_stats[group_by.name], other[3][group_by.name]
+            )
+        return result
+
+    def _new_result(self) -> ReturnType:
+        """
+        Метод для создания пустой статистики по файлу.
+
+        Returns
+        -------
+        ReturnType
+            Пустая статистика по годам, городам, профессиям и группировкам
+        """
+
+        return (
+            {},
+            {},
+            {profession: {} for profession in self.professions},
+            {i.name: i.new_partial(self.spill_dir) for i in self.group_by},
+        )
+
+    def process_file(
+        self, file_name: Path, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Tuple[ReturnType, Path]:
+        """
+        Метод для обработки файла или его части.
+
+        Parameters
+        ----------
+        file_name: Path
+            Путь до файла
+        start: Optional[int]
+            Позиция начала части в байтах (начало строки).
+            Если None, то обрабатывается весь файл
+        end: Optional[int]
+            Позиция конца части в байтах. Если None, то до конца файла
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет данных
+
+        Returns
+        -------
+        Tuple[ReturnType, Path]
+            Итоговая статистика по файлу, путь до файла
+        """
+
+        if self.spill_dir is None or not self.backend.remote:
+            return self._process_file(file_name, start, end)
+
+        # Исполнитель может работать на другой машине, где нет директории
+        # координатора: группы сбрасываются во временную директорию
+        # исполнителя и загружаются в память перед отправкой результата
+        spill_dir = self.spill_dir
+        try:
+            with tempfile.TemporaryDirectory(prefix="vasya-spill-") as worker_dir:
+                self.spill_dir = worker_dir
+                result, file_name = self._process_file(file_name, start, end)
+                for group_by in self.group_by:
+                    partial = result[3][group_by.name]
+                    group_by.load(partial)
+                    partial.spill_dir = spill_dir
+        finally:
+            self.spill_dir = spill_dir
+        return result, file_name
+
+    def _process_file(
+        self, file_name: Path, start: Optional[int], end: Optional[int]
+    ) -> Tuple[ReturnType, Path]:
+        """
+        Метод для обработки файла или его части (см. process_file)
+        с директорией для сброса групп spill_dir.
+
+        Parameters
+        ----------
+        file_name: Path
+            Путь до файла
+        start: Optional[int]
+            Позиция начала части в байтах (начало строки)
+        end: Optional[int]
+            Позиция конца части в байтах
+
+        Returns
+        -------
+        Tuple[ReturnType, Path]
+            Итоговая статистика по файлу, путь до файла
+        """
+
+        if self.checkpoint:
+            return self._process_file_tail(file_name), file_name
+        if self.sample is not None:
+            return self._process_file_sample(file_name), file_name
+
+        result = self._new_result()
+
+        if start is None:
+            vacancies = DataSet.from_file(file_name, rates=self.rates)
+            vacancies.to_list()
+        else:
+            vacancies = DataSet.from_file(file_name, start, end, self.rates)
+
+        self._count_vacancies(vacancies, *result)
+        for group_by in self.group_by:
+            group_by.finish(result[3][group_by.name])
+        if self.cache and start is None:
+            self.cache.put(file_name, self._cache_key, result)
+        return result, file_name
+
+    @property
+    def _cache_key(self) -> Tuple[Any, ...]:
+        """
+        Ключ параметров обработки для кэша частичной статистики.
+        """
+
+        return (
+            tuple(self.professions),
+            bool(self.quantiles),
+            self.distinct_precision,
+            self.top_skills,
+            tuple(i.key for i in self.group_by),
+            self.granularity,
+            self.sample,
+            self.sample_seed,
+            self.sample_block_size if self.sample is not None else None,
+            self.rates.digest if self.rates is not None else None,
+        )
+
+    def _new_stats(self, with_distinct: bool = False) -> StatsData:
+        """
+        Метод для создания пустой статистики.
+
+        Parameters
+        ----------
+        with_distinct: bool
+            Добавить скетчи уникальных значений и навыков, если они нужны
+
+        Returns
+        -------
+        StatsData
+            Пустая статистика, со скетчем зарплат, если нужны квантили
+        """
+
+        stats = StatsData(0, 0, KLLSketch() if self.quantiles else None)
+        if with_distinct and self.distinct_precision is not None:
+            stats.distinct = {
+                key: HyperLogLog(self.distinct_precision)
+                for key in self.distinct_fields
+            }
+        if with_distinct and self.top_skills:
+            stats.skills = SpaceSaving(self.top_skills * 50)
+        return stats
+
+    def _process_file_tail(self, file_name: Path) -> ReturnType:
+        """
+        Метод для обработки файла с места, на котором
+        остановилась предыдущая обработка.
+
+        Parameters
+        ----------
+        file_name: Path
+            Путь до файла
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет данных
+
+        Returns
+        -------
+        ReturnType
+            Итоговая статистика по файлу
+        """
+
+        start = 0
+        result = self._new_result()
+
+        checkpoint = self.cache.get_checkpoint(file_name, self._cache_key)
+        if checkpoint is not None:
+            start, result = checkpoint
+
+        end = DataSet.rows_end(file_name, start)
+        if end > start:
+            vacancies = DataSet.from_file(file_name, start, end, self.rates)
+            self._count_vacancies(vacancies, *result)
+
+        self.cache.put(file_name, self._cache_key, result, end)
+        return result
+
+    def _process_file_sample(self, file_name: Path) -> ReturnType:
+        """
+        Метод для обработки выбранных блоков файла.
+        Каждый блок сначала считается отдельно, чтобы запомнить
+        суммы по блокам для доверительных интервалов.
+
+        Parameters
+        ----------
+        file_name: Path
+            Путь до файла
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет данных
+
+        Returns
+        -------
+        ReturnType
+            Статистика по выборке из файла
+        """
+
+        result = self._new_result()
+        years_stats, cities_stats, vacancy_stats, groups_stats = result
+
+        ranges, population = sample_ranges(
+            str(file_name), self.sample, self.sample_block_size, self.sample_seed
+        )
+        for start, end in ranges:
+            block_years = self._block_views(years_stats)
+            block_cities = self._block_views(cities_stats)
+            block_vacancy = {
+                profession: self._block_views(stats)
+                for profession, stats in vacancy_stats.items()
+            }
+            self._count_vacancies(
+                DataSet.from_file(str(file_name), start, end, self.rates),
+                block_years,
+                block_cities,
+                block_vacancy,
+                groups_stats,
+            )
+
+            self._add_block(years_stats, block_years)
+            self._add_block(cities_stats, block_cities)
+            for profession, stats in vacancy_stats.items():
+                self._add_block(stats, block_vacancy[profession])
+
+        for stats in (
+            *years_stats.values(),
+            *cities_stats.values(),
+            *(i for stats in vacancy_stats.values() for i in stats.values()),
+        ):
+            stats.moments.blocks = len(ranges)
+            stats.moments.population = population
+
+        for group_by in self.group_by:
+            group_by.finish(groups_stats[group_by.name])
+        if self.cache:
+            self.cache.put(file_name, self._cache_key, result)
+        return result
+
+    @staticmethod
+    def _block_views(stats: Dict[Hashable, StatsData]) -> Dict[Hashable, StatsData]:
+        """
+        Метод для создания пустой статистики блока, которая
+        пополняет скетчи и периоды статистики файла.
+
+        Parameters
+        ----------
+        stats: Dict[Hashable, StatsData]
+            Статистика файла
+
+        Returns
+        -------
+        Dict[Hashable, StatsData]
+            Статистика блока с общими скетчами
+        """
+
+        return {
+            key: StatsData(
+                0,
+                0,
+                value.salaries,
+                distinct=value.distinct,
+                skills=value.skills,
+                periods=value.periods,
+            )
+            for key, value in stats.items()
+        }
+
+    @staticmethod
+    def _add_block(
+        stats: Dict[Hashable, StatsData], block: Dict[Hashable, StatsData]
+    ) -> None:
+        """
+        Метод для добавления статистики блока к статистике файла.
+
+        Parameters
+        ----------
+        stats: Dict[Hashable, StatsData]
+            Статистика файла
+        block: Dict[Hashable, StatsData]
+            Статистика блока
+        """
+
+        for key, value in block.items():
+            target = stats.get(key)
+            if target is None:
+                target = stats[key] = StatsData(
+                    0,
+                    0,
+                    value.salaries,
+                    distinct=value.distinct,
+                    skills=value.skills,
+                    periods=value.periods,
+                    moments=ClusterMoments(),
+                )
+            target.salary += value.salary
+            target.count += value.count
+            target.squares += value.squares
+            target.moments.add_block(value.salary, value.count, value.squares)
+
+    def _count_vacancies(
+        self,
+        vacancies: DataSet,
+        years_stats: Dict[int, StatsData],
+        cities_stats: Dict[str, StatsData],
+        vacancy_stats: Dict[str, Dict[int, StatsData]],
+        groups_stats: Dict[str, Partial],
+    ) -> None:
+        """
+        Метод для подсчёта статистики по вакансиям.
+        Год берётся из даты публикации каждой вакансии.
+
+        Parameters
+        ----------
+        vacancies: DataSet
+            Датасет с вакансиями
+        years_stats: Dict[int, StatsData]
+            Статистика по годам
+        cities_stats: Dict[str, StatsData]
+            Статистика по городам
+        vacancy_stats: Dict[str, Dict[int, StatsData]]
+            Статистика по годам для каждой профессии
+        groups_stats: Dict[str, Partial]
+            Частичные результаты дополнительных группировок
+        """
+
+        def increment_and_add(data: StatsData, value: float) -> StatsData:
+            data.salary += value
+            data.count += 1
+            data.squares += value * value
+            if data.salaries is not None:
+                data.salaries.update(value)
+
+        def add_to_period(data: StatsData, period: int, value: float) -> None:
+            period_stats = data.periods.get(period)
+            if period_stats is None:
+                period_stats = data.periods[period] = StatsData(0, 0)
+            period_stats.salary += value
+            period_stats.count += 1
+
+        granularity = self.granularity if self.granularity != "year" else None
+        matcher = ProfessionMatcher(self.professions)
+        groups = [(i, groups_stats[i.name]) for i in self.group_by]
+
+        current_year = None
+        for vacancy in vacancies:
+            year = int(vacancy.published_at_raw[:4])
+            if year != current_year:
+                current_year = year
+                year_stats = years_stats.get(year)
+                if year_stats is None:
+                    year_stats = years_stats[year] = self._new_stats(True)
+                year_professions = {}
+                for profession, stats in vacancy_stats.items():
+                    if year not in stats:
+                        stats[year] = self._new_stats(True)
+                    year_professions[profession] = stats[year]
+                distinct = tuple(year_stats.distinct.items())
+                year_skills = year_stats.skills
+
+            city_stats = cities_stats.get(vacancy.area_name)
+            if city_stats is None:
+                city_stats = cities_stats[vacancy.area_name] = self._new_stats()
+
+            increment_and_add(year_stats, vacancy.salary_rub)
+            increment_and_add(city_stats, vacancy.salary_rub)
+
+            for key, sketch in distinct:
+                value = getattr(vacancy, key)
+                if value:
+                    sketch.add(value)
+
+            professions = matcher.match(vacancy.name)
+            for profession in professions:
+                increment_and_add(year_professions[profession], vacancy.salary_rub)
+
+            if granularity is not None:
+                period = period_key(vacancy.published_at_raw, granularity)
+                add_to_period(year_stats, period, vacancy.salary_rub)
+                for profession in professions:
+                    add_to_period(
+                        year_professions[profession], period, vacancy.salary_rub
+                    )
+
+            if year_skills is not None and vacancy.key_skills:
+                for skill in vacancy.key_skills:
+                    year_skills.add(skill)
+                    for profession in professions:
+                        year_professions[profession].skills.add(skill)
+
+            for group_by, partial in groups:
+                group_by.update(partial, vacancy)
+
+    def make_stats_as_average(self) -> None:
+        """
+        Метод для конвертации существующей статистики в среднюю зарплату.
+        """
+
+        # Файлы и их части объединяются в порядке завершения обработки,
+        # поэтому годы упорядочиваются здесь (словари меняются на месте:
+        # vacancy_stats - ссылка на статистику одной из профессий)
+        for stats in (self.years_stats, *self.professions_stats.values()):
+            years = sorted(stats.items())
+            stats.clear()
+            stats.update(years)
+
+        self._make_periods_stats()
+
+        if self.sample is not None:
+            self.sample_moments = ClusterMoments()
+            for stats in self.years_stats.values():
+                self.sample_moments.merge(stats.moments)
+
+        for year in self.years_stats:
+            self.years_stats[year].salary = int(
+                self.years_stats[year].salary // self.years_stats[year].count
+            )
+            self.years_stats[year].count = self._sample_count(self.years_stats[year])
+            self.total_vacancies += self.years_stats[year].count
+            self._set_quantiles(self.years_stats[year])
+
+        for cities_stats in self._proc_cities_stats:
+            for key, value in cities_stats.items():
+                if self.cities_stats.get(key):
+                    self.cities_stats[key].merge(value)
+                else:
+                    self.cities_stats[key] = value.copy()
+
+        for city in tuple(self.cities_stats):
+            percent_count = round(
+                self._sample_count(self.cities_stats[city]) / self.total_vacancies, 4
+            )
+            if percent_count < 0.01:
+                self.cities_stats.pop(city)
+            else:
+                self.cities_stats[city].salary = int(
+                    self.cities_stats[city].salary // self.cities_stats[city].count
+                )
+                self.cities_stats[city].count = percent_count
+                self._set_quantiles(self.cities_stats[city])
+
+        for vacancy_stats in self.professions_stats.values():
+            for year in vacancy_stats:
+                if vacancy_stats[year].count:
+                    vacancy_stats[year].salary = int(
+                        vacancy_stats[year].salary // vacancy_stats[year].count
+                    )
+                    vacancy_stats[year].count = self._sample_count(vacancy_stats[year])
+                    self._set_quantiles(vacancy_stats[year])
+
+        partials = merge_partials(
+            self.group_by, self._proc_groups_stats, self.spill_dir
+        )
+        for group_by in self.group_by:
+            self.groups_stats[group_by.name] = group_by.results(partials[group_by.name])
+
+    def _make_periods_stats(self) -> None:
+        """
+        Метод для объединения статистики по месяцам или неделям из всех файлов
+        и подсчёта скользящих средних.
+        """
+
+        self.periods_stats, self.rolling_stats = self._merge_periods(self.years_stats)
+        self.vacancy_periods_stats, self.vacancy_rolling_stats = self._merge_periods(
+            self.vacancy_stats
+        )
+
+    def _merge_periods(
+        self, source: Dict[int, StatsData]
+    ) -> Tuple[Dict[int, StatsData], Dict[int, Dict[int, Tuple[int, float]]]]:
+        """
+        Метод для объединения статистики по месяцам или неделям всех лет.
+        При выборке количества вакансий за периоды пересчитываются на все
+        блоки так же, как количества за их год (см. _sample_count).
+
+        Parameters
+        ----------
+        source: Dict[int, StatsData]
+            Статистика по годам с суммами по периодам
+
+        Returns
+        -------
+        Tuple[Dict[int, StatsData], Dict[int, Dict[int, Tuple[int, float]]]]
+            Средние по периодам и скользящие средние по размеру окна
+        """
+
+        target: Dict[int, StatsData] = {}
+        # Суммы зарплат и количества, пересчитанные на все блоки года
+        totals: Dict[int, Tuple[float, float]] = {}
+        for year in sorted(source):
+            moments = source[year].moments
+            scale = moments.scale if moments is not None else 1
+            for period, stats in source[year].periods.items():
+                salary, count = totals.get(period, (0, 0))
+                totals[period] = (
+                    salary + stats.salary * scale,
+                    count + stats.count * scale,
+                )
+                if period in target:
+                    target[period].merge(stats)
+                else:
+                    target[period] = stats.copy()
+
+        sorted_periods = sorted(target)
+        totals = {i: totals[i] for i in sorted_periods}
+        periods = {}
+        for period in sorted_periods:
+            stats = target[period]
+            periods[period] = StatsData(
+                int(stats.salary // stats.count), round(totals[period][1])
+            )
+        rolling = {
+            window: rolling_means(totals, window)
+            for window in self.rolling_windows[self.granularity]
+        }
+        return periods, rolling
+
+    def for_profession(self, profession: str) -> "InputConnectReport":
+        """
+        Метод для получения отчёта по другой из посчитанных профессий.
+        Возвращает копию, у которой основная профессия - profession.
+        Статистика не копируется и не пересчитывается.
+
+        Parameters
+        ----------
+        profession: str
+            Профессия из professions
+
+        Raises
+        ------
+        VasyaException
+            Профессия не посчитана в этом отчёте
+
+        Returns
+        -------
+        InputConnectReport
+            Отчёт по профессии
+        """
+
+        if profession not in self.professions_stats:
+            raise VasyaException(f"Профессия не посчитана в отчёте: {profession}")
+        report = copy.copy(self)
+        report.profession = profession
+        report.vacancy_stats = self.professions_stats[profession]
+        if self.granularity != "year":
+            report.vacancy_periods_stats, report.vacancy_rolling_stats = (
+                self._merge_periods(report.vacancy_stats)
+            )
+        return report
+
+    def for_professions(self, professions: Sequence[str]) -> "InputConnectReport":
+        """
+        Метод для получения отчёта по части посчитанных профессий,
+        такого же, как отчёт, посчитанный только по ним.
+        Основная профессия - первая из professions.
+
+        Parameters
+        ----------
+        professions: Sequence[str]
+            Профессии из professions
+
+        Raises
+        ------
+        VasyaException
+            Профессия не посчитана в этом отчёте
+
+        Returns
+        -------
+        InputConnectReport
+            Отчёт по профессиям
+        """
+
+        missing = [i for i in professions if i not in self.professions_stats]
+        if missing or not professions:
+            raise VasyaException(
+                f"Профессия не посчитана в отчёте: {', '.join(missing)}"
+            )
+        report = self.for_profession(professions[0])
+        report.professions = list(professions)
+        report.professions_stats = {i: self.professions_stats[i] for i in professions}
+        return report
+
+    @staticmethod
+    def _sample_count(stats: StatsData) -> int:
+        """
+        Метод для пересчёта количества вакансий в выборке
+        на все блоки файлов.
+
+        Parameters
+        ----------
+        stats: StatsData
+            Статистика
+
+        Returns
+        -------
+        int
+            Оценка количества вакансий (без выборки - само количество)
+        """
+
+        if stats.moments is None:
+            return stats.count
+        return round(stats.count * stats.moments.scale)
+
+    def get_sample_errors(
+        self, stats: StatsData
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Метод для получения половин ширины 95% доверительных интервалов
+        средней зарплаты и количества вакансий.
+
+        Parameters
+        ----------
+        stats: StatsData
+            Статистика по выборке
+
+        Returns
+        -------
+        Tuple[Optional[int], Optional[int]]
+            Погрешности средней зарплаты и количества вакансий
+            или None, если их нельзя оценить
+        """
+
+        if stats.moments is None:
+            return None, None
+
+        salary_error = stats.moments.mean_error()
+        count_error = stats.moments.total_error()
+        return (
+            round(salary_error) if salary_error is not None else None,
+            round(count_error) if count_error is not None else None,
+        )
+
+    def get_sample_label(self) -> str:
+        """
+        Метод для получения подписи предварительного отчёта.
+
+        Returns
+        -------
+        str
+            Подпись с долей прочитанных блоков
+        """
+
+        return (
+            f"Предварительный отчёт по выборке {self.sample * 100:g}% блоков данных: "
+            "значения приблизительные, погрешности - 95% доверительные интервалы"
+        )
+
+    def _set_quantiles(self, stats: StatsData) -> None:
+        """
+        Метод для подсчёта квантилей зарплат по скетчу статистики.
+
+        Parameters
+        ----------
+        stats: StatsData
+            Статистика со скетчем зарплат
+        """
+
+        if stats.salaries is not None and stats.salaries.count:
+            stats.quantiles = {
+                q: int(stats.salaries.quantile(q)) for q in self.quantiles
+            }
+
+    def print_answer(self) -> None:
+        """
+        Метод для вывода ответа в консоль.
+        """
+
+        if self.sample is not None:
+            print(self.get_sample_label())
+
+        print(
+            "Динамика уровня зарплат по годам:",
+            {year: self.years_stats[year].salary for year in self.years_stats},
+        )
+        print(
+            "Динамика количества вакансий по годам:",
+            {year: self.years_stats[year].count for year in self.years_stats},
+        )
+
+        print(
+            "Динамика уровня зарплат по годам для выбранной профессии:",
+            {year: self.vacancy_stats[year].salary for year in self.vacancy_stats},
+        )
+        print(
+            "Динамика количества вакансий по годам для выбранной профессии:",
+            {year: self.vacancy_stats[year].count for year in self.vacancy_stats},
+        )
+
+        for profession in self.professions[1:]:
+            vacancy_stats = self.professions_stats[profession]
+            print(
+                f"Динамика уровня зарплат по годам для профессии {profession}:",
+                {year: vacancy_stats[year].salary for year in vacancy_stats},
+            )
+            print(
+                f"Динамика количества вакансий по годам для профессии {profession}:",
+                {year: vacancy_stats[year].count for year in vacancy_stats},
+            )
+
+        if self.granularity != "year":
+            names = self.granularity_names[self.granularity]
+            for suffix, periods_stats, rolling_stats in (
+                ("", self.periods_stats, self.rolling_stats),
+                (
+                    " для выбранной профессии",
+                    self.vacancy_periods_stats,
+                    self.vacancy_rolling_stats,
+                ),
+            ):
+                print(
+                    f"Динамика уровня зарплат по {names}{suffix}:",
+                    {
+                        self.get_period_label(period): stats.salary
+                        for period, stats in periods_stats.items()
+                    },
+                )
+                print(
+                    f"Динамика количества вакансий по {names}{suffix}:",
+                    {
+                        self.get_period_label(period): stats.count
+                        for period, stats in periods_stats.items()
+                    },
+                )
+                for window, rolling in rolling_stats.items():
+                    print(
+                        f"Скользящая средняя зарплата по {names} "
+                        f"(окно {window}){suffix}:",
+                        {
+                            self.get_period_label(period): salary
+                            for period, (salary, _) in rolling.items()
+                        },
+                    )
+
+        cities_sorted = sorted(
+            self.cities_stats,
+            key=lambda x: self.cities_stats[x].salary,
+            reverse=True,
+        )[:10]
+        print(
+            "Уровень зарплат по городам (в порядке убывания):",
+            {city: self.cities_stats[city].salary for city in cities_sorted},
+        )
+        cities_sorted = sorted(
+            self.cities_stats, key=lambda x: self.cities_stats[x].count, reverse=True
+        )[:10]
+        print(
+            "Доля вакансий по городам (в порядке убывания):",
+            {city: self.cities_stats[city].count for city in cities_sorted},
+        )
+
+        if self.sample is not None:
+            for suffix, years_stats in (
+                ("", self.years_stats),
+                (" для выбранной профессии", self.vacancy_stats),
+            ):
+                errors = {
+                    year: self.get_sample_errors(years_stats[year])
+                    for year in years_stats
+                }
+                print(
+                    f"Погрешность уровня зарплат по годам{suffix}:",
+                    {year: errors[year][0] for year in errors},
+                )
+                print(
+                    f"Погрешность количества вакансий по годам{suffix}:",
+                    {year: errors[year][1] for year in errors},
+                )
+            cities_sorted = self.get_sorted_cities("salary")
+            print(
+                "Погрешность уровня зарплат по городам:",
+                {
+                    city: self.get_sample_errors(cities_sorted[city])[0]
+                    for city in cities_sorted
+                },
+            )
+            effective_sizes = {
+                year: self.years_stats[year].moments.effective_size()
+                for year in self.years_stats
+            }
+            print("Эффективный размер выборки по годам:", effective_sizes)
+            print(
+                "Размер выборки:",
+                self.sample_moments.count,
+                "вакансий, эффективный размер:",
+                sum(effective_sizes.values()),
+            )
+
+        for key, name in self.distinct_fields.items():
+            if self.distinct_precision is not None:
+                print(
+                    f"{name} по годам (оценка):",
+                    {
+                        year: self.get_distinct_count(year, key)
+                        for year in self.years_stats
+                    },
+                )
+
+        if self.top_skills:
+            print(
+                "Самые частые навыки по годам:",
+                {
+                    year: [skill for skill, _ in self.get_top_skills(year)]
+                    for year in self.years_stats
+                },
+            )
+            print(
+                "Самые частые навыки для выбранной профессии:",
+                [skill for skill, _ in self.get_top_skills()],
+            )
+
+        for name, results in self.groups_stats.items():
+            if isinstance(results, SpilledResults):
+                print(
+                    f"Группировка {name}: группы сброшены на диск,",
+                    "результаты выводятся в отчёт",
+                )
+                continue
+            print(f"Группировка {name}:", results)
+
+        if self.quantiles:
+            print(
+                "Квантили уровня зарплат по годам:",
+                {year: self.years_stats[year].quantiles for year in self.years_stats},
+            )
+            print(
+                "Квантили уровня зарплат по годам для выбранной профессии:",
+                {
+                    year: self.vacancy_stats[year].quantiles
+                    for year in self.vacancy_stats
+                },
+            )
+            cities_sorted = self.get_sorted_cities("salary")
+            print(
+                "Квантили уровня зарплат по городам:",
+                {city: cities_sorted[city].quantiles for city in cities_sorted},
+            )
+
+    def get_period_label(self, period: int) -> str:
+        """
+        Метод для получения названия периода выбранной гранулярности.
+
+        Parameters
+        ----------
+        period: int
+            Ключ периода
+
+        Returns
+        -------
+        str
+            Название периода (например, 2020-03)
+        """
+
+        return period_label(period, self.granularity)
+
+    def get_distinct_count(self, year: int, key: str) -> Optional[int]:
+        """
+        Метод для получения оценки количества уникальных значений поля за год.
+
+        Parameters
+        ----------
+        year: int
+            Год
+        key: str
+            Название поля вакансии
+
+        Returns
+        -------
+        Optional[int]
+            Оценка количества уникальных значений или None, если она не считалась
+        """
+
+        sketch = self.years_stats[year].distinct.get(key)
+        return sketch.count() if sketch is not None else None
+
+    def get_skills_sketch(self, year: Optional[int] = None) -> Optional[SpaceSaving]:
+        """
+        Метод для получения скетча навыков.
+
+        Parameters
+        ----------
+        year: Optional[int]
+            Год. Если не указан, то возвращается скетч навыков
+            для выбранной профессии за все годы
+
+        Returns
+        -------
+        Optional[SpaceSaving]
+            Скетч навыков или None, если навыки не считались
+        """
+
+        if year is not None:
+            return self.years_stats[year].skills
+
+        result: Optional[SpaceSaving] = None
+        for stats in self.vacancy_stats.values():
+            if stats.skills is None:
+                continue
+            if result is None:
+                result = stats.skills.copy()
+            else:
+                result.merge(stats.skills)
+        return result
+
+    def get_top_skills(self, year: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Метод для получения самых частых навыков.
+
+        Parameters
+        ----------
+        year: Optional[int]
+            Год. Если не указан, то возвращаются навыки
+            для выбранной профессии за все годы
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            Навыки и оценки количества их упоминаний
+        """
+
+        sketch = self.get_skills_sketch(year)
+        return sketch.top(self.top_skills) if sketch is not None else []
+
+    def get_skills_error(self, year: Optional[int] = None) -> Optional[int]:
+        """
+        Метод для получения погрешности количеств упоминаний навыков.
+
+        Parameters
+        ----------
+        year: Optional[int]
+            Год. Если не указан, то возвращается погрешность
+            для выбранной профессии за все годы
+
+        Returns
+        -------
+        Optional[int]
+            Наибольшее завышение количества упоминаний
+            или None, если навыки не считались
+        """
+
+        sketch = self.get_skills_sketch(year)
+        return sketch.error if sketch is not None else None
+
+    def get_sorted_cities(self, attr_name: str) -> Dict[str, StatsData]:
+        """
+        Метод для получения отсортированных городов по атрибуту.
+
+        Parameters
+        ----------
+        attr_name: str
+            Название атрибута
+
+        Returns
+        -------
+        Dict[str, StatsData]
+            Словарь из десяти городов, отсортированных по атрибуту
+        """
+
+        sorted_names = sorted(
+            self.cities_stats,
+            key=lambda x: getattr(self.cities_stats[x], attr_name),
+            reverse=True,
+        )[:10]
+        return {name: self.cities_stats[name] for name in sorted_names}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Метод для получения статистики в виде словаря, который
+        можно сериализовать в JSON (ключи годов и периодов - строки).
+
+        Returns
+        -------
+        Dict[str, Any]
+            Статистика по годам, профессиям и городам, а также
+            посчитанные дополнительно периоды, погрешности, квантили,
+            уникальные значения, навыки и группировки
+        """
+
+        def series(stats: Dict[int, StatsData]) -> Dict[str, Dict[str, Any]]:
+            result = {}
+            for year, data in stats.items():
+                item: Dict[str, Any] = {"salary": data.salary, "count": data.count}
+                if data.quantiles:
+                    item["quantiles"] = {str(q): v for q, v in data.quantiles.items()}
+                if data.moments is not None:
+                    item["salary_error"], item["count_error"] = self.get_sample_errors(
+                        data
+                    )
+                result[str(year)] = item
+            return result
+
+        answer: Dict[str, Any] = {
+            "professions": self.professions,
+            "total_vacancies": self.total_vacancies,
+            "years": series(self.years_stats),
+            "professions_years": {
+                profession: series(stats)
+                for profession, stats in self.professions_stats.items()
+            },
+            "cities_salary": {
+                city: stats.salary
+                for city, stats in self.get_sorted_cities("salary").items()
+            },
+            "cities_share": {
+                city: stats.count
+                for city, stats in self.get_sorted_cities("count").items()
+            },
+        }
+
+        if self.quantiles:
+            answer["cities_quantiles"] = {
+                city: {str(q): v for q, v in stats.quantiles.items()}
+                for city, stats in self.get_sorted_cities("salary").items()
+            }
+
+        if self.sample is not None:
+            answer["cities_salary_error"] = {
+                city: self.get_sample_errors(stats)[0]
+                for city, stats in self.get_sorted_cities("salary").items()
+            }
+            answer["sample"] = {
+                "fraction": self.sample,
+                "size": self.sample_moments.count,
+                "effective_size": sum(
+                    stats.moments.effective_size()
+                    for stats in self.years_stats.values()
+                ),
+            }
+
+        if self.granularity != "year":
+            answer["granularity"] = self.granularity
+            for name, periods_stats, rolling_stats in (
+                ("periods", self.periods_stats, self.rolling_stats),
+                (
+                    "vacancy_periods",
+                    self.vacancy_periods_stats,
+                    self.vacancy_rolling_stats,
+                ),
+            ):
+                answer[name] = {
+                    self.get_period_label(period): {
+                        "salary": stats.salary,
+                        "count": stats.count,
+                        **{
+                            f"rolling_{window}": rolling[period][0]
+                            for window, rolling in rolling_stats.items()
+                        },
+                    }
+                    for period, stats in periods_stats.items()
+                }
+
+        if self.distinct_precision is not None:
+            answer["distinct"] = {
+                key: {
+                    str(year): self.get_distinct_count(year, key)
+                    for year in self.years_stats
+                }
+                for key in self.distinct_fields
+            }
+
+        if self.top_skills:
+            answer["skills"] = {
+                str(year): self.get_top_skills(year) for year in self.years_stats
+            }
+            answer["vacancy_skills"] = self.get_top_skills()
+            # Границы погрешности SpaceSaving для количеств упоминаний
+            answer["skills_error"] = {
+                str(year): self.get_skills_error(year) for year in self.years_stats
+            }
+            answer["vacancy_skills_error"] = self.get_skills_error()
+
+        groups = {}
+        for name, results in self.groups_stats.items():
+            if not isinstance(results, SpilledResults):
+                groups[name] = [
+                    {"key": list(key), **measures} for key, measures in results.items()
+                ]
+        if groups:
+            answer["groups"] = groups
+
+        return answer
+
+    def get_answer(
+        self, template_path: str = "pdf_template.html", *args, **kwargs
+    ) -> None:
+        """
+        Метод для получения результата обработки входных данных.
+
+        Выводит статистику в консоль.
+
+        Создаёт выбранные файлы report.xlsx, graph.png и report.pdf
+        в директории, из которой был запущен скрипт (см. generate_artifacts).
+
+        Parameters
+        ----------
+        template_path: str
+            Путь к шаблону для генерации pdf-файла
+        """
+
+        from .render import Report
+
+        self.print_answer()
+        Report.generate_artifacts(
+            self, self.artifacts, ".", template_path, self.artifact_cache
+        )
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Отрисовка отчёта вынесена в модуль render и импортируется при первом
+    обращении, поэтому для подсчёта статистики не загружаются matplotlib,
+    openpyxl, jinja2 и pdfkit.
+    """
+
+    if name in ("Report", "template_environment"):
+        from . import render
+
+        return getattr(render, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
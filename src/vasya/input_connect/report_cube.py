@@ -0,0 +1,155 @@
+import os
+import tempfile
+from pathlib import Path
+
+from .report import InputConnectReport, StatsData
+from ..backends import Backend
+from ..cube import SalaryCube
+from ..dataset import DataSet
+from ..errors import VasyaException
+from ..rates import RateTable
+
+from typing import Any, Optional, Sequence, Tuple, Union
+
+__all__ = ("InputConnectReportCube",)
+
+CUBE_DIR = os.path.join(tempfile.gettempdir(), "vasya-cube")
+"""Директория для кубов по умолчанию"""
+
+
+class InputConnectReportCube(InputConnectReport):
+    """
+    Класс-коннектор для создания отчёта по кубу статистики
+    (см. SalaryCube). Куб каждого файла не зависит от профессий
+    и сохраняется в кэш, поэтому отчёт по новой профессии
+    просматривает только уникальные названия вакансий.
+
+    Поддерживается только годовая статистика без квантилей, уникальных
+    значений, навыков, группировок и выборки.
+    """
+
+    def __init__(
+        self,
+        dir_name: str,
+        profession: Union[str, Sequence[str]],
+        cache_dir: Optional[str] = CUBE_DIR,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = 64 << 20,
+        backend: Union[str, Backend] = "process",
+        rates: Union[None, bool, str, RateTable] = None,
+    ) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        dir_name: str
+            Путь до директории с csv файлами в формате name_year.csv
+            или до одного csv файла
+        profession: Union[str, Sequence[str]]
+            Профессия или список профессий, по которым будет производиться анализ
+        cache_dir: Optional[str]
+            Директория для сохранения кубов файлов. Если None,
+            то кубы не сохраняются
+        workers: Optional[int]
+            Количество процессов или потоков для обработки файлов
+        chunk_size: Optional[int]
+            Файлы больше этого размера в байтах делятся на части
+        backend: Union[str, Backend]
+            Способ обработки файлов
+        rates: Union[None, bool, str, RateTable]
+            Курсы валют по месяцам (см. InputConnectReport)
+        """
+
+        super().__init__(
+            dir_name,
+            profession,
+            cache_dir=cache_dir,
+            workers=workers,
+            chunk_size=chunk_size,
+            backend=backend,
+            rates=rates,
+        )
+
+    @property
+    def _cache_key(self) -> Tuple[Any, ...]:
+        """
+        Ключ кэша куба: куб не зависит от профессий.
+        """
+
+        return ("cube", self.rates.digest if self.rates is not None else None)
+
+    def _new_result(self) -> SalaryCube:
+        return SalaryCube()
+
+    def _merge_results(self, result: SalaryCube, other: SalaryCube) -> SalaryCube:
+        return result.merge(other)
+
+    def process_file(
+        self, file_name: Path, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Tuple[SalaryCube, Path]:
+        """
+        Метод для построения куба по файлу или его части.
+
+        Parameters
+        ----------
+        file_name: Path
+            Путь до файла
+        start: Optional[int]
+            Позиция начала части в байтах (начало строки).
+            Если None, то обрабатывается весь файл
+        end: Optional[int]
+            Позиция конца части в байтах. Если None, то до конца файла
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет данных
+
+        Returns
+        -------
+        Tuple[SalaryCube, Path]
+            Куб по файлу, путь до файла
+        """
+
+        if start is None:
+            vacancies = DataSet.from_file(file_name, rates=self.rates)
+            vacancies.to_list()
+        else:
+            vacancies = DataSet.from_file(file_name, start, end, self.rates)
+
+        cube = SalaryCube().add(vacancies)
+        if self.cache and start is None:
+            self.cache.put(file_name, self._cache_key, cube)
+        return cube, file_name
+
+    def prepare_data(self) -> None:
+        """
+        Метод для подготовки данных для отчёта.
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет данных
+        """
+
+        files = self.get_files()
+        if not files:
+            raise VasyaException(f"Файлы csv не найдены: {self.dir_name}")
+        results = self._collect_results(files)
+
+        cube = SalaryCube()
+        for file_name in files:
+            cube.merge(results[file_name])
+
+        for year, (salary, count) in cube.years.items():
+            self.years_stats[year] = StatsData(salary, count)
+        self._proc_cities_stats.append(
+            {city: StatsData(*cell) for city, cell in cube.cities.items()}
+        )
+        for profession, cells in cube.professions(self.professions).items():
+            self.professions_stats[profession].update(
+                (year, StatsData(*cell)) for year, cell in cells.items()
+            )
+
+        self.make_stats_as_average()
@@ -0,0 +1,99 @@
+from pathlib import Path
+
+from .report import InputConnectReport, StatsData
+from ..errors import VasyaException
+from ..salary_db import SalaryDatabase
+
+from typing import List, Sequence, Union
+
+__all__ = ("InputConnectReportSQLite",)
+
+
+class InputConnectReportSQLite(InputConnectReport):
+    """
+    Класс-коннектор для создания отчёта по базе SQLite с зарплатами
+    в рублях (таблица salary). Статистика по годам, городам и профессиям
+    считается запросами GROUP BY вместо чтения csv файлов, а средние
+    и доли городов - так же, как в InputConnectReport.
+
+    Базу можно создать из csv файлов методом SalaryDatabase.from_csv.
+    Поддерживается только годовая статистика без квантилей, уникальных
+    значений, навыков, группировок и выборки.
+
+    Attributes
+    ----------
+    db_name: str
+        Путь до файла базы
+    """
+
+    def __init__(self, db_name: str, profession: Union[str, Sequence[str]]) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        db_name: str
+            Путь до файла базы
+        profession: Union[str, Sequence[str]]
+            Профессия или список профессий, по которым будет производиться анализ
+        """
+
+        super().__init__(db_name, profession, chunk_size=None, backend="inline")
+        self.db_name = db_name
+
+    @classmethod
+    def from_input(cls) -> "InputConnectReportSQLite":
+        """
+        Метод для создания объекта класса по вводу пользователя.
+
+        Returns
+        -------
+        InputConnectReportSQLite
+            Объект класса
+        """
+        db_name = input("Введите путь до базы данных: ")
+        professions = input("Введите название профессии: ").split(", ")
+
+        return cls(db_name, professions)
+
+    def get_files(self) -> List[Path]:
+        """
+        Метод для получения списка обрабатываемых файлов.
+
+        Returns
+        -------
+        List[Path]
+            Путь до файла базы
+        """
+
+        return [self.dir_name]
+
+    def prepare_data(self) -> None:
+        """
+        Метод для подготовки данных для отчёта.
+
+        Raises
+        ------
+        VasyaException
+            База не найдена или в ней нет данных
+        """
+
+        with SalaryDatabase(self.db_name) as db:
+            years = db.years()
+            cities = db.cities()
+            professions = {
+                profession: db.years(profession) for profession in self.professions
+            }
+        if not years:
+            raise VasyaException(f"В базе нет вакансий: {self.db_name}")
+
+        for year, (count, salary) in years.items():
+            self.years_stats[year] = StatsData(salary, count)
+            for profession, stats in professions.items():
+                count, salary = stats.get(year, (0, 0))
+                self.professions_stats[profession][year] = StatsData(salary, count)
+        self._proc_cities_stats.append(
+            {city: StatsData(salary, count) for city, (count, salary) in cities.items()}
+        )
+
+        self.make_stats_as_average()
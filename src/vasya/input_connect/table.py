@@ -49,6 +49,7 @@ class InputConnectTable(InputConnect):
         reverse_sort: bool,
         limit: List[int],
         needed_columns: List[str],
+        data: Optional[DataSet] = None,
     ) -> None:
         """
         Конструктор класса.
@@ -67,6 +68,9 @@ class InputConnectTable(InputConnect):
             Список, содержащий границы вывода таблицы
         needed_columns: List[str]
             Список, содержащий названия колонок, которые нужно вывести
+        data: Optional[DataSet]
+            Прочитанные заранее данные файла. Если None, то файл
+            читается при подготовке данных
         """
         self.file_name = file_name
         self.filter_by = filter_by
@@ -74,6 +78,7 @@ class InputConnectTable(InputConnect):
         self.reverse_sort = reverse_sort
         self.limit = limit
         self.needed_columns = needed_columns
+        self._data = data
 
     @classmethod
     def from_input(cls) -> "InputConnectTable":
@@ -91,14 +96,66 @@ class InputConnectTable(InputConnect):
             Экземпляр класса
         """
 
-        file_name = input("Введите название файла: ")
-        filter_by = input("Введите параметр фильтрации: ").split(": ")
-        sort_by = input("Введите параметр сортировки: ") or None
-        reverse_sort = input("Обратный порядок сортировки (Да / Нет): ") or "Нет"
-        limit = [int(i) for i in input("Введите диапазон вывода: ").split()]
-        needed_headers = [
-            i for i in input("Введите требуемые столбцы: ").split(", ") if i
-        ]
+        return cls.from_strings(
+            input("Введите название файла: "),
+            input("Введите параметр фильтрации: "),
+            input("Введите параметр сортировки: "),
+            input("Обратный порядок сортировки (Да / Нет): "),
+            input("Введите диапазон вывода: "),
+            input("Введите требуемые столбцы: "),
+        )
+
+    @classmethod
+    def from_strings(
+        cls,
+        file_name: str,
+        filter_by: str = "",
+        sort_by: str = "",
+        reverse_sort: str = "",
+        limit: str = "",
+        needed_columns: str = "",
+        data: Optional[DataSet] = None,
+    ) -> "InputConnectTable":
+        """
+        Метод для создания объекта класса по строкам в том же формате,
+        что и ввод пользователя.
+
+        Parameters
+        ----------
+        file_name: str
+            Путь до файла
+        filter_by: str
+            Параметр фильтрации в формате "Ключ: значение"
+        sort_by: str
+            Параметр сортировки
+        reverse_sort: str
+            Обратный порядок сортировки (Да / Нет)
+        limit: str
+            Диапазон вывода (одно или два числа через пробел)
+        needed_columns: str
+            Требуемые столбцы через запятую
+        data: Optional[DataSet]
+            Прочитанные заранее данные файла
+
+        Raises
+        ------
+        VasyaException
+            Ввод некорректен
+
+        Returns
+        -------
+        InputConnectTable
+            Экземпляр класса
+        """
+
+        filter_by = filter_by.split(": ")
+        sort_by = sort_by or None
+        reverse_sort = reverse_sort or "Нет"
+        try:
+            limit = [int(i) for i in limit.split()]
+        except ValueError:
+            raise VasyaException("Диапазон вывода задан некорректно")
+        needed_headers = [i for i in needed_columns.split(", ") if i]
 
         if filter_by[0] or len(filter_by) > 1:
             if len(filter_by) != 2:
@@ -115,7 +172,9 @@ class InputConnectTable(InputConnect):
             raise VasyaException("Порядок сортировки задан некорректно")
         reverse_sort = reverse_sort == "Да"
 
-        return cls(file_name, filter_by, sort_by, reverse_sort, limit, needed_headers)
+        return cls(
+            file_name, filter_by, sort_by, reverse_sort, limit, needed_headers, data
+        )
 
     def prepare_data(self) -> None:
         """
@@ -141,8 +200,11 @@ class InputConnectTable(InputConnect):
         -------
         DataSet
             Экземпляр класса DataSet
+            (прочитанные заранее данные, если они заданы)
         """
 
+        if self._data is not None:
+            return DataSet.from_vacancies(self.file_name, self._data.to_list())
         return DataSet.from_file(self.file_name)
 
     def get_processed_data(self) -> DataSet:
@@ -214,6 +276,40 @@ class InputConnectTable(InputConnect):
             key = Vacancy.reverse_key_names[sort_by]
             data.apply_sort(lambda vacancy: getattr(vacancy, key), reverse_sort)
 
+    def get_rows(self) -> List[Dict[str, Any]]:
+        """
+        Возвращает строки таблицы в виде словарей (название столбца - значение)
+        с учётом диапазона вывода и требуемых столбцов
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет данных
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Строки таблицы
+        """
+
+        if self._prepared_data is MISSING:
+            self.prepare_data()
+
+        numbered = list(enumerate(self._prepared_data, start=1))
+        if self.limit:
+            end = self.limit[1] - 1 if len(self.limit) > 1 else None
+            numbered = numbered[self.limit[0] - 1 : end]
+
+        field_names = ("№", *Vacancy.ordered_key_names.values())
+        needed_headers = ("№", *self.needed_columns) if self.needed_columns else None
+        rows = []
+        for number, vacancy in numbered:
+            row = dict(zip(field_names, (number, *vacancy.formatted_data())))
+            if needed_headers:
+                row = {key: row[key] for key in needed_headers if key in row}
+            rows.append(row)
+        return rows
+
     def get_answer(self, *args, **kwargs) -> None:
         """
         Выводит таблицу в консоль
@@ -0,0 +1,712 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .backends import Backend, SharedBackend, get_backend
+from .cache import ArtifactCache
+from .dataset import DataSet
+from .errors import VasyaException
+from .input_connect.report import ARTIFACT_FILES, InputConnectReport
+from .input_connect.report_cube import CUBE_DIR, InputConnectReportCube
+from .input_connect.table import InputConnectTable
+from .vacancy import Vacancy
+
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+__all__ = (
+    "JobRunner",
+    "load_jobs",
+    "run_jobs",
+    "run_report",
+    "run_table",
+)
+
+STATS_OPTIONS = (
+    "quantiles",
+    "distinct_precision",
+    "top_skills",
+    "granularity",
+    "sample",
+    "sample_seed",
+    "chunk_size",
+    "rates",
+)
+"""Параметры отчёта, которые можно передать в запросе статистики"""
+
+CUBE_OPTIONS = ("chunk_size", "rates")
+"""Параметры отчёта, которые поддерживает отчёт по кубу"""
+
+TABLE_OPTIONS = ("filter_by", "sort_by", "reverse_sort", "limit", "needed_columns")
+"""Параметры таблицы, которые можно передать в запросе таблицы"""
+
+
+def file_signature(file_name: Path) -> Tuple[str, int, int]:
+    """
+    Возвращает подпись файла: путь, размер и время изменения.
+    Если файл изменился, подпись тоже изменится.
+
+    Parameters
+    ----------
+    file_name: Path
+        Путь до файла
+
+    Raises
+    ------
+    VasyaException
+        Файл не найден
+
+    Returns
+    -------
+    Tuple[str, int, int]
+        Подпись файла
+    """
+
+    try:
+        stat = os.stat(file_name)
+    except OSError:
+        raise VasyaException(f"Файл не найден: {file_name}")
+    return str(Path(file_name).resolve()), stat.st_size, stat.st_mtime_ns
+
+
+def create_report(
+    request: Dict[str, Any],
+    backend: Union[str, Backend],
+    cache_dir: Optional[str] = None,
+) -> InputConnectReport:
+    """
+    Создаёт отчёт по запросу статистики.
+
+    Parameters
+    ----------
+    request: Dict[str, Any]
+        Запрос статистики
+    backend: Union[str, Backend]
+        Способ обработки файлов
+    cache_dir: Optional[str]
+        Директория с кэшем частичной статистики по файлам
+
+    Raises
+    ------
+    VasyaException
+        Неверный запрос
+
+    Returns
+    -------
+    InputConnectReport
+        Отчёт, данные которого ещё не подготовлены
+    """
+
+    if "path" not in request or "professions" not in request:
+        raise VasyaException("В запросе статистики нужны path и professions")
+    options = {key: request[key] for key in STATS_OPTIONS if key in request}
+
+    if request.get("cube"):
+        unsupported = sorted(set(options) - set(CUBE_OPTIONS))
+        if unsupported:
+            raise VasyaException(
+                f"Отчёт по кубу не поддерживает параметры: {', '.join(unsupported)}"
+            )
+        return InputConnectReportCube(
+            request["path"],
+            request["professions"],
+            cache_dir=cache_dir or CUBE_DIR,
+            backend=backend,
+            **options,
+        )
+    return InputConnectReport(
+        request["path"],
+        request["professions"],
+        cache_dir=cache_dir,
+        backend=backend,
+        **options,
+    )
+
+
+def report_key(request: Dict[str, Any], report: InputConnectReport) -> Tuple:
+    """
+    Возвращает ключ посчитанной статистики без профессий:
+    способ подсчёта, параметры отчёта и подписи файлов.
+
+    Parameters
+    ----------
+    request: Dict[str, Any]
+        Запрос статистики
+    report: InputConnectReport
+        Отчёт, созданный по запросу
+
+    Raises
+    ------
+    VasyaException
+        Файлы не найдены
+
+    Returns
+    -------
+    Tuple
+        Ключ
+    """
+
+    files = report.get_files()
+    if not files:
+        raise VasyaException(f"Файлы csv не найдены: {request['path']}")
+    options = {key: request[key] for key in STATS_OPTIONS if key in request}
+    return (
+        bool(request.get("cube")),
+        json.dumps(options, sort_keys=True),
+        tuple(sorted(file_signature(i) for i in files)),
+    )
+
+
+def create_table(
+    request: Dict[str, Any], vacancies: List[Vacancy]
+) -> InputConnectTable:
+    """
+    Создаёт таблицу по запросу таблицы и прочитанным вакансиям.
+
+    Parameters
+    ----------
+    request: Dict[str, Any]
+        Запрос таблицы, параметры в том же формате, что и ввод пользователя
+    vacancies: List[Vacancy]
+        Вакансии из файла path
+
+    Raises
+    ------
+    VasyaException
+        Неверный запрос
+
+    Returns
+    -------
+    InputConnectTable
+        Таблица
+    """
+
+    return InputConnectTable.from_strings(
+        request["path"],
+        **{key: request[key] for key in TABLE_OPTIONS if key in request},
+        data=DataSet.from_vacancies(request["path"], vacancies),
+    )
+
+
+def render(
+    report: InputConnectReport,
+    output_dir: Optional[Path],
+    artifacts: Sequence[str],
+    template_path: Optional[str],
+    cache: Optional[ArtifactCache] = None,
+) -> Union[Dict[str, str], Dict[str, bytes]]:
+    """
+    Создаёт файлы отчёта.
+
+    Parameters
+    ----------
+    report: InputConnectReport
+        Отчёт
+    output_dir: Optional[Path]
+        Директория для файлов. Если не указана, то файлы
+        создаются только в памяти
+    artifacts: Sequence[str]
+        Какие файлы создать: xlsx, png, pdf
+    template_path: Optional[str]
+        Путь к шаблону pdf
+    cache: Optional[ArtifactCache]
+        Кэш готовых файлов отчёта
+
+    Raises
+    ------
+    VasyaException
+        Для pdf не указан шаблон или указан неизвестный файл отчёта
+
+    Returns
+    -------
+    Union[Dict[str, str], Dict[str, bytes]]
+        Пути до созданных файлов или их содержимое по их типам
+    """
+
+    from .input_connect.render import Report
+
+    if "pdf" in artifacts and not template_path:
+        raise VasyaException("Для pdf нужен template_path")
+    if output_dir is None:
+        return Report.render_artifacts(report, artifacts, template_path, cache)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return Report.generate_artifacts(
+        report, artifacts, str(output_dir), template_path, cache
+    )
+
+
+class JobRunner:
+    """
+    Выполняет задания таблиц и отчётов в одном процессе.
+    Задания в том же формате, что и запросы к серверу статистики
+    (см. StatsDaemon): {"type": "stats", ...} или {"type": "table", ...}.
+
+    Пул процессов, прочитанные файлы таблиц и посчитанные отчёты общие
+    для всех заданий. Отчёты по одним файлам с одними параметрами
+    считаются одним проходом по данным на объединение профессий
+    всех таких заданий из run_all (см. InputConnectReport.for_professions).
+
+    Attributes
+    ----------
+    backend: str
+        Способ обработки файлов
+    workers: Optional[int]
+        Количество процессов или потоков
+    cache_dir: Optional[str]
+        Директория с кэшем частичной статистики по файлам
+    template_path: Optional[str]
+        Путь к шаблону pdf по умолчанию
+    artifact_cache: Optional[ArtifactCache]
+        Кэш готовых файлов отчёта
+    """
+
+    def __init__(
+        self,
+        backend: str = "process",
+        workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        template_path: Optional[str] = None,
+        artifact_cache_dir: Optional[str] = None,
+        artifact_cache_size: int = 256 << 20,
+    ) -> None:
+        """
+        Инициализация класса. Пул процессов создаётся при первом отчёте.
+
+        Parameters
+        ----------
+        backend: str
+            Способ обработки файлов
+        workers: Optional[int]
+            Количество процессов или потоков
+        cache_dir: Optional[str]
+            Директория с кэшем частичной статистики по файлам
+        template_path: Optional[str]
+            Путь к шаблону pdf по умолчанию
+        artifact_cache_dir: Optional[str]
+            Директория с кэшем готовых файлов отчёта
+        artifact_cache_size: int
+            Максимальный размер кэша файлов отчёта в байтах
+        """
+
+        self.backend = backend
+        self.workers = workers
+        self.cache_dir = cache_dir
+        self.template_path = template_path
+        self.artifact_cache = (
+            ArtifactCache(artifact_cache_dir, artifact_cache_size)
+            if artifact_cache_dir
+            else None
+        )
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._backend: Optional[Backend] = None
+        self._reports: Dict[Hashable, InputConnectReport] = {}
+        self._datasets: Dict[Hashable, List[Vacancy]] = {}
+        self._planned: Dict[Hashable, List[str]] = {}
+
+    def close(self) -> None:
+        """
+        Останавливает пул процессов.
+        """
+
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = self._backend = None
+
+    def __enter__(self) -> "JobRunner":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def get_backend(self) -> Backend:
+        """
+        Возвращает способ обработки файлов. Пул процессов создаётся
+        один раз и используется всеми отчётами.
+
+        Returns
+        -------
+        Backend
+            Способ обработки
+        """
+
+        if self._backend is None:
+            backend = get_backend(self.backend, self.workers)
+            if backend.name == "process":
+                self._pool = ProcessPoolExecutor(backend.workers)
+                backend = SharedBackend(self._pool, backend.workers)
+            self._backend = backend
+        return self._backend
+
+    def plan(self, jobs: Iterable[Dict[str, Any]]) -> None:
+        """
+        Запоминает профессии заданий статистики, чтобы задания по одним
+        файлам с одними параметрами посчитать одним отчётом.
+
+        Parameters
+        ----------
+        jobs: Iterable[Dict[str, Any]]
+            Задания
+        """
+
+        for job in jobs:
+            if not isinstance(job, dict) or job.get("type") != "stats":
+                continue
+            try:
+                key = self._stats_key(job)
+            except (VasyaException, TypeError, ValueError):
+                continue
+            planned = self._planned.setdefault(key, [])
+            planned.extend(i for i in self._professions(job) if i not in planned)
+
+    @staticmethod
+    def _professions(job: Dict[str, Any]) -> List[str]:
+        professions = job.get("professions")
+        if isinstance(professions, str):
+            return [professions]
+        return list(professions or ())
+
+    def _stats_key(self, job: Dict[str, Any]) -> Hashable:
+        job = {**job, "professions": self._professions(job)}
+        return report_key(job, create_report(job, "inline", self.cache_dir))
+
+    def get_report(self, job: Dict[str, Any]) -> InputConnectReport:
+        """
+        Возвращает посчитанный отчёт по заданию статистики.
+
+        Parameters
+        ----------
+        job: Dict[str, Any]
+            Задание статистики
+
+        Raises
+        ------
+        VasyaException
+            Неверное задание или файлы не найдены
+
+        Returns
+        -------
+        InputConnectReport
+            Отчёт по профессиям задания
+        """
+
+        professions = self._professions(job)
+        if not professions:
+            raise VasyaException("В запросе статистики нужны path и professions")
+        key = self._stats_key(job)
+
+        report = self._reports.get(key)
+        if report is None or any(i not in report.professions for i in professions):
+            planned = self._planned.get(key, [])
+            union = [*planned, *(i for i in professions if i not in planned)]
+            report = create_report(
+                {**job, "professions": union}, self.get_backend(), self.cache_dir
+            )
+            report.prepare_data()
+            self._reports[key] = report
+        return report.for_professions(professions)
+
+    def get_vacancies(self, file_name: str) -> List[Vacancy]:
+        """
+        Возвращает прочитанные вакансии из файла.
+
+        Parameters
+        ----------
+        file_name: str
+            Путь до файла
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет данных
+
+        Returns
+        -------
+        List[Vacancy]
+            Вакансии
+        """
+
+        key = file_signature(Path(file_name))
+        vacancies = self._datasets.get(key)
+        if vacancies is None:
+            vacancies = self._datasets[key] = DataSet.from_file(file_name).to_list()
+        return vacancies
+
+    def run_stats(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Выполняет задание статистики. Если указана output_dir,
+        то в неё записываются файлы отчёта, а если указаны только artifacts,
+        то содержимое файлов возвращается в ответе.
+
+        Parameters
+        ----------
+        job: Dict[str, Any]
+            Задание статистики
+
+        Raises
+        ------
+        VasyaException
+            Неверное задание или файлы не найдены
+
+        Returns
+        -------
+        Dict[str, Any]
+            Статистика и пути до созданных файлов или их содержимое
+        """
+
+        report = self.get_report(job)
+        answer = report.to_dict()
+
+        output_dir = job.get("output_dir")
+        if output_dir or "artifacts" in job:
+            answer["artifacts"] = render(
+                report,
+                Path(output_dir) if output_dir else None,
+                job.get("artifacts", tuple(ARTIFACT_FILES)),
+                job.get("template_path", self.template_path),
+                self.artifact_cache,
+            )
+        return answer
+
+    def run_table(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Выполняет задание таблицы.
+
+        Parameters
+        ----------
+        job: Dict[str, Any]
+            Задание таблицы, параметры в том же формате, что и ввод пользователя
+
+        Raises
+        ------
+        VasyaException
+            Неверное задание, файл не найден или ничего не найдено
+
+        Returns
+        -------
+        Dict[str, Any]
+            Строки таблицы
+        """
+
+        if "path" not in job:
+            raise VasyaException("В запросе таблицы нужен path")
+        table = create_table(job, self.get_vacancies(job["path"]))
+        rows = table.get_rows()
+        if not rows:
+            raise VasyaException("Ничего не найдено")
+        return {"rows": rows}
+
+    def run(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Выполняет задание.
+
+        Parameters
+        ----------
+        job: Dict[str, Any]
+            Задание
+
+        Raises
+        ------
+        VasyaException
+            Неверное задание или его не удалось выполнить
+
+        Returns
+        -------
+        Dict[str, Any]
+            Результат задания
+        """
+
+        handlers = {"stats": self.run_stats, "table": self.run_table}
+        if not isinstance(job, dict):
+            raise VasyaException("Задание должно быть объектом")
+        if job.get("type") not in handlers:
+            raise VasyaException(f"Неизвестный тип задания: {job.get('type')}")
+        return handlers[job["type"]](job)
+
+    def run_all(self, jobs: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Выполняет задания по порядку. Ошибка задания не останавливает
+        остальные.
+
+        Parameters
+        ----------
+        jobs: Sequence[Dict[str, Any]]
+            Задания
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Ответы в порядке заданий: ok, result или error
+            и время выполнения в секундах
+        """
+
+        self.plan(jobs)
+        answers = []
+        for job in jobs:
+            start = time.perf_counter()
+            try:
+                answer = {"ok": True, "result": self.run(job)}
+            except (VasyaException, OSError, TypeError, ValueError) as ex:
+                answer = {"ok": False, "error": str(ex)}
+            answer["elapsed"] = time.perf_counter() - start
+            answers.append(answer)
+        return answers
+
+
+def load_jobs(file_name: str) -> List[Dict[str, Any]]:
+    """
+    Читает задания из файла JSON или TOML (по расширению .toml).
+    Файл - список заданий или объект со списком в jobs
+    (в TOML - таблицы [[jobs]]).
+
+    Parameters
+    ----------
+    file_name: str
+        Путь до файла заданий
+
+    Raises
+    ------
+    VasyaException
+        Файл не найден или задан неверно
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Задания
+    """
+
+    try:
+        with open(file_name, "rb") as file:
+            content = file.read()
+    except OSError:
+        raise VasyaException(f"Файл заданий не найден: {file_name}")
+
+    try:
+        if Path(file_name).suffix.lower() == ".toml":
+            try:
+                import tomllib
+            except ImportError:
+                raise VasyaException("Для файлов TOML нужен Python 3.11+")
+            data: Any = tomllib.loads(content.decode("utf-8"))
+        else:
+            data = json.loads(content)
+    except ValueError as ex:
+        raise VasyaException(f"Файл заданий задан неверно: {ex}")
+
+    jobs = data.get("jobs") if isinstance(data, dict) else data
+    if not isinstance(jobs, list) or not all(isinstance(i, dict) for i in jobs):
+        raise VasyaException("Файл заданий должен содержать список заданий")
+    return jobs
+
+
+def run_jobs(
+    jobs: Union[str, Sequence[Dict[str, Any]]], **runner_options: Any
+) -> List[Dict[str, Any]]:
+    """
+    Выполняет задания в одном процессе (см. JobRunner).
+
+    Parameters
+    ----------
+    jobs: Union[str, Sequence[Dict[str, Any]]]
+        Задания или путь до файла заданий (см. load_jobs)
+    runner_options: Any
+        Параметры JobRunner
+
+    Raises
+    ------
+    VasyaException
+        Файл заданий не найден или задан неверно
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Ответы в порядке заданий (см. JobRunner.run_all)
+    """
+
+    if isinstance(jobs, str):
+        jobs = load_jobs(jobs)
+    with JobRunner(**runner_options) as runner:
+        return runner.run_all(jobs)
+
+
+def run_report(
+    path: str,
+    professions: Union[str, Sequence[str]],
+    backend: str = "process",
+    workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    **options: Any,
+) -> Dict[str, Any]:
+    """
+    Считает отчёт по вакансиям.
+
+    Parameters
+    ----------
+    path: str
+        Директория с csv файлами или csv файл
+    professions: Union[str, Sequence[str]]
+        Профессия или список профессий
+    backend: str
+        Способ обработки файлов
+    workers: Optional[int]
+        Количество процессов или потоков
+    cache_dir: Optional[str]
+        Директория с кэшем частичной статистики по файлам
+    options: Any
+        Параметры задания статистики: параметры отчёта (STATS_OPTIONS),
+        cube, output_dir, artifacts и template_path
+
+    Raises
+    ------
+    VasyaException
+        Неверные параметры или файлы не найдены
+
+    Returns
+    -------
+    Dict[str, Any]
+        Статистика (см. InputConnectReport.to_dict) и файлы отчёта
+        в artifacts: пути, если указана output_dir, иначе содержимое
+    """
+
+    with JobRunner(backend, workers, cache_dir) as runner:
+        return runner.run_stats(
+            {"type": "stats", "path": path, "professions": professions, **options}
+        )
+
+
+def run_table(path: str, **options: str) -> List[Dict[str, Any]]:
+    """
+    Возвращает строки таблицы вакансий.
+
+    Parameters
+    ----------
+    path: str
+        Csv файл
+    options: str
+        Параметры таблицы (TABLE_OPTIONS) в том же формате, что и ввод
+        пользователя
+
+    Raises
+    ------
+    VasyaException
+        Неверные параметры, файл не найден или ничего не найдено
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Строки таблицы
+    """
+
+    with JobRunner() as runner:
+        return runner.run_table({"type": "table", "path": path, **options})["rows"]
@@ -0,0 +1,165 @@
+from collections import deque
+from datetime import date, timedelta
+
+from typing import Deque, Dict, Tuple
+
+GRANULARITIES = ("year", "month", "week")
+
+_EPOCH = date(1970, 1, 1)
+
+
+def days_from_civil(year: int, month: int, day: int) -> int:
+    """
+    Возвращает количество дней от 1970-01-01 до даты
+    без создания объекта date.
+
+    Parameters
+    ----------
+    year: int
+        Год
+    month: int
+        Месяц
+    day: int
+        День
+
+    Returns
+    -------
+    int
+        Количество дней от 1970-01-01
+    """
+
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def period_key(published_at: str, granularity: str) -> int:
+    """
+    Возвращает целочисленный ключ периода по строке даты публикации
+    (например, 2020-03-15T12:00:00+0300). Дата разбирается по позициям
+    символов, без создания объекта datetime.
+
+    Для годов ключ - год, для месяцев - year * 12 + month - 1,
+    для недель - номер недели (с понедельника) от 1970-01-01.
+    Соседние периоды имеют соседние ключи.
+
+    Parameters
+    ----------
+    published_at: str
+        Дата публикации в формате ISO 8601
+    granularity: str
+        Гранулярность: year, month или week
+
+    Returns
+    -------
+    int
+        Ключ периода
+    """
+
+    year = int(published_at[0:4])
+    if granularity == "year":
+        return year
+    month = int(published_at[5:7])
+    if granularity == "month":
+        return year * 12 + month - 1
+    return (days_from_civil(year, month, int(published_at[8:10])) + 3) // 7
+
+
+def period_start(key: int, granularity: str) -> date:
+    """
+    Возвращает первый день периода.
+
+    Parameters
+    ----------
+    key: int
+        Ключ периода
+    granularity: str
+        Гранулярность: year, month или week
+
+    Returns
+    -------
+    date
+        Первый день периода
+    """
+
+    if granularity == "year":
+        return date(key, 1, 1)
+    if granularity == "month":
+        return date(key // 12, key % 12 + 1, 1)
+    return _EPOCH + timedelta(days=key * 7 - 3)
+
+
+def period_label(key: int, granularity: str) -> str:
+    """
+    Возвращает название периода: 2020, 2020-03 или 2020-03-09
+    (понедельник недели).
+
+    Parameters
+    ----------
+    key: int
+        Ключ периода
+    granularity: str
+        Гранулярность: year, month или week
+
+    Returns
+    -------
+    str
+        Название периода
+    """
+
+    if granularity == "year":
+        return str(key)
+    if granularity == "month":
+        return f"{key // 12}-{key % 12 + 1:02}"
+    return period_start(key, granularity).isoformat()
+
+
+def rolling_means(
+    totals: Dict[int, Tuple[float, int]], window: int
+) -> Dict[int, Tuple[int, float]]:
+    """
+    Считает скользящие средние зарплаты и количества вакансий
+    за один проход по периодам. Суммы окна обновляются при добавлении
+    нового периода и вычитании вышедшего из окна, периоды без вакансий
+    считаются пустыми. В начале ряда окно неполное.
+
+    Parameters
+    ----------
+    totals: Dict[int, Tuple[float, int]]
+        Сумма зарплат и количество вакансий по ключам периодов
+    window: int
+        Размер окна в периодах
+
+    Returns
+    -------
+    Dict[int, Tuple[int, float]]
+        Средняя зарплата и среднее количество вакансий за окно,
+        заканчивающееся каждым периодом из totals
+    """
+
+    result: Dict[int, Tuple[int, float]] = {}
+    if not totals:
+        return result
+
+    queue: Deque[Tuple[float, int]] = deque()
+    salary = 0.0
+    count = 0
+    for key in range(min(totals), max(totals) + 1):
+        period = totals.get(key, (0.0, 0))
+        queue.append(period)
+        salary += period[0]
+        count += period[1]
+        if len(queue) > window:
+            old_salary, old_count = queue.popleft()
+            salary -= old_salary
+            count -= old_count
+
+        if key in totals:
+            result[key] = (
+                int(salary // count) if count else 0,
+                round(count / len(queue), 1),
+            )
+    return result
@@ -0,0 +1,199 @@
+import csv
+import hashlib
+import math
+from array import array
+from functools import lru_cache
+from pathlib import Path
+
+from .errors import VasyaException
+
+from typing import Dict, List, Optional
+
+RATES_FILE = Path(__file__).parent.parent / "extra" / "rates.csv"
+"""Файл с курсами валют ЦБ по месяцам"""
+
+
+class RateTable:
+    """
+    Курсы валют к рублю по месяцам в одном плотном массиве.
+
+    Курс валюты за месяц лежит по индексу
+    номер валюты * количество месяцев + (year * 12 + month - 1 - start),
+    поэтому поиск курса - одно обращение к массиву. Пропущенные месяцы
+    заполнены последним известным курсом, даты до первого и после
+    последнего месяца таблицы получают курс первого и последнего месяца.
+
+    Attributes
+    ----------
+    start: int
+        Ключ первого месяца таблицы (year * 12 + month - 1)
+    months: int
+        Количество месяцев
+    currencies: Dict[str, int]
+        Номера валют по кодам
+    """
+
+    def __init__(
+        self, start: int, months: int, currencies: List[str], rates: array
+    ) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        start: int
+            Ключ первого месяца таблицы (year * 12 + month - 1)
+        months: int
+            Количество месяцев
+        currencies: List[str]
+            Коды валют в порядке их расположения в массиве
+        rates: array
+            Курсы валют по месяцам, NaN - курс неизвестен
+        """
+
+        self.start = start
+        self.months = months
+        self.currencies = {code: n for n, code in enumerate(currencies)}
+        self._rates = rates
+        self._offsets = {
+            code: n * months - start for code, n in self.currencies.items()
+        }
+
+    @classmethod
+    def from_csv(cls, file_name: str) -> "RateTable":
+        """
+        Загружает таблицу из csv файла со столбцами Date (YYYY-MM)
+        и кодами валют.
+
+        Parameters
+        ----------
+        file_name: str
+            Путь до файла
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет курсов
+
+        Returns
+        -------
+        RateTable
+            Таблица курсов
+        """
+
+        try:
+            with open(file_name, "r", encoding="utf-8-sig") as file:
+                reader = csv.reader(file)
+                header = next(reader, None)
+                rows = {
+                    int(row[0][:4]) * 12 + int(row[0][5:7]) - 1: row[1:]
+                    for row in reader
+                    if row
+                }
+        except OSError:
+            raise VasyaException(f"Файл с курсами не найден: {file_name}")
+        if not header or not rows:
+            raise VasyaException(f"В файле нет курсов: {file_name}")
+
+        currencies = header[1:]
+        start = min(rows)
+        months = max(rows) - start + 1
+        rates = array("d")
+        for n in range(len(currencies)):
+            column = []
+            last = math.nan
+            for month in range(start, start + months):
+                row = rows.get(month)
+                if row is not None and n < len(row) and row[n]:
+                    last = float(row[n])
+                column.append(last)
+
+            first = next((i for i in column if not math.isnan(i)), math.nan)
+            rates.extend(first if math.isnan(i) else i for i in column)
+
+        return cls(start, months, currencies, rates)
+
+    @property
+    def digest(self) -> str:
+        """
+        Хэш содержимого таблицы для ключей кэша.
+        """
+
+        return hashlib.sha1(
+            repr((self.start, self.months, tuple(self.currencies))).encode()
+            + self._rates.tobytes()
+        ).hexdigest()
+
+    def rate(self, code: str, month: int) -> Optional[float]:
+        """
+        Возвращает курс валюты за месяц.
+
+        Parameters
+        ----------
+        code: str
+            Код валюты
+        month: int
+            Ключ месяца (year * 12 + month - 1)
+
+        Returns
+        -------
+        Optional[float]
+            Курс к рублю или None, если валюты нет в таблице
+        """
+
+        if code == "RUR":
+            return 1.0
+        offset = self._offsets.get(code)
+        if offset is None:
+            return None
+
+        if month < self.start:
+            month = self.start
+        elif month >= self.start + self.months:
+            month = self.start + self.months - 1
+        value = self._rates[offset + month]
+        return None if math.isnan(value) else value
+
+    def get(self, code: str, published_at: str) -> Optional[float]:
+        """
+        Возвращает курс валюты на дату публикации вакансии.
+        Месяц берётся из строки даты без создания datetime.
+
+        Parameters
+        ----------
+        code: str
+            Код валюты
+        published_at: str
+            Дата публикации в формате ISO 8601
+
+        Returns
+        -------
+        Optional[float]
+            Курс к рублю или None, если валюты нет в таблице
+        """
+
+        return self.rate(code, int(published_at[0:4]) * 12 + int(published_at[5:7]) - 1)
+
+
+@lru_cache(maxsize=None)
+def load_rates(file_name: str = str(RATES_FILE)) -> RateTable:
+    """
+    Загружает таблицу курсов один раз на процесс.
+
+    Parameters
+    ----------
+    file_name: str
+        Путь до csv файла с курсами
+
+    Raises
+    ------
+    VasyaException
+        Файл не найден или в нём нет курсов
+
+    Returns
+    -------
+    RateTable
+        Таблица курсов
+    """
+
+    return RateTable.from_csv(file_name)
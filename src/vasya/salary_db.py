@@ -0,0 +1,216 @@
+import os
+import sqlite3
+
+from .dataset import DataSet
+from .errors import VasyaException
+from .rates import RateTable
+
+from typing import Dict, Iterable, Optional, Tuple
+
+CREATE_TABLE = """
+CREATE TABLE salary (
+    name TEXT,
+    salary REAL,
+    area_name TEXT,
+    published_at TEXT
+)"""
+"""Таблица зарплат в рублях, published_at в формате YYYY-MM"""
+
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS salary_year "
+    "ON salary(substr(published_at, 1, 4), salary)",
+    "CREATE INDEX IF NOT EXISTS salary_area ON salary(area_name, salary)",
+)
+"""Покрывающие индексы: группировки по годам и городам читают только их"""
+
+YEARS_QUERY = """
+SELECT substr(published_at, 1, 4) AS year, COUNT(salary), SUM(salary)
+FROM salary
+WHERE salary IS NOT NULL
+GROUP BY year
+ORDER BY MIN(rowid)
+"""
+
+PROFESSION_QUERY = """
+SELECT substr(published_at, 1, 4) AS year, COUNT(salary), SUM(salary)
+FROM salary
+WHERE salary IS NOT NULL AND instr(name, ?) > 0
+GROUP BY year
+ORDER BY MIN(rowid)
+"""
+
+CITIES_QUERY = """
+SELECT area_name, COUNT(salary), SUM(salary)
+FROM salary
+WHERE salary IS NOT NULL
+GROUP BY area_name
+ORDER BY MIN(rowid)
+"""
+
+
+class SalaryDatabase:
+    """
+    База SQLite с зарплатами в рублях (таблица salary, как в
+    extra/salary_sql.py). Статистика по годам, городам и профессиям
+    считается запросами GROUP BY по покрывающим индексам. Запросы
+    параметризованы, поэтому подготавливаются один раз на подключение.
+
+    Группы выводятся в порядке первого появления строк, как в отчёте
+    по csv файлам. Строки без зарплаты не учитываются.
+
+    Attributes
+    ----------
+    db_name: str
+        Путь до файла базы
+    """
+
+    def __init__(self, db_name: str) -> None:
+        """
+        Инициализация класса, подключается к базе и создаёт индексы,
+        если их ещё нет.
+
+        Parameters
+        ----------
+        db_name: str
+            Путь до файла базы
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет таблицы salary
+        """
+
+        if not os.path.isfile(db_name):
+            raise VasyaException(f"База данных не найдена: {db_name}")
+        self.db_name = db_name
+        self._connection = sqlite3.connect(db_name)
+        try:
+            for index in INDEXES:
+                self._connection.execute(index)
+            self._connection.commit()
+        except sqlite3.DatabaseError as ex:
+            self._connection.close()
+            raise VasyaException(f"Неверная база данных {db_name}: {ex}")
+
+    def __enter__(self) -> "SalaryDatabase":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Закрывает подключение к базе.
+        """
+
+        self._connection.close()
+
+    @classmethod
+    def from_csv(
+        cls,
+        files: Iterable[str],
+        db_name: str,
+        rates: Optional[RateTable] = None,
+    ) -> "SalaryDatabase":
+        """
+        Создаёт базу из csv файлов с вакансиями. Зарплаты переводятся
+        в рубли так же, как при чтении csv файлов отчётом, поэтому
+        отчёты по базе и по файлам совпадают. Существующая таблица
+        salary заменяется.
+
+        Parameters
+        ----------
+        files: Iterable[str]
+            Пути до csv файлов в порядке обработки
+        db_name: str
+            Путь до файла базы
+        rates: Optional[RateTable]
+            Курсы валют по месяцам для перевода зарплат в рубли
+
+        Raises
+        ------
+        VasyaException
+            Файл не найден или в нём нет данных
+
+        Returns
+        -------
+        SalaryDatabase
+            Подключение к созданной базе
+        """
+
+        with sqlite3.connect(db_name) as connection:
+            connection.execute("DROP TABLE IF EXISTS salary")
+            connection.execute(CREATE_TABLE)
+            for file_name in files:
+                connection.executemany(
+                    "INSERT INTO salary VALUES (?, ?, ?, ?)",
+                    (
+                        (
+                            vacancy.name,
+                            vacancy.salary_rub,
+                            vacancy.area_name,
+                            vacancy.published_at_raw[:7],
+                        )
+                        for vacancy in DataSet.from_file(file_name, rates=rates)
+                    ),
+                )
+        connection.close()
+        return cls(db_name)
+
+    def _group(
+        self, query: str, parameters: Tuple[str, ...] = ()
+    ) -> Dict[str, Tuple[int, float]]:
+        """
+        Выполняет запрос группировки.
+
+        Parameters
+        ----------
+        query: str
+            Запрос, который возвращает ключ, количество и сумму зарплат
+        parameters: Tuple[str, ...]
+            Параметры запроса
+
+        Returns
+        -------
+        Dict[str, Tuple[int, float]]
+            Количество вакансий и сумма зарплат по ключам
+        """
+
+        return {
+            key: (count, salary)
+            for key, count, salary in self._connection.execute(query, parameters)
+        }
+
+    def years(self, profession: Optional[str] = None) -> Dict[int, Tuple[int, float]]:
+        """
+        Возвращает количество вакансий и сумму зарплат по годам.
+
+        Parameters
+        ----------
+        profession: Optional[str]
+            Профессия, которая должна входить в название вакансии.
+            Если не указана, то считаются все вакансии
+
+        Returns
+        -------
+        Dict[int, Tuple[int, float]]
+            Количество вакансий и сумма зарплат по годам
+        """
+
+        if profession is None:
+            result = self._group(YEARS_QUERY)
+        else:
+            result = self._group(PROFESSION_QUERY, (profession,))
+        return {int(year): value for year, value in result.items()}
+
+    def cities(self) -> Dict[str, Tuple[int, float]]:
+        """
+        Возвращает количество вакансий и сумму зарплат по городам.
+
+        Returns
+        -------
+        Dict[str, Tuple[int, float]]
+            Количество вакансий и сумма зарплат по городам
+        """
+
+        return self._group(CITIES_QUERY)
@@ -0,0 +1,269 @@
+import os
+import random
+from dataclasses import dataclass
+from math import sqrt
+
+from .dataset import DataSet
+
+from typing import List, Optional, Tuple
+
+BLOCK_SIZE = 1 << 20
+"""Размер блока в байтах для выборочного чтения файлов"""
+
+Z_95 = 1.96
+"""Квантиль нормального распределения для 95% доверительного интервала"""
+
+
+def sample_ranges(
+    file_name: str, fraction: float, block_size: int = BLOCK_SIZE, seed: int = 0
+) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    Выбирает блоки файла для выборочного чтения.
+
+    Строки файла делятся на блоки по block_size байт, из них
+    систематически (с шагом 1 / fraction и случайным началом) выбирается
+    round(fraction * количество блоков) блоков, но не меньше одного.
+    Границы блоков выравниваются по началу строк CSV (с учётом переводов
+    строки в полях в кавычках), поэтому каждая строка относится ровно
+    к одному блоку.
+
+    Parameters
+    ----------
+    file_name: str
+        Путь до файла
+    fraction: float
+        Доля выбираемых блоков (от 0 до 1)
+    block_size: int
+        Размер блока в байтах
+    seed: int
+        Зерно генератора случайного начала. Выборка из одного файла
+        с одним зерном всегда одинакова
+
+    Returns
+    -------
+    Tuple[List[Tuple[int, int]], int]
+        Позиции начала и конца выбранных блоков и количество
+        всех блоков файла
+    """
+
+    start = DataSet.row_start(file_name, 0)
+    end = DataSet.rows_end(file_name)
+    population = max(1, -(-(end - start) // block_size))
+    blocks = min(population, max(1, round(population * fraction)))
+
+    offset = random.Random(f"{seed}:{os.path.basename(file_name)}").random()
+    indexes = [int((n + offset) * population / blocks) for n in range(blocks)]
+    # Границы всех блоков по возрастанию, чтобы найти их за один проход
+    bounds = DataSet.row_starts(
+        file_name,
+        (start + (index + shift) * block_size for index in indexes for shift in (0, 1)),
+    )
+    ranges = []
+    for block_start, block_end in zip(bounds[::2], bounds[1::2]):
+        block_end = min(end, block_end)
+        if block_start < block_end:
+            ranges.append((block_start, block_end))
+    return ranges, population
+
+
+@dataclass
+class ClusterMoments:
+    """
+    Суммы по выбранным блокам для оценки точности выборочной статистики.
+
+    Блоки считаются кластерами простой случайной выборки без возвращения.
+    Средняя зарплата оценивается отношением сумм, её дисперсия - через
+    отклонения блоков от этого отношения. Суммы можно складывать,
+    поэтому оценки из разных процессов объединяются.
+
+    Attributes
+    ----------
+    blocks: int
+        Количество выбранных блоков
+    population: int
+        Количество всех блоков
+    salary: float
+        Сумма зарплат по блокам
+    count: int
+        Количество вакансий по блокам
+    salary_sq: float
+        Сумма квадратов сумм зарплат блоков
+    count_sq: int
+        Сумма квадратов количеств вакансий блоков
+    cross: float
+        Сумма произведений суммы зарплат и количества вакансий блоков
+    values_sq: float
+        Сумма квадратов зарплат всех вакансий выборки
+    """
+
+    blocks: int = 0
+    population: int = 0
+    salary: float = 0.0
+    count: int = 0
+    salary_sq: float = 0.0
+    count_sq: int = 0
+    cross: float = 0.0
+    values_sq: float = 0.0
+
+    def add_block(self, salary: float, count: int, values_sq: float) -> None:
+        """
+        Добавляет суммы по одному блоку
+
+        Parameters
+        ----------
+        salary: float
+            Сумма зарплат в блоке
+        count: int
+            Количество вакансий в блоке
+        values_sq: float
+            Сумма квадратов зарплат в блоке
+        """
+
+        self.blocks += 1
+        self.salary += salary
+        self.count += count
+        self.salary_sq += salary * salary
+        self.count_sq += count * count
+        self.cross += salary * count
+        self.values_sq += values_sq
+
+    def merge(self, other: "ClusterMoments") -> "ClusterMoments":
+        """
+        Добавляет суммы из другого объекта
+
+        Parameters
+        ----------
+        other: ClusterMoments
+            Другие суммы
+
+        Returns
+        -------
+        ClusterMoments
+            Этот же объект
+        """
+
+        self.blocks += other.blocks
+        self.population += other.population
+        self.salary += other.salary
+        self.count += other.count
+        self.salary_sq += other.salary_sq
+        self.count_sq += other.count_sq
+        self.cross += other.cross
+        self.values_sq += other.values_sq
+        return self
+
+    def copy(self) -> "ClusterMoments":
+        """
+        Возвращает копию объекта
+
+        Returns
+        -------
+        ClusterMoments
+            Копия объекта
+        """
+
+        return ClusterMoments(**self.__dict__)
+
+    @property
+    def scale(self) -> float:
+        """
+        Во сколько раз все блоки больше выбранных.
+        """
+
+        return self.population / self.blocks if self.blocks else 1.0
+
+    def _mean_variance(self) -> Optional[float]:
+        """
+        Оценивает дисперсию средней зарплаты
+
+        Returns
+        -------
+        Optional[float]
+            Дисперсия или None, если блоков меньше двух или нет вакансий
+        """
+
+        if self.blocks < 2 or not self.count:
+            return None
+
+        ratio = self.salary / self.count
+        deviations = max(
+            0.0,
+            self.salary_sq - 2 * ratio * self.cross + ratio * ratio * self.count_sq,
+        ) / (self.blocks - 1)
+        mean_count = self.count / self.blocks
+        return (
+            (1 - self.blocks / self.population)
+            * deviations
+            / (self.blocks * mean_count * mean_count)
+        )
+
+    def mean_error(self, z: float = Z_95) -> Optional[float]:
+        """
+        Оценивает половину ширины доверительного интервала средней зарплаты
+
+        Parameters
+        ----------
+        z: float
+            Квантиль нормального распределения
+
+        Returns
+        -------
+        Optional[float]
+            Половина ширины интервала или None, если её нельзя оценить
+        """
+
+        variance = self._mean_variance()
+        return None if variance is None else z * sqrt(variance)
+
+    def total_error(self, z: float = Z_95) -> Optional[float]:
+        """
+        Оценивает половину ширины доверительного интервала
+        количества вакансий во всех блоках
+
+        Parameters
+        ----------
+        z: float
+            Квантиль нормального распределения
+
+        Returns
+        -------
+        Optional[float]
+            Половина ширины интервала или None, если её нельзя оценить
+        """
+
+        if self.blocks < 2:
+            return None
+
+        variance = (
+            max(0.0, self.count_sq - self.count * self.count / self.blocks)
+            / (self.blocks - 1)
+            * self.population
+            * self.population
+            * (1 - self.blocks / self.population)
+            / self.blocks
+        )
+        return z * sqrt(variance)
+
+    def effective_size(self) -> int:
+        """
+        Оценивает эффективный размер выборки: количество вакансий
+        в простой случайной выборке, которая дала бы такую же точность
+        средней зарплаты. Меньше настоящего размера, если вакансии
+        внутри блоков похожи друг на друга
+
+        Returns
+        -------
+        int
+            Эффективный размер выборки
+        """
+
+        variance = self._mean_variance()
+        if not variance or self.count < 2:
+            return self.count
+
+        mean = self.salary / self.count
+        values_variance = max(0.0, self.values_sq - self.count * mean * mean) / (
+            self.count - 1
+        )
+        fraction = self.blocks / self.population
+        return min(self.count, round(values_variance * (1 - fraction) / variance))
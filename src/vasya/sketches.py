@@ -0,0 +1,426 @@
+import hashlib
+from math import ceil, log
+
+from typing import Dict, List, Optional, Tuple
+
+
+class KLLSketch:
+    """
+    Квантильный скетч KLL.
+
+    Хранит ограниченное количество значений и позволяет оценить
+    любой квантиль с погрешностью по рангу порядка 1.7 / k.
+    Скетчи, построенные в разных процессах, можно объединять.
+
+    Attributes
+    ----------
+    k: int
+        Параметр точности (размер верхнего уровня)
+    count: int
+        Количество добавленных значений
+    """
+
+    def __init__(self, k: int = 200) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        k: int
+            Параметр точности (размер верхнего уровня)
+        """
+
+        self.k = k
+        self.count = 0
+        self._levels: List[List[float]] = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+        self._offset = 0
+
+    def _capacity(self, level: int) -> int:
+        """
+        Возвращает вместимость уровня
+
+        Parameters
+        ----------
+        level: int
+            Номер уровня
+
+        Returns
+        -------
+        int
+            Вместимость уровня
+        """
+
+        depth = len(self._levels) - level - 1
+        return max(2, ceil(self.k * (2 / 3) ** depth))
+
+    def _update_max_size(self) -> None:
+        self._max_size = sum(self._capacity(i) for i in range(len(self._levels)))
+
+    def update(self, value: float) -> None:
+        """
+        Добавляет значение в скетч
+
+        Parameters
+        ----------
+        value: float
+            Значение
+        """
+
+        self._levels[0].append(value)
+        self._size += 1
+        self.count += 1
+        if self._size >= self._max_size:
+            self._compress()
+
+    def _compress(self) -> None:
+        """
+        Сжимает переполненные уровни, перенося половину значений
+        на следующий уровень с удвоенным весом
+        """
+
+        while self._size >= self._max_size:
+            for level, items in enumerate(self._levels):
+                if len(items) < self._capacity(level):
+                    continue
+
+                if level + 1 == len(self._levels):
+                    self._levels.append([])
+                    self._update_max_size()
+
+                items.sort()
+                kept = [items.pop()] if len(items) % 2 else []
+                promoted = items[self._offset :: 2]
+                self._offset ^= 1
+
+                self._levels[level + 1].extend(promoted)
+                self._size -= len(items) - len(promoted)
+                self._levels[level] = kept
+                break
+            else:
+                break
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """
+        Добавляет к скетчу значения из другого скетча
+
+        Parameters
+        ----------
+        other: KLLSketch
+            Другой скетч
+
+        Returns
+        -------
+        KLLSketch
+            Этот же скетч
+        """
+
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+        self._update_max_size()
+
+        for level, items in enumerate(other._levels):
+            self._levels[level].extend(items)
+        self._size += other._size
+        self.count += other.count
+        self._compress()
+        return self
+
+    def copy(self) -> "KLLSketch":
+        """
+        Возвращает копию скетча
+
+        Returns
+        -------
+        KLLSketch
+            Копия скетча
+        """
+
+        result = KLLSketch(self.k)
+        result.count = self.count
+        result._levels = [list(i) for i in self._levels]
+        result._size = self._size
+        result._max_size = self._max_size
+        result._offset = self._offset
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Оценивает квантиль добавленных значений
+
+        Parameters
+        ----------
+        q: float
+            Уровень квантиля от 0 до 1
+
+        Returns
+        -------
+        Optional[float]
+            Оценка квантиля или None, если скетч пуст
+        """
+
+        weighted = sorted(
+            (value, 1 << level)
+            for level, items in enumerate(self._levels)
+            for value in items
+        )
+        if not weighted:
+            return None
+
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+
+class HyperLogLog:
+    """
+    Скетч HyperLogLog для оценки количества уникальных значений.
+
+    Занимает 2 ** precision байт независимо от количества значений,
+    относительная погрешность оценки порядка 1.04 / sqrt(2 ** precision).
+    Скетчи с одинаковой точностью, построенные в разных процессах,
+    можно объединять.
+
+    Attributes
+    ----------
+    precision: int
+        Количество бит хэша, определяющих номер регистра
+    """
+
+    def __init__(self, precision: int = 12) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        precision: int
+            Количество бит хэша, определяющих номер регистра (от 4 до 18)
+
+        Raises
+        ------
+        ValueError
+            Точность вне допустимого диапазона
+        """
+
+        if not 4 <= precision <= 18:
+            raise ValueError("Точность HyperLogLog должна быть от 4 до 18")
+
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, value: str) -> None:
+        """
+        Добавляет значение в скетч
+
+        Parameters
+        ----------
+        value: str
+            Значение
+        """
+
+        hashed = int.from_bytes(
+            hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        bits = 64 - self.precision
+        index = hashed >> bits
+        rank = bits - (hashed & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        Добавляет к скетчу значения из другого скетча
+
+        Parameters
+        ----------
+        other: HyperLogLog
+            Другой скетч с такой же точностью
+
+        Raises
+        ------
+        ValueError
+            Точность скетчей различается
+
+        Returns
+        -------
+        HyperLogLog
+            Этот же скетч
+        """
+
+        if other.precision != self.precision:
+            raise ValueError("Нельзя объединить скетчи с разной точностью")
+
+        self._registers = bytearray(map(max, self._registers, other._registers))
+        return self
+
+    def copy(self) -> "HyperLogLog":
+        """
+        Возвращает копию скетча
+
+        Returns
+        -------
+        HyperLogLog
+            Копия скетча
+        """
+
+        result = HyperLogLog(self.precision)
+        result._registers = bytearray(self._registers)
+        return result
+
+    def count(self) -> int:
+        """
+        Оценивает количество уникальных значений
+
+        Returns
+        -------
+        int
+            Оценка количества уникальных значений
+        """
+
+        size = len(self._registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(size, 0.7213 / (1 + 1.079 / size))
+        estimate = alpha * size * size / sum(2.0**-i for i in self._registers)
+
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * log(size / zeros)
+        return round(estimate)
+
+
+class SpaceSaving:
+    """
+    Скетч Space-Saving для поиска самых частых значений.
+
+    Хранит не больше 2 * capacity счётчиков. Оценка частоты каждого
+    значения завышена не более чем на error, а error не превышает
+    count / capacity. Скетчи, построенные в разных процессах,
+    можно объединять.
+
+    Attributes
+    ----------
+    capacity: int
+        Количество счётчиков, которые остаются после сжатия
+    count: int
+        Количество добавленных значений
+    error: int
+        Максимальная погрешность оценок частот
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        capacity: int
+            Количество счётчиков, которые остаются после сжатия
+        """
+
+        self.capacity = capacity
+        self.count = 0
+        self.error = 0
+        self._counters: Dict[str, int] = {}
+
+    def add(self, value: str) -> None:
+        """
+        Добавляет значение в скетч
+
+        Parameters
+        ----------
+        value: str
+            Значение
+        """
+
+        self.count += 1
+        counters = self._counters
+        current = counters.get(value)
+        if current is not None:
+            counters[value] = current + 1
+            return
+
+        counters[value] = self.error + 1
+        if len(counters) > 2 * self.capacity:
+            self._prune()
+
+    def _prune(self) -> None:
+        """
+        Оставляет capacity самых больших счётчиков, запоминая
+        наибольший выброшенный счётчик как погрешность
+        """
+
+        if len(self._counters) <= self.capacity:
+            return
+
+        ordered = sorted(self._counters.items(), key=lambda x: x[1], reverse=True)
+        self.error = max(self.error, ordered[self.capacity][1])
+        self._counters = dict(ordered[: self.capacity])
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """
+        Добавляет к скетчу значения из другого скетча
+
+        Parameters
+        ----------
+        other: SpaceSaving
+            Другой скетч
+
+        Returns
+        -------
+        SpaceSaving
+            Этот же скетч
+        """
+
+        counters = self._counters
+        for value in counters:
+            if value not in other._counters:
+                counters[value] += other.error
+        for value, current in other._counters.items():
+            counters[value] = counters.get(value, self.error) + current
+
+        self.error += other.error
+        self.count += other.count
+        self.capacity = max(self.capacity, other.capacity)
+        self._prune()
+        return self
+
+    def copy(self) -> "SpaceSaving":
+        """
+        Возвращает копию скетча
+
+        Returns
+        -------
+        SpaceSaving
+            Копия скетча
+        """
+
+        result = SpaceSaving(self.capacity)
+        result.count = self.count
+        result.error = self.error
+        result._counters = dict(self._counters)
+        return result
+
+    def top(self, n: int) -> List[Tuple[str, int]]:
+        """
+        Возвращает самые частые значения
+
+        Parameters
+        ----------
+        n: int
+            Количество значений
+
+        Returns
+        -------
+        List[Tuple[str, int]]
+            Значения и оценки их частот в порядке убывания частоты
+            (при равной частоте - по значению, чтобы результат не зависел
+            от порядка объединения скетчей).
+            Настоящая частота не меньше оценки минус error
+        """
+
+        return sorted(self._counters.items(), key=lambda x: (-x[1], x[0]))[:n]
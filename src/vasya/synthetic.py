@@ -0,0 +1,509 @@
+import argparse
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+from .errors import VasyaException
+from .vacancy import currency_dict
+
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+SHORT_HEADER = [
+    "name",
+    "salary_from",
+    "salary_to",
+    "salary_currency",
+    "area_name",
+    "published_at",
+]
+"""Столбцы файлов для отчётов"""
+
+FULL_HEADER = [
+    "name",
+    "description",
+    "key_skills",
+    "experience_id",
+    "premium",
+    "employer_name",
+    "salary_from",
+    "salary_to",
+    "salary_gross",
+    "salary_currency",
+    "area_name",
+    "published_at",
+]
+"""Столбцы файлов с полным описанием вакансий"""
+
+PROFESSIONS = {
+    "Программист": 60000,
+    "Разработчик": 70000,
+    "Аналитик": 55000,
+    "Менеджер по продажам": 40000,
+    "Менеджер проектов": 65000,
+    "Тестировщик": 45000,
+    "Системный администратор": 40000,
+    "Дизайнер": 40000,
+    "Бухгалтер": 35000,
+    "Инженер": 45000,
+    "Оператор": 30000,
+    "Специалист по информационной безопасности": 60000,
+    "Токарь": 38000,
+    "Слесарь": 35000,
+    "Водитель": 35000,
+    "Продавец-консультант": 25000,
+}
+"""Профессии и их средняя зарплата в рублях (по частоте в порядке убывания)"""
+
+LEVELS = ["", "Ведущий", "Старший", "Младший", "Главный", "Junior", "Senior"]
+"""Уровни должностей"""
+
+SPECIALIZATIONS = ["", "1С", "Python", "Java", "C#", "PHP", "(удалённо)", "BI"]
+"""Уточнения названия вакансии"""
+
+AREAS = {
+    "Москва": 900,
+    "Санкт-Петербург": 420,
+    "Екатеринбург": 150,
+    "Новосибирск": 115,
+    "Нижний Новгород": 105,
+    "Красноярск": 85,
+    "Краснодар": 80,
+    "Челябинск": 75,
+    "Казань": 70,
+    "Ростов-на-Дону": 65,
+    "Алматы": 65,
+    "Томск": 60,
+    "Воронеж": 57,
+    "Минск": 52,
+    "Самара": 50,
+    "Пермь": 45,
+    "Уфа": 40,
+    "Омск": 35,
+    "Тюмень": 30,
+    "Владивосток": 25,
+    "Барнаул": 20,
+    "Ташкент": 20,
+    "Киев": 15,
+}
+"""Города и их относительная частота"""
+
+CURRENCIES = {
+    "RUR": 890,
+    "KZT": 25,
+    "USD": 15,
+    "BYR": 14,
+    "UZS": 5,
+    "EUR": 4,
+    "UAH": 3,
+    "AZN": 2,
+    "KGS": 1,
+    "GEL": 1,
+}
+"""Валюты и их относительная частота"""
+
+EXPERIENCE = {
+    "between1And3": 45,
+    "noExperience": 25,
+    "between3And6": 25,
+    "moreThan6": 5,
+}
+"""Опыт работы и его относительная частота"""
+
+SKILLS = [
+    "Python",
+    "SQL",
+    "Git",
+    "Linux",
+    "1С: Предприятие 8",
+    "MS Excel",
+    "Работа в команде",
+    "Деловая переписка",
+    "Активные продажи",
+    "Django Framework",
+    "JavaScript",
+    "Docker",
+    "Английский язык",
+    "Управление проектами",
+    "Ведение переговоров",
+    "PostgreSQL",
+    "Java",
+    "Грамотная речь",
+    "Аналитическое мышление",
+    "Чтение чертежей",
+]
+"""Ключевые навыки"""
+
+DUTIES = [
+    "разработка и сопровождение информационных систем",
+    "анализ требований заказчика",
+    "подготовка отчётности",
+    "работа с клиентами",
+    "участие в планировании задач",
+    "обслуживание оборудования",
+    "ведение документации",
+    "контроль качества",
+]
+"""Обязанности для описаний"""
+
+REQUIREMENTS = [
+    "опыт работы от 1 года",
+    "высшее образование",
+    "знание SQL",
+    "ответственность и внимательность",
+    "умение работать в команде",
+    "знание ПК на уровне уверенного пользователя",
+]
+"""Требования для описаний"""
+
+CONDITIONS = [
+    "оформление по ТК РФ",
+    "белая заработная плата",
+    "ДМС",
+    "гибкий график",
+    "удалённая работа",
+    "обучение за счёт компании",
+]
+"""Условия для описаний"""
+
+EMPLOYERS = ["Альфа", "Вектор", "Сфера", "Прогресс", "Гранит", "Север", "Ромашка"]
+"""Основы названий компаний"""
+
+EMPLOYER_SUFFIXES = ["", " Групп", " Софт", " Трейд", " Технологии", "-Сервис"]
+"""Окончания названий компаний"""
+
+POOL_SIZE = 1 << 14
+"""Размер заранее созданных значений каждого столбца"""
+
+BLOCK_SIZE = 1 << 14
+"""Количество строк, которые создаются и записываются за раз"""
+
+
+def csv_field(value: str) -> str:
+    """
+    Записывает значение как поле csv (в кавычках, если нужно).
+
+    Parameters
+    ----------
+    value: str
+        Значение
+
+    Returns
+    -------
+    str
+        Поле csv
+    """
+
+    if any(i in value for i in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+class VacancyGenerator:
+    """
+    Детерминированный генератор строк csv с вакансиями.
+
+    Значения каждого столбца заранее создаются с нужным распределением
+    (POOL_SIZE штук), а строки собираются из случайно выбранных значений
+    блоками по BLOCK_SIZE, поэтому память не зависит от количества строк.
+    Одинаковые параметры дают одинаковые строки.
+
+    Attributes
+    ----------
+    header: List[str]
+        Столбцы файла
+    pools: List[List[str]]
+        Готовые поля csv каждого столбца (части строки между запятыми)
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        full: bool = False,
+        years: Tuple[int, int] = (2007, 2022),
+        incomplete: float = 0.05,
+    ) -> None:
+        """
+        Инициализация класса
+
+        Parameters
+        ----------
+        seed: int
+            Начальное значение генератора случайных чисел
+        full: bool
+            Создавать столбцы с полным описанием вакансии (FULL_HEADER),
+            иначе - только столбцы для отчётов (SHORT_HEADER)
+        years: Tuple[int, int]
+            Первый и последний год публикации вакансий
+        incomplete: float
+            Доля строк без одной из границ оклада (такие строки
+            пропускаются при чтении, как и в настоящих выгрузках)
+
+        Raises
+        ------
+        VasyaException
+            Неверный диапазон лет или доля неполных строк
+        """
+
+        if years[0] > years[1]:
+            raise VasyaException("Неверный диапазон лет")
+        if not 0 <= incomplete <= 1:
+            raise VasyaException("Доля неполных строк должна быть от 0 до 1")
+
+        self.random = random.Random(seed)
+        self.full = full
+        self.header = FULL_HEADER if full else SHORT_HEADER
+        self._rates = {i: 1 / currency_dict[i].rate_to_rub for i in CURRENCIES}
+
+        names, salaries = self._names(), self._salaries(incomplete)
+        if full:
+            self.pools = [
+                names,
+                self._descriptions(),
+                self._skills(),
+                self._choices(list(EXPERIENCE), list(EXPERIENCE.values())),
+                self._choices(["False", "True"], [97, 3]),
+                self._employers(),
+                salaries,
+            ]
+        else:
+            self.pools = [names, salaries]
+        self.pools += [
+            self._choices([csv_field(i) for i in AREAS], list(AREAS.values())),
+            self._dates(*years),
+        ]
+
+    def _choices(self, values: Sequence[str], weights: Sequence[float]) -> List[str]:
+        return self.random.choices(values, weights, k=POOL_SIZE)
+
+    def _names(self) -> List[str]:
+        professions = list(PROFESSIONS)
+        # Частота профессий убывает по закону Ципфа
+        weights = [1 / (i + 1) for i in range(len(professions))]
+        names = []
+        for profession in self._choices(professions, weights):
+            level = self.random.choice(LEVELS)
+            specialization = self.random.choice(SPECIALIZATIONS)
+            name = " ".join(i for i in (level, profession, specialization) if i)
+            names.append(csv_field(name[0].upper() + name[1:]))
+        return names
+
+    def _salaries(self, incomplete: float) -> List[str]:
+        currencies = self._choices(list(CURRENCIES), list(CURRENCIES.values()))
+        averages = self._choices(list(PROFESSIONS.values()), [1] * len(PROFESSIONS))
+        salaries = []
+        for currency, average in zip(currencies, averages):
+            low = max(1.0, self.random.lognormvariate(0, 0.4) * average)
+            low *= self._rates[currency]
+            high = low * self.random.uniform(1, 1.6)
+            # Три значащие цифры, как в настоящих вакансиях
+            salary_from, salary_to = (
+                str(max(1, int(round(i, 2 - len(str(int(i))))))) for i in (low, high)
+            )
+            if self.random.random() < incomplete:
+                if self.random.random() < 0.5:
+                    salary_from = ""
+                else:
+                    salary_to = ""
+            gross = [self.random.choice(("True", "False"))] if self.full else []
+            salaries.append(",".join([salary_from, salary_to, *gross, currency]))
+        return salaries
+
+    def _dates(self, first: int, last: int) -> List[str]:
+        # Количество вакансий растёт от года к году
+        years = list(range(first, last + 1))
+        counts = self._choices(years, [1.25 ** (i - first) for i in years])
+        dates = []
+        for year in counts:
+            day = date(year, 1, 1) + timedelta(days=self.random.randrange(365))
+            hour = min(23, max(0, round(self.random.gauss(12, 4))))
+            minute, second = self.random.randrange(60), self.random.randrange(60)
+            dates.append(f"{day}T{hour:02}:{minute:02}:{second:02}+0300")
+        return dates
+
+    def _descriptions(self) -> List[str]:
+        descriptions = []
+        for _ in range(POOL_SIZE):
+            parts = []
+            for title, items in (
+                ("Обязанности", DUTIES),
+                ("Требования", REQUIREMENTS),
+                ("Условия", CONDITIONS),
+            ):
+                chosen = self.random.sample(items, self.random.randint(2, 4))
+                parts.append(
+                    f"<p><strong>{title}:</strong></p> <ul> "
+                    + " ".join(f"<li>{i};</li>" for i in chosen)
+                    + " </ul>"
+                )
+            descriptions.append(csv_field(" ".join(parts)))
+        return descriptions
+
+    def _skills(self) -> List[str]:
+        return [
+            csv_field("\n".join(self.random.sample(SKILLS, self.random.randint(1, 8))))
+            for _ in range(POOL_SIZE)
+        ]
+
+    def _employers(self) -> List[str]:
+        return [
+            csv_field(
+                f"ООО «{self.random.choice(EMPLOYERS)}"
+                f"{self.random.choice(EMPLOYER_SUFFIXES)}»"
+            )
+            for _ in range(POOL_SIZE)
+        ]
+
+    def blocks(self, rows: int) -> Iterator[List[str]]:
+        """
+        Создаёт строки csv (без заголовка) блоками.
+
+        Parameters
+        ----------
+        rows: int
+            Количество строк
+
+        Returns
+        -------
+        Iterator[List[str]]
+            Блоки строк без перевода строки. Дата публикации всегда
+            последние 24 символа строки
+        """
+
+        choices = self.random.choices
+        while rows > 0:
+            size = min(rows, BLOCK_SIZE)
+            columns = [choices(pool, k=size) for pool in self.pools]
+            yield list(map(",".join, zip(*columns)))
+            rows -= size
+
+
+def _open(file_name: Path, header: List[str]) -> TextIO:
+    file = open(file_name, "w", encoding="utf-8", newline="")
+    file.write(",".join(header) + "\r\n")
+    return file
+
+
+def generate(
+    file_name: str,
+    rows: int,
+    seed: int = 0,
+    full: bool = False,
+    split_by_year: bool = False,
+    years: Tuple[int, int] = (2007, 2022),
+    incomplete: float = 0.05,
+) -> List[str]:
+    """
+    Создаёт csv файл со случайными вакансиями.
+
+    Описания записываются в одну строку, поэтому файлы для отчётов
+    можно делить на части по строкам (DataSet.split). Навыки в полном
+    формате, как и в выгрузках hh, разделены переводом строки.
+
+    Parameters
+    ----------
+    file_name: str
+        Путь до файла. При split_by_year файлы называются
+        как в data/split.py: <имя>_<год>.csv в той же директории
+    rows: int
+        Количество строк
+    seed: int
+        Начальное значение генератора случайных чисел
+    full: bool
+        Создавать столбцы с полным описанием вакансии
+    split_by_year: bool
+        Разделить вакансии на файлы по годам публикации
+    years: Tuple[int, int]
+        Первый и последний год публикации вакансий
+    incomplete: float
+        Доля строк без одной из границ оклада
+
+    Raises
+    ------
+    VasyaException
+        Отрицательное количество строк или неверные параметры генератора
+
+    Returns
+    -------
+    List[str]
+        Пути до созданных файлов
+    """
+
+    if rows < 0:
+        raise VasyaException("Количество строк не может быть отрицательным")
+    generator = VacancyGenerator(seed, full, years, incomplete)
+    path = Path(file_name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    files: Dict[str, TextIO] = {}
+    try:
+        if not split_by_year:
+            files[""] = _open(path, generator.header)
+        for block in generator.blocks(rows):
+            if not split_by_year:
+                files[""].write("\r\n".join(block) + "\r\n")
+                continue
+            buckets: Dict[str, List[str]] = {}
+            for line in block:
+                buckets.setdefault(line[-24:-20], []).append(line)
+            for year, lines in buckets.items():
+                if year not in files:
+                    files[year] = _open(
+                        path.with_name(f"{path.stem}_{year}.csv"), generator.header
+                    )
+                files[year].write("\r\n".join(lines) + "\r\n")
+    finally:
+        for file in files.values():
+            file.close()
+    return sorted(file.name for file in files.values())
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Создаёт файл со случайными вакансиями:
+    python -m vasya.synthetic vacancies.csv 1000000 [--seed 1] [--full] [--split]
+
+    Parameters
+    ----------
+    argv: Optional[Sequence[str]]
+        Аргументы командной строки (по умолчанию - sys.argv)
+    """
+
+    parser = argparse.ArgumentParser(description="Случайные вакансии в csv")
+    parser.add_argument("file", help="путь до создаваемого файла")
+    parser.add_argument("rows", type=int, help="количество строк")
+    parser.add_argument("--seed", type=int, default=0, help="начальное значение")
+    parser.add_argument(
+        "--full", action="store_true", help="столбцы с полным описанием вакансии"
+    )
+    parser.add_argument(
+        "--split", action="store_true", help="разделить на файлы <имя>_<год>.csv"
+    )
+    parser.add_argument(
+        "--years",
+        type=int,
+        nargs=2,
+        default=(2007, 2022),
+        help="первый и последний год",
+    )
+    parser.add_argument(
+        "--incomplete", type=float, default=0.05, help="доля строк без оклада"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        files = generate(
+            args.file,
+            args.rows,
+            args.seed,
+            args.full,
+            args.split,
+            tuple(args.years),
+            args.incomplete,
+        )
+    except VasyaException as ex:
+        parser.exit(1, f"{ex}\n")
+    print("\n".join(files))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 from datetime import datetime
 import re
 
+from .rates import RateTable
+
 from typing import TYPE_CHECKING, Any, Generator, Optional, Union
 
 if TYPE_CHECKING:
@@ -253,10 +255,14 @@ class Vacancy:
         Название вакансии
     salary_rub: float
         Зарплата в рублях
+    salary_currency: str
+        Идентификатор валюты оклада
     area_name: str
         Название города
     published_at: datetime
-        Дата публикации вакансии
+        Дата публикации вакансии (разбирается при первом обращении)
+    published_at_raw: str
+        Строка даты публикации вакансии в формате ISO 8601
     description: Optional[str]
         Описание вакансии
     key_skills: Optional[skillslist]
@@ -357,6 +363,7 @@ class Vacancy:
         premium: Optional[str] = None,
         employer_name: Optional[str] = None,
         salary_gross: Optional[str] = None,
+        rates: Optional[RateTable] = None,
     ) -> None:
         """
         Инициализация класса
@@ -387,16 +394,22 @@ class Vacancy:
             Название компании
         salary_gross: Optional[str]
             Оклад указан до вычета налогов (true/false)
+        rates: Optional[RateTable]
+            Курсы валют по месяцам. Если указаны, то зарплата переводится
+            в рубли по курсу месяца публикации, иначе по курсам currency_dict
         """
 
         self.name = self._str(name)
 
-        self.salary_rub = (
-            (float(salary_from) + float(salary_to)) / 2 * currency_dict[salary_currency]
-        )
+        rate = rates.get(salary_currency, published_at) if rates is not None else None
+        if rate is None:
+            rate = currency_dict[salary_currency].rate_to_rub
+        self.salary_rub = (float(salary_from) + float(salary_to)) / 2 * rate
 
+        self.salary_currency = salary_currency
         self.area_name = area_name
-        self.published_at = self._parse_time(published_at)
+        self.published_at_raw = published_at
+        self._published_at: Optional[datetime] = None
 
         self.description = self._str(description) if description else None
         self.key_skills = skillslist(key_skills.split("\n")) if key_skills else None
@@ -418,6 +431,17 @@ class Vacancy:
             else None
         )
 
+    @property
+    def published_at(self) -> datetime:
+        """
+        Дата публикации вакансии. Разбирается при первом обращении,
+        так как отчётам по годам и периодам достаточно строки даты
+        """
+
+        if self._published_at is None:
+            self._published_at = self._parse_time(self.published_at_raw)
+        return self._published_at
+
     def formatted_data(self) -> Generator[Element, None, None]:
         """
         Возвращает данные вакансии, подготовленные для вывода
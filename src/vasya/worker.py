@@ -0,0 +1,37 @@
+import argparse
+import os
+
+from .distributed import parse_address, run_worker
+from .errors import VasyaException
+
+
+def main() -> None:
+    """
+    Запускает исполнителя: python -m vasya.worker host:port.
+    Ключ берётся из переменной окружения VASYA_AUTHKEY.
+    """
+
+    parser = argparse.ArgumentParser(description="Исполнитель задач отчёта")
+    parser.add_argument("address", help="адрес координатора host:port")
+    parser.add_argument(
+        "--timeout", type=float, default=10.0, help="сколько секунд ждать координатора"
+    )
+    parser.add_argument(
+        "--forever", action="store_true", help="обрабатывать следующие отчёты"
+    )
+    args = parser.parse_args()
+
+    authkey = os.environ.get("VASYA_AUTHKEY")
+    if not authkey:
+        parser.error("не задана переменная окружения VASYA_AUTHKEY")
+
+    try:
+        run_worker(
+            parse_address(args.address), authkey.encode(), args.timeout, args.forever
+        )
+    except VasyaException as ex:
+        parser.exit(1, f"{ex}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+
+from src.vasya.aggregation import (
+    Count,
+    GroupBy,
+    Max,
+    Mean,
+    Measure,
+    Min,
+    SpilledResults,
+    Sum,
+    merge_partials,
+)
+from src.vasya.vacancy import Vacancy
+
+
+def make_vacancy(area_name: str, salary: int, year: int) -> Vacancy:
+    return Vacancy(
+        name="Программист",
+        salary_from=str(salary),
+        salary_to=str(salary),
+        salary_currency="RUR",
+        area_name=area_name,
+        published_at=f"{year}-01-01T12:00:00+0300",
+    )
+
+
+class TestGroupBy(unittest.TestCase):
+    def setUp(self):
+        self.group_by = GroupBy(
+            "Город и год",
+            ["area_name", "year"],
+            [Count(), Sum("salary_rub"), Mean("salary_rub")]
+            + [Min("salary_rub"), Max("salary_rub")],
+        )
+        self.vacancies = [
+            make_vacancy("Москва", 100, 2020),
+            make_vacancy("Москва", 300, 2020),
+            make_vacancy("Казань", 50, 2020),
+            make_vacancy("Москва", 200, 2021),
+        ]
+
+    def test_results(self):
+        partial = self.group_by.new_partial()
+        for vacancy in self.vacancies:
+            self.group_by.update(partial, vacancy)
+
+        results = self.group_by.results(partial)
+        self.assertEqual(
+            list(results), [("Казань", 2020), ("Москва", 2020), ("Москва", 2021)]
+        )
+        self.assertEqual(
+            results[("Москва", 2020)],
+            {
+                "count": 2,
+                "sum(salary_rub)": 400,
+                "mean(salary_rub)": 200,
+                "min(salary_rub)": 100,
+                "max(salary_rub)": 300,
+            },
+        )
+
+    def test_merge(self):
+        single = self.group_by.new_partial()
+        parts = [self.group_by.new_partial(), self.group_by.new_partial()]
+        for n, vacancy in enumerate(self.vacancies):
+            self.group_by.update(single, vacancy)
+            self.group_by.update(parts[n % 2], vacancy)
+
+        merged = merge_partials(
+            [self.group_by], [{self.group_by.name: part} for part in parts]
+        )
+        self.assertEqual(
+            self.group_by.results(merged[self.group_by.name]),
+            self.group_by.results(single),
+        )
+
+    def test_abstract_measure(self):
+        with self.assertRaises(TypeError):
+            Measure("salary_rub")
+
+    def test_spill(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            spilling = GroupBy(
+                "Город и год",
+                ["area_name", "year"],
+                self.group_by.measures,
+                max_groups=1,
+                partitions=2,
+            )
+            parts = [spilling.new_partial(spill_dir), spilling.new_partial(spill_dir)]
+            for n, vacancy in enumerate(self.vacancies):
+                spilling.update(parts[n % 2], vacancy)
+            for partial in parts:
+                spilling.finish(partial)
+            self.assertEqual(dict(parts[0]), {})
+
+            single = self.group_by.new_partial()
+            for vacancy in self.vacancies:
+                self.group_by.update(single, vacancy)
+
+            merged = merge_partials([spilling], [{spilling.name: i} for i in parts])
+            results = spilling.results(merged[spilling.name])
+            self.assertIsInstance(results, SpilledResults)
+            self.assertEqual(dict(results.items()), self.group_by.results(single))
+
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as spill_dir:
+            spilling = GroupBy(
+                "Город и год",
+                ["area_name", "year"],
+                self.group_by.measures,
+                max_groups=1,
+                partitions=2,
+            )
+            partial = spilling.new_partial(spill_dir)
+            single = self.group_by.new_partial()
+            for vacancy in self.vacancies:
+                spilling.update(partial, vacancy)
+                self.group_by.update(single, vacancy)
+            spilling.finish(partial)
+            self.assertTrue(partial.spilled)
+
+            spilling.load(partial)
+            self.assertFalse(partial.spilled)
+            self.assertEqual(os.listdir(spill_dir), [])
+            self.assertEqual(spilling.results(partial), self.group_by.results(single))
@@ -0,0 +1,20 @@
+import unittest
+
+from src.vasya.aho_corasick import AhoCorasick, ProfessionMatcher
+
+
+class TestAhoCorasick(unittest.TestCase):
+    def test_find(self):
+        patterns = ["he", "she", "his", "hers", "Программист"]
+        automaton = AhoCorasick(patterns)
+        for text in ("ushers", "his", "h", "", "Старший программист Python"):
+            expected = {i for i in patterns if i in text}
+            self.assertEqual(automaton.find(text), expected)
+
+    def test_matcher_order(self):
+        matcher = ProfessionMatcher(["Python", "Программист", "1С"])
+        self.assertEqual(
+            matcher.match("Программист 1С / Python"),
+            ("Python", "Программист", "1С"),
+        )
+        self.assertEqual(matcher.match("Аналитик"), ())
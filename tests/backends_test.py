@@ -0,0 +1,42 @@
+import unittest
+
+from src.vasya.backends import (
+    Backend,
+    InlineBackend,
+    InlineExecutor,
+    ThreadBackend,
+    available_backends,
+    get_backend,
+)
+from src.vasya.errors import VasyaException
+
+
+class TestBackends(unittest.TestCase):
+    def test_inline_executor(self):
+        with InlineExecutor() as executor:
+            future = executor.submit(pow, 2, 10)
+            self.assertTrue(future.done())
+            self.assertEqual(future.result(), 1024)
+
+            future = executor.submit(int, "x")
+            self.assertIsInstance(future.exception(), ValueError)
+
+    def test_get_backend(self):
+        self.assertIsInstance(get_backend("inline"), InlineBackend)
+        self.assertEqual(get_backend("thread", 2).workers, 2)
+        self.assertIn(get_backend("auto").name, ("process", "free-threaded"))
+
+        backend = ThreadBackend(3)
+        self.assertIs(get_backend(backend), backend)
+
+        with get_backend("thread", 2).executor() as executor:
+            self.assertEqual(list(executor.map(abs, [-1, -2])), [1, 2])
+
+    def test_unknown_backend(self):
+        self.assertIn("inline", available_backends())
+        with self.assertRaises(VasyaException):
+            get_backend("gpu")
+
+    def test_abstract_backend(self):
+        with self.assertRaises(TypeError):
+            Backend()
@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.vasya.cache import ArtifactCache, FileStatsCache
+from src.vasya.input_connect.report import InputConnectReport, Report
+
+
+class TestFileStatsCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.file = self.dir / "data_2020.csv"
+        self.file.write_text("name,salary\nтест,100\n", encoding="utf-8")
+        self.cache = FileStatsCache(str(self.dir / "cache"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hit(self):
+        self.assertIsNone(self.cache.get(self.file, "Программист"))
+        self.cache.put(self.file, "Программист", {"count": 1})
+        self.assertEqual(self.cache.get(self.file, "Программист"), {"count": 1})
+        self.assertIsNone(self.cache.get(self.file, "Аналитик"))
+
+    def test_touched_file(self):
+        self.cache.put(self.file, "Программист", {"count": 1})
+        stat = os.stat(self.file)
+        os.utime(self.file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(self.cache.get(self.file, "Программист"), {"count": 1})
+
+    def test_changed_file(self):
+        self.cache.put(self.file, "Программист", {"count": 1})
+        self.file.write_text("name,salary\nтест,200\n", encoding="utf-8")
+        self.assertIsNone(self.cache.get(self.file, "Программист"))
+
+    def test_checkpoint(self):
+        self.cache.put(self.file, "Программист", {"count": 1})
+        with open(self.file, "a", encoding="utf-8") as file:
+            file.write("тест,300\n")
+        size = len("name,salary\nтест,100\n".encode("utf-8"))
+        self.assertIsNone(self.cache.get(self.file, "Программист"))
+        self.assertEqual(
+            self.cache.get_checkpoint(self.file, "Программист"), (size, {"count": 1})
+        )
+
+    def test_checkpoint_changed_prefix(self):
+        self.cache.put(self.file, "Программист", {"count": 1})
+        self.file.write_text("name,salary\nтест,200\nтест,300\n", encoding="utf-8")
+        self.assertIsNone(self.cache.get_checkpoint(self.file, "Программист"))
+
+
+class TestArtifactCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.cache = ArtifactCache(str(self.dir / "artifacts"), max_size=250)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_eviction(self):
+        self.cache.put("a", "png", b"1" * 100)
+        self.cache.put("b", "png", b"2" * 100)
+        os.utime(self.cache.cache_dir / "a.png", ns=(0, 0))
+        os.utime(self.cache.cache_dir / "b.png", ns=(10**9, 10**9))
+        self.assertEqual(self.cache.get("a", "png"), b"1" * 100)
+
+        self.cache.put("c", "png", b"3" * 100)
+        self.assertIsNone(self.cache.get("b", "png"))
+        self.assertEqual(self.cache.get("a", "png"), b"1" * 100)
+        self.assertEqual(self.cache.get("c", "png"), b"3" * 100)
+
+    def test_render_hit(self):
+        file = self.dir / "data_2020.csv"
+        file.write_text(
+            "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+            "Программист,100,200,RUR,Москва,2020-01-01T12:00:00+0300\n",
+            encoding="utf-8",
+        )
+        report = InputConnectReport(str(file), "Программист", backend="inline")
+        report.prepare_data()
+        cache = ArtifactCache(str(self.dir / "artifacts"))
+
+        rendered = Report.render_artifacts(report, ("xlsx", "png"), cache=cache)
+        image_bytes = Report.image_bytes
+        Report.image_bytes = None
+        try:
+            cached = Report.render_artifacts(report, ("xlsx", "png"), cache=cache)
+        finally:
+            Report.image_bytes = image_bytes
+        self.assertEqual(cached, rendered)
+
+    def test_render_key(self):
+        file = self.dir / "data_2020.csv"
+        file.write_text(
+            "name,key_skills,salary_from,salary_to,salary_currency,area_name,"
+            "published_at\n"
+            + "".join(
+                f'Программист,"Python\nSQL{i % 7}",{i * 10},{i * 20},RUR,'
+                f"{('Москва', 'Пермь')[i % 2]},2020-01-01T12:00:00+0300\n"
+                for i in range(1, 401)
+            ),
+            encoding="utf-8",
+        )
+        report = InputConnectReport(
+            str(file),
+            "Программист",
+            backend="inline",
+            quantiles=(0.5,),
+            top_skills=2,
+            sample=0.5,
+        )
+        report.sample_block_size = 1000
+        report.prepare_data()
+        key = Report.artifacts_key(report, "")
+        city = report.cities_stats["Москва"]
+
+        city.quantiles[0.5] += 1
+        self.assertNotEqual(Report.artifacts_key(report, ""), key)
+        city.quantiles[0.5] -= 1
+        self.assertEqual(Report.artifacts_key(report, ""), key)
+
+        moments = city.moments.copy()
+        city.moments.add_block(1000, 1, 10**6)
+        self.assertNotEqual(Report.artifacts_key(report, ""), key)
+        city.moments = moments
+        self.assertEqual(Report.artifacts_key(report, ""), key)
+
+        report.years_stats[2020].skills.error += 1
+        self.assertNotEqual(Report.artifacts_key(report, ""), key)
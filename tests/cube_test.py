@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.vasya.cube import SalaryCube
+from src.vasya.input_connect import InputConnectReport, InputConnectReportCube
+
+
+class TestSalaryCube(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.data_dir = Path(cls.tmp.name) / "data"
+        cls.data_dir.mkdir()
+        names = ("Программист Python", "Аналитик", "Программист Java", "Тестировщик")
+        cities = ("Москва", "Казань", "Пермь")
+        currencies = ("RUR", "USD", "EUR")
+        for year in (2019, 2020):
+            rows = "\n".join(
+                f"{names[i % 4]},{i * 37},{i * 91},{currencies[i % 3]},"
+                f"{cities[i % 3]},{year}-0{i % 9 + 1}-01T12:00:00+0300"
+                for i in range(1, 301)
+            )
+            (cls.data_dir / f"data_{year}.csv").write_text(
+                "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+                + rows,
+                encoding="utf-8",
+            )
+        cls.cache_dir = str(Path(cls.tmp.name) / "cube")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_same_as_report(self):
+        professions = ["Программист", "Аналитик", "Дизайнер"]
+        report = InputConnectReport(str(self.data_dir), professions, backend="inline")
+        report.prepare_data()
+
+        cube = InputConnectReportCube(
+            str(self.data_dir), professions, self.cache_dir, backend="inline"
+        )
+        cube.prepare_data()
+
+        self.assertEqual(cube.to_dict(), report.to_dict())
+
+    def test_cached(self):
+        InputConnectReportCube(
+            str(self.data_dir), "Аналитик", self.cache_dir, backend="inline"
+        ).prepare_data()
+
+        cube = InputConnectReportCube(
+            str(self.data_dir), "Тестировщик", self.cache_dir, backend="inline"
+        )
+        cube.process_file = None
+        cube.prepare_data()
+        self.assertEqual(cube.vacancy_stats[2020].count, 75)
+
+    def test_professions(self):
+        cube = SalaryCube()
+        self.assertEqual(cube.professions(["Программист"]), {"Программист": {}})
@@ -0,0 +1,179 @@
+import asyncio
+import base64
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.vasya.daemon import StatsDaemon
+from src.vasya.errors import VasyaException
+
+
+class TestDaemon(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        rows = "\n".join(
+            f"Программист {i},{i * 100},{i * 200},RUR,"
+            f"{'Москва' if i % 3 else 'Казань'},2020-0{i % 9 + 1}-01T12:00:00+0300"
+            for i in range(1, 101)
+        )
+        cls.file = Path(cls.tmp.name) / "data_2020.csv"
+        cls.file.write_text(
+            "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+            + rows,
+            encoding="utf-8",
+        )
+        cls.daemon = StatsDaemon(workers=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.daemon.close()
+        cls.tmp.cleanup()
+
+    def request(self, **request):
+        return asyncio.run(self.daemon.handle_request(request))
+
+    def test_stats(self):
+        request = {
+            "type": "stats",
+            "path": self.tmp.name,
+            "professions": ["Программист"],
+        }
+        response = self.request(**request)
+        self.assertTrue(response["ok"])
+        self.assertEqual(response["result"]["total_vacancies"], 100)
+        self.assertEqual(response["result"]["years"]["2020"]["count"], 100)
+
+        self.assertEqual(self.request(**request)["result"], response["result"])
+        self.assertEqual(len(self.daemon._reports), 1)
+
+    def test_table(self):
+        response = self.request(
+            type="table",
+            path=str(self.file),
+            filter_by="Название региона: Казань",
+            limit="1 3",
+            needed_columns="Название",
+        )
+        self.assertTrue(response["ok"])
+        self.assertEqual(
+            response["result"]["rows"],
+            [
+                {"№": 1, "Название": "Программист 3"},
+                {"№": 2, "Название": "Программист 6"},
+            ],
+        )
+
+    def test_errors(self):
+        self.assertFalse(self.request(type="unknown")["ok"])
+        self.assertFalse(self.request(type="stats", path=self.tmp.name)["ok"])
+        self.assertFalse(self.request(type="table", path="missing.csv")["ok"])
+        self.assertTrue(self.request(type="ping")["ok"])
+
+    def test_unexpected_error(self):
+        response = self.request(type="table", path=str(self.file), limit=5)
+        self.assertFalse(response["ok"])
+        self.assertEqual(response["error_type"], "AttributeError")
+        self.assertTrue(self.request(type="ping")["ok"])
+
+    def test_artifacts(self):
+        output_dir = Path(self.tmp.name) / "output"
+        response = self.request(
+            type="stats",
+            path=self.tmp.name,
+            professions=["Программист"],
+            output_dir=str(output_dir),
+            artifacts=["xlsx", "png"],
+        )
+        self.assertTrue(response["ok"])
+        self.assertEqual(
+            response["result"]["artifacts"],
+            [str(output_dir / "report.xlsx"), str(output_dir / "graph.png")],
+        )
+        self.assertTrue((output_dir / "report.xlsx").exists())
+        self.assertTrue((output_dir / "graph.png").exists())
+
+        response = self.request(
+            type="stats",
+            path=self.tmp.name,
+            professions=["Программист"],
+            output_dir=str(output_dir),
+            artifacts=["docx"],
+        )
+        self.assertFalse(response["ok"])
+
+    def test_artifacts_in_memory(self):
+        response = self.request(
+            type="stats",
+            path=self.tmp.name,
+            professions=["Программист"],
+            artifacts=["png"],
+        )
+        self.assertTrue(response["ok"])
+        image = base64.b64decode(response["result"]["artifacts"]["png"])
+        self.assertTrue(image.startswith(b"\x89PNG"))
+
+
+class TestDaemonSafety(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "root"
+        self.root.mkdir()
+        (self.root / "data_2020.csv").write_text(
+            "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+            "Программист,100,200,RUR,Москва,2020-01-01T12:00:00+0300\n",
+            encoding="utf-8",
+        )
+        self.daemon = StatsDaemon(workers=1, root=str(self.root), authkey="key")
+
+    def tearDown(self):
+        self.daemon.close()
+        self.tmp.cleanup()
+
+    def request(self, **request):
+        return asyncio.run(self.daemon.handle_request({"authkey": "key", **request}))
+
+    def stats(self, **request):
+        return self.request(
+            type="stats", path=str(self.root), professions=["Программист"], **request
+        )
+
+    def test_authkey(self):
+        self.assertTrue(self.request(type="ping")["ok"])
+        for authkey in ("", "other", None):
+            response = asyncio.run(
+                self.daemon.handle_request({"type": "ping", "authkey": authkey})
+            )
+            self.assertFalse(response["ok"])
+        self.assertFalse(
+            asyncio.run(self.daemon.handle_request({"type": "ping"}))["ok"]
+        )
+
+    def test_serve_without_authkey(self):
+        self.daemon.authkey = None
+        with self.assertRaises(VasyaException):
+            asyncio.run(self.daemon.serve("0.0.0.0", 0))
+
+    def test_root(self):
+        self.assertTrue(self.stats()["ok"])
+        self.assertTrue(
+            self.stats(output_dir=str(self.root / "output"), artifacts=["png"])["ok"]
+        )
+        self.assertFalse(self.stats(output_dir=self.tmp.name)["ok"])
+        self.assertFalse(self.stats(output_dir=str(self.root / ".." / "output"))["ok"])
+        self.assertFalse(self.stats(template_path="/etc/passwd")["ok"])
+        self.assertFalse(self.stats(rates="/etc/passwd")["ok"])
+        self.assertFalse(
+            self.request(type="stats", path=self.tmp.name, professions=["a"])["ok"]
+        )
+        self.assertFalse(self.request(type="table", path="/etc/passwd")["ok"])
+        self.assertFalse((Path(self.tmp.name) / "report.xlsx").exists())
+
+    def test_broken_pool(self):
+        for process in list(self.daemon._pool._processes.values()):
+            process.kill()
+            process.join()
+        response = self.stats(chunk_size=None)
+        self.assertFalse(response["ok"])
+        self.assertEqual(response["error_type"], "BrokenProcessPool")
+        self.assertTrue(self.stats(chunk_size=None)["ok"])
@@ -0,0 +1,102 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.vasya.dataset import DataSet
+from src.vasya.input_connect.report import InputConnectReport
+
+
+class TestSplit(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.file = Path(self.tmp.name) / "data_2020.csv"
+        rows = "\n".join(
+            f"Программист {i},{i * 100},{i * 200},RUR,Москва,2020-01-01T12:00:00+0300"
+            for i in range(100)
+        )
+        self.file.write_text(
+            "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+            + rows,
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_split(self):
+        chunks = DataSet.split(str(self.file), 1000)
+        self.assertGreater(len(chunks), 1)
+        self.assertIsNone(chunks[-1][1])
+
+        names = [
+            vacancy.name
+            for start, end in chunks
+            for vacancy in DataSet.from_file(str(self.file), start, end)
+        ]
+        self.assertEqual(
+            names, [vacancy.name for vacancy in DataSet.from_file(str(self.file))]
+        )
+        self.assertEqual(len(names), 100)
+
+    def test_split_small_file(self):
+        self.assertEqual(len(DataSet.split(str(self.file), 1 << 20)), 1)
+
+
+class TestSplitQuoted(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.file = Path(self.tmp.name) / "data_2020.csv"
+        # Навыки в кавычках с переводами строки, как в выгрузках hh
+        rows = "\n".join(
+            f'Программист {i},"Python\nSQL\n""Git"", Docker",{i * 100},{i * 200},'
+            f"RUR,Москва,{2019 + i % 2}-01-01T12:00:00+0300"
+            for i in range(1, 201)
+        )
+        self.file.write_text(
+            "name,key_skills,salary_from,salary_to,salary_currency,area_name,"
+            "published_at\n" + rows + "\n",
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_split(self):
+        for chunk_size in (100, 777, 1000):
+            chunks = DataSet.split(str(self.file), chunk_size)
+            self.assertGreater(len(chunks), 1)
+            vacancies = [
+                vacancy
+                for start, end in chunks
+                for vacancy in DataSet.from_file(str(self.file), start, end)
+            ]
+            self.assertEqual(
+                [(i.name, list(i.key_skills)) for i in vacancies],
+                [
+                    (i.name, list(i.key_skills))
+                    for i in DataSet.from_file(str(self.file))
+                ],
+            )
+            self.assertEqual(len(vacancies), 200)
+
+    def test_rows_end(self):
+        size = self.file.stat().st_size
+        self.assertEqual(DataSet.rows_end(str(self.file)), size)
+        with open(self.file, "a", encoding="utf-8") as file:
+            file.write('Программист 0,"Python\nSQL')
+        self.assertEqual(DataSet.rows_end(str(self.file)), size)
+
+    def test_report(self):
+        answers = []
+        for chunk_size in (None, 1000):
+            report = InputConnectReport(
+                self.tmp.name,
+                "Программист",
+                chunk_size=chunk_size,
+                backend="inline",
+                top_skills=3,
+            )
+            report.prepare_data()
+            answers.append(report.to_dict())
+        self.assertEqual(answers[0], answers[1])
+        self.assertEqual(answers[0]["total_vacancies"], 200)
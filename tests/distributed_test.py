@@ -0,0 +1,144 @@
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from src.vasya.aggregation import Count, GroupBy
+from src.vasya.backends import DistributedBackend
+from src.vasya.distributed import Coordinator, parse_address
+from src.vasya.errors import VasyaException
+from src.vasya.input_connect.report import InputConnectReport
+
+
+def die_once(marker: str, value: int) -> int:
+    if not os.path.exists(marker):
+        Path(marker).touch()
+        os._exit(1)
+    return value * 2
+
+
+def always_die() -> None:
+    os._exit(1)
+
+
+class TestCoordinator(unittest.TestCase):
+    def test_results(self):
+        with Coordinator(("localhost", 0), b"key", local_workers=2) as executor:
+            futures = [executor.submit(pow, i, 2) for i in range(10)]
+            error = executor.submit(int, "x")
+        self.assertEqual([i.result() for i in futures], [i * i for i in range(10)])
+        self.assertIsInstance(error.exception(), ValueError)
+
+    def test_worker_dies(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            marker = os.path.join(tmp, "marker")
+            with Coordinator(("localhost", 0), b"key", local_workers=2) as executor:
+                future = executor.submit(die_once, marker, 21)
+            self.assertEqual(future.result(), 42)
+
+    def test_max_attempts(self):
+        with Coordinator(
+            ("localhost", 0), b"key", local_workers=2, max_attempts=2
+        ) as executor:
+            future = executor.submit(always_die)
+        self.assertIsInstance(future.exception(), VasyaException)
+
+    def test_more_workers_than_tasks(self):
+        results = []
+
+        def run():
+            for _ in range(3):
+                with Coordinator(("localhost", 0), b"key", local_workers=8) as executor:
+                    futures = [executor.submit(pow, i, 2) for i in range(2)]
+                results.append([i.result() for i in futures])
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(60)
+        self.assertFalse(thread.is_alive(), "координатор не закрылся")
+        self.assertEqual(results, [[0, 1]] * 3)
+
+    def test_parse_address(self):
+        self.assertEqual(parse_address("10.0.0.1:6000"), ("10.0.0.1", 6000))
+        with self.assertRaises(VasyaException):
+            parse_address("localhost")
+
+
+class TestDistributedReport(unittest.TestCase):
+    def test_same_as_inline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for year in (2020, 2021):
+                rows = "\n".join(
+                    f"Программист {i},{i * 100},{i * 200},RUR,"
+                    f"{'Москва' if i % 3 else 'Казань'},{year}-0{i % 9 + 1}-01T12:00:00+0300"
+                    for i in range(300)
+                )
+                Path(tmp, f"data_{year}.csv").write_text(
+                    "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+                    + rows,
+                    encoding="utf-8",
+                )
+
+            reports = [
+                InputConnectReport(tmp, "Программист", backend="inline"),
+                InputConnectReport(
+                    tmp,
+                    "Программист",
+                    chunk_size=2000,
+                    backend=DistributedBackend(2, authkey=b"key"),
+                ),
+            ]
+            for report in reports:
+                report.prepare_data()
+
+            inline, distributed = reports
+            self.assertEqual(
+                {k: (v.salary, v.count) for k, v in inline.years_stats.items()},
+                {k: (v.salary, v.count) for k, v in distributed.years_stats.items()},
+            )
+            self.assertEqual(
+                {k: (v.salary, v.count) for k, v in inline.cities_stats.items()},
+                {k: (v.salary, v.count) for k, v in distributed.cities_stats.items()},
+            )
+
+    def test_spilled_groups(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            rows = "\n".join(
+                f"Программист {i},{i * 100},{i * 200},RUR,"
+                f"Город {i % 50},2020-0{i % 9 + 1}-01T12:00:00+0300"
+                for i in range(300)
+            )
+            Path(tmp, "data_2020.csv").write_text(
+                "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+                + rows,
+                encoding="utf-8",
+            )
+
+            def report(backend, max_groups):
+                group_by = GroupBy("Города", ["area_name"], [Count()], max_groups)
+                return InputConnectReport(
+                    tmp,
+                    "Программист",
+                    chunk_size=2000,
+                    group_by=[group_by],
+                    backend=backend,
+                )
+
+            # Исполнитель на другой машине не видит директорию координатора,
+            # поэтому группы возвращаются в памяти, а не путями до файлов
+            remote = report(DistributedBackend(1, authkey=b"key"), 5)
+            result, _ = remote.process_file(Path(tmp, "data_2020.csv"))
+            partial = result[3]["Города"]
+            self.assertFalse(partial.spilled)
+            self.assertEqual(len(partial), 50)
+            self.assertEqual(partial.spill_dir, remote.spill_dir)
+            self.assertEqual(os.listdir(remote.spill_dir), [])
+
+            remote.prepare_data()
+            inline = report("inline", None)
+            inline.prepare_data()
+            self.assertEqual(
+                dict(remote.groups_stats["Города"].items()),
+                dict(inline.groups_stats["Города"].items()),
+            )
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+
+class TestLazyImports(unittest.TestCase):
+    def loaded(self, code):
+        return subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"import sys\n{code}\n"
+                "print(*sorted(i for i in ('matplotlib', 'openpyxl', 'jinja2', "
+                "'pdfkit') if i in sys.modules))",
+            ],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+
+    def test_table(self):
+        self.assertEqual(
+            self.loaded("from src.vasya import InputConnectTable, VasyaException"), []
+        )
+
+    def test_report(self):
+        self.assertEqual(self.loaded("from src.vasya import InputConnectReport"), [])
+        self.assertEqual(
+            self.loaded("from src.vasya.input_connect.report import Report"),
+            ["jinja2", "matplotlib", "openpyxl", "pdfkit"],
+        )
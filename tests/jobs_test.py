@@ -0,0 +1,129 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.vasya import run_report, run_table
+from src.vasya.errors import VasyaException
+from src.vasya.input_connect import InputConnectReport
+from src.vasya.jobs import JobRunner, load_jobs
+
+
+class TestJobRunner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.data_dir = Path(cls.tmp.name) / "data"
+        cls.data_dir.mkdir()
+        names = ("Программист Python", "Аналитик", "Тестировщик")
+        cities = ("Москва", "Казань", "Пермь")
+        for year in (2019, 2020):
+            rows = "\n".join(
+                f"{names[i % 3]},{i * 37},{i * 91},RUR,"
+                f"{cities[i % 3]},{year}-0{i % 9 + 1}-01T12:00:00+0300"
+                for i in range(1, 101)
+            )
+            (cls.data_dir / f"data_{year}.csv").write_text(
+                "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+                + rows,
+                encoding="utf-8",
+            )
+        cls.file = str(cls.data_dir / "data_2020.csv")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def expected(self, professions, **options):
+        report = InputConnectReport(
+            str(self.data_dir), professions, backend="inline", **options
+        )
+        report.prepare_data()
+        return report.to_dict()
+
+    def test_shared_report(self):
+        jobs = [
+            {"type": "stats", "path": str(self.data_dir), "professions": ["Аналитик"]},
+            {
+                "type": "stats",
+                "path": str(self.data_dir),
+                "professions": ["Тестировщик", "Программист"],
+                "granularity": "month",
+            },
+            {
+                "type": "stats",
+                "path": str(self.data_dir),
+                "professions": ["Программист", "Аналитик"],
+            },
+        ]
+        with JobRunner("inline") as runner:
+            answers = runner.run_all(jobs)
+            self.assertEqual(len(runner._reports), 2)
+
+        self.assertTrue(all(i["ok"] for i in answers))
+        self.assertEqual(answers[0]["result"], self.expected(["Аналитик"]))
+        self.assertEqual(
+            answers[1]["result"],
+            self.expected(["Тестировщик", "Программист"], granularity="month"),
+        )
+        self.assertEqual(
+            answers[2]["result"], self.expected(["Программист", "Аналитик"])
+        )
+
+    def test_string_profession(self):
+        jobs = [
+            {"type": "stats", "path": str(self.data_dir), "professions": "Аналитик"},
+            {
+                "type": "stats",
+                "path": str(self.data_dir),
+                "professions": ["Тестировщик"],
+            },
+        ]
+        with JobRunner("inline") as runner:
+            answers = runner.run_all(jobs)
+            self.assertEqual(
+                list(runner._planned.values()), [["Аналитик", "Тестировщик"]]
+            )
+
+        self.assertTrue(all(i["ok"] for i in answers))
+        self.assertEqual(answers[0]["result"], self.expected(["Аналитик"]))
+        self.assertEqual(answers[1]["result"], self.expected(["Тестировщик"]))
+
+    def test_table(self):
+        jobs = [
+            {"type": "table", "path": self.file, "limit": "1 3"},
+            {"type": "table", "path": self.file, "sort_by": "Название"},
+            {"type": "table", "path": self.file, "filter_by": "Название: Дизайнер"},
+            {"type": "unknown"},
+        ]
+        with JobRunner("inline") as runner:
+            answers = runner.run_all(jobs)
+            self.assertEqual(len(runner._datasets), 1)
+
+        self.assertEqual(len(answers[0]["result"]["rows"]), 2)
+        self.assertEqual(len(answers[1]["result"]["rows"]), 100)
+        self.assertFalse(answers[2]["ok"])
+        self.assertFalse(answers[3]["ok"])
+
+    def test_load_jobs(self):
+        jobs = [{"type": "table", "path": self.file}]
+        json_file = Path(self.tmp.name) / "jobs.json"
+        json_file.write_text(json.dumps({"jobs": jobs}), encoding="utf-8")
+        toml_file = Path(self.tmp.name) / "jobs.toml"
+        toml_file.write_text(
+            f'[[jobs]]\ntype = "table"\npath = {json.dumps(self.file)}\n',
+            encoding="utf-8",
+        )
+        self.assertEqual(load_jobs(str(json_file)), jobs)
+        self.assertEqual(load_jobs(str(toml_file)), jobs)
+
+        json_file.write_text("{}", encoding="utf-8")
+        with self.assertRaises(VasyaException):
+            load_jobs(str(json_file))
+
+    def test_api(self):
+        self.assertEqual(
+            run_report(str(self.data_dir), "Аналитик", backend="inline"),
+            self.expected("Аналитик"),
+        )
+        self.assertEqual(run_table(self.file, limit="5")[0]["№"], 5)
@@ -0,0 +1,38 @@
+import unittest
+from datetime import date, timedelta
+
+from src.vasya.periods import (
+    days_from_civil,
+    period_key,
+    period_label,
+    period_start,
+    rolling_means,
+)
+
+
+class TestPeriods(unittest.TestCase):
+    def test_days_from_civil(self):
+        day = date(1999, 12, 25)
+        while day < date(2025, 3, 5):
+            self.assertEqual(
+                days_from_civil(day.year, day.month, day.day),
+                (day - date(1970, 1, 1)).days,
+            )
+            day += timedelta(days=17)
+
+    def test_period_key(self):
+        published_at = "2020-03-15T12:00:00+0300"
+        self.assertEqual(period_key(published_at, "year"), 2020)
+        self.assertEqual(
+            period_label(period_key(published_at, "month"), "month"), "2020-03"
+        )
+        week = period_key(published_at, "week")
+        self.assertEqual(period_start(week, "week"), date(2020, 3, 9))
+        self.assertEqual(period_key("2020-03-16T00:00:00+0300", "week"), week + 1)
+
+    def test_rolling_means(self):
+        totals = {0: (100.0, 1), 1: (600.0, 3), 3: (300.0, 2)}
+        self.assertEqual(
+            rolling_means(totals, 2),
+            {0: (100, 1.0), 1: (175, 2.0), 3: (150, 1.0)},
+        )
@@ -0,0 +1,59 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.vasya.errors import VasyaException
+from src.vasya.rates import RateTable, load_rates
+from src.vasya.vacancy import Vacancy
+
+
+class TestRateTable(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.file = Path(self.tmp.name) / "rates.csv"
+        self.file.write_text(
+            "Date,USD,EUR\n" "2020-01,60,\n" "2020-02,,70\n" "2020-04,65,75\n",
+            encoding="utf-8",
+        )
+        self.table = RateTable.from_csv(str(self.file))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_forward_fill(self):
+        self.assertEqual(self.table.months, 4)
+        self.assertEqual(self.table.get("USD", "2020-02-10T00:00:00+0300"), 60)
+        self.assertEqual(self.table.get("USD", "2020-03-10T00:00:00+0300"), 60)
+        self.assertEqual(self.table.get("USD", "2020-04-10T00:00:00+0300"), 65)
+        self.assertEqual(self.table.get("EUR", "2020-03-10T00:00:00+0300"), 70)
+
+    def test_bounds(self):
+        self.assertEqual(self.table.get("EUR", "2020-01-10T00:00:00+0300"), 70)
+        self.assertEqual(self.table.get("USD", "2019-05-10T00:00:00+0300"), 60)
+        self.assertEqual(self.table.get("USD", "2023-05-10T00:00:00+0300"), 65)
+        self.assertEqual(self.table.get("RUR", "2023-05-10T00:00:00+0300"), 1.0)
+        self.assertIsNone(self.table.get("KZT", "2020-01-10T00:00:00+0300"))
+
+    def test_vacancy(self):
+        fields = dict(
+            name="Программист",
+            salary_from="100",
+            salary_to="300",
+            area_name="Москва",
+            published_at="2020-03-10T00:00:00+0300",
+        )
+        self.assertEqual(
+            Vacancy(**fields, salary_currency="USD", rates=self.table).salary_rub,
+            200 * 60,
+        )
+        self.assertEqual(
+            Vacancy(**fields, salary_currency="KZT", rates=self.table).salary_rub,
+            Vacancy(**fields, salary_currency="KZT").salary_rub,
+        )
+
+    def test_default_rates(self):
+        table = load_rates()
+        self.assertIs(load_rates(), table)
+        self.assertIn("USD", table.currencies)
+        with self.assertRaises(VasyaException):
+            RateTable.from_csv(str(Path(self.tmp.name) / "missing.csv"))
@@ -0,0 +1,313 @@
+import tempfile
+import unittest
+from collections import Counter
+from pathlib import Path
+
+from src.vasya.dataset import DataSet
+from src.vasya.errors import VasyaException
+from src.vasya.input_connect.report import InputConnectReport, Report
+
+
+class TestRenderBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        names = ("Программист Python", "Аналитик", "Программист Java")
+        cities = ("Москва", "Казань", "Пермь")
+        for year in (2019, 2020):
+            rows = "\n".join(
+                f"{names[i % 3]},{i * 37},{i * 91},RUR,"
+                f"{cities[i % 3]},{year}-{i % 12 + 1:02}-01T12:00:00+0300"
+                for i in range(1, 101)
+            )
+            (Path(cls.tmp.name) / f"data_{year}.csv").write_text(
+                "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+                + rows,
+                encoding="utf-8",
+            )
+        cls.professions = ["Программист", "Аналитик"]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def report(self, profession, granularity):
+        report = InputConnectReport(
+            self.tmp.name, profession, backend="inline", granularity=granularity
+        )
+        report.prepare_data()
+        return report
+
+    def test_for_profession(self):
+        report = self.report(self.professions, "month").for_profession("Аналитик")
+        single = self.report(["Аналитик", "Программист"], "month")
+        self.assertEqual(report.vacancy_periods_stats, single.vacancy_periods_stats)
+        self.assertEqual(report.vacancy_rolling_stats, single.vacancy_rolling_stats)
+        with self.assertRaises(VasyaException):
+            report.for_profession("Дизайнер")
+
+    def test_same_images(self):
+        for granularity in ("year", "month"):
+            batch = Report.render_batch(
+                self.report(self.professions, granularity), artifacts=("png",)
+            )
+            self.assertEqual(list(batch), self.professions)
+            for profession in self.professions:
+                self.assertEqual(
+                    batch[profession]["png"],
+                    Report.image_bytes(self.report(profession, granularity)),
+                )
+
+
+class TestBackends(unittest.TestCase):
+    def test_same_results(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            names = ("Программист Python", "Аналитик", "Программист Java")
+            for file_year in (2021, 2019, 2020):
+                # Вакансии разных лет в одном файле в обратном порядке
+                rows = "\n".join(
+                    f"{names[i % 3]},{i * 37},{i * 91},RUR,{'Москва' if i % 4 else 'Пермь'},"
+                    f"{file_year - i % 3}-{i % 12 + 1:02}-01T12:00:00+0300"
+                    for i in range(1, 301)
+                )
+                Path(tmp, f"data_{file_year}.csv").write_text(
+                    "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+                    + rows,
+                    encoding="utf-8",
+                )
+
+            answers = []
+            for backend in ("inline", "thread", "process"):
+                report = InputConnectReport(
+                    tmp,
+                    ["Программист", "Аналитик"],
+                    chunk_size=1000,
+                    backend=backend,
+                    workers=2,
+                    granularity="month",
+                )
+                report.prepare_data()
+                self.assertEqual(list(report.years_stats), sorted(report.years_stats))
+                self.assertEqual(
+                    list(report.vacancy_stats), sorted(report.vacancy_stats)
+                )
+                answers.append(report.to_dict())
+
+        self.assertEqual(answers[0], answers[1])
+        self.assertEqual(answers[0], answers[2])
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name) / "data"
+        self.dir.mkdir()
+        self.file = self.dir / "data_2020.csv"
+        self.file.write_text(
+            "name,key_skills,salary_from,salary_to,salary_currency,area_name,"
+            "published_at\n"
+            + "".join(
+                f'Программист {i},"Python\nSQL",{i * 100},{i * 200},RUR,Москва,'
+                f"2020-0{i}-01T12:00:00+0300\n"
+                for i in range(1, 6)
+            ),
+            encoding="utf-8",
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def prepare(self, **kwargs):
+        report = InputConnectReport(
+            str(self.dir), "Программист", backend="inline", top_skills=3, **kwargs
+        )
+        report.prepare_data()
+        return report.to_dict()
+
+    def test_incomplete_row(self):
+        cache_dir = str(Path(self.tmp.name) / "cache")
+        first = self.prepare(cache_dir=cache_dir, checkpoint=True)
+        self.assertEqual(first["total_vacancies"], 5)
+
+        # Дописанная не до конца строка с переводом строки внутри кавычек
+        with open(self.file, "a", encoding="utf-8") as file:
+            file.write('Программист 6,"Go\nDocker\n')
+        self.assertEqual(self.prepare(cache_dir=cache_dir, checkpoint=True), first)
+
+        with open(self.file, "a", encoding="utf-8") as file:
+            file.write('Git",600,1200,RUR,Пермь,2020-06-01T12:00:00+0300\n')
+        answer = self.prepare(cache_dir=cache_dir, checkpoint=True)
+        self.assertEqual(answer["total_vacancies"], 6)
+        self.assertEqual(answer, self.prepare())
+
+
+class TestSample(unittest.TestCase):
+    def test_periods(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            rows = "\n".join(
+                f"Программист {i},{i * 10},{i * 20},RUR,Москва,"
+                f"2020-{i % 12 + 1:02}-01T12:00:00+0300"
+                for i in range(1, 1201)
+            )
+            Path(tmp, "data_2020.csv").write_text(
+                "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+                + rows
+                + "\n",
+                encoding="utf-8",
+            )
+            report = InputConnectReport(
+                tmp, "Программист", backend="inline", sample=0.3, granularity="month"
+            )
+            report.sample_block_size = 1000
+            report.prepare_data()
+
+        year = report.years_stats[2020].count
+        self.assertGreater(report.years_stats[2020].moments.scale, 2)
+        for periods, total in (
+            (report.periods_stats, year),
+            (report.vacancy_periods_stats, report.vacancy_stats[2020].count),
+        ):
+            self.assertEqual(len(periods), 12)
+            # Количества за месяцы округляются по отдельности
+            self.assertLessEqual(abs(sum(i.count for i in periods.values()) - total), 6)
+        rolling = report.rolling_stats[12][max(report.periods_stats)][1]
+        self.assertAlmostEqual(rolling, year / 12, delta=1)
+
+
+class TestFeatures(unittest.TestCase):
+    """
+    Отчёт по одним данным с дополнительными возможностями и без них
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name) / "data"
+        self.dir.mkdir()
+        names = ("Программист Python", "Аналитик данных", "Программист Java")
+        skills = ("Python", "SQL", "Git", "Docker", "Excel")
+        for year in (2019, 2020):
+            rows = "".join(
+                f'{names[i % 3]},"{skills[i % 5]}\n{skills[i % 3]}",'
+                f"Компания {i % 17},{i * 37},{i * 91},RUR,"
+                f"{('Москва', 'Казань', 'Пермь')[i % 3 // 2]},"
+                f"{year}-{i % 12 + 1:02}-01T12:00:00+0300\n"
+                for i in range(1, 301)
+            )
+            (self.dir / f"data_{year}.csv").write_text(
+                "name,key_skills,employer_name,salary_from,salary_to,"
+                "salary_currency,area_name,published_at\n" + rows,
+                encoding="utf-8",
+            )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def prepare(self, professions=("Программист",), **kwargs):
+        report = InputConnectReport(
+            str(self.dir), list(professions), backend="inline", **kwargs
+        )
+        report.prepare_data()
+        return report
+
+    @classmethod
+    def without(cls, answer, keys):
+        """
+        Ответ отчёта без ключей дополнительной возможности
+        """
+
+        if not isinstance(answer, dict):
+            return answer
+        return {
+            key: cls.without(value, keys)
+            for key, value in answer.items()
+            if key not in keys
+        }
+
+    def salaries(self, year):
+        vacancies = DataSet.from_file(str(self.dir / f"data_{year}.csv"))
+        return sorted(i.salary_rub for i in vacancies)
+
+    def test_cache(self):
+        cache_dir = str(Path(self.tmp.name) / "cache")
+        expected = self.prepare().to_dict()
+        report = self.prepare(cache_dir=cache_dir)
+        self.assertEqual(report.to_dict(), expected)
+
+        files = sorted(self.dir.iterdir())
+        for file in files:
+            self.assertIsNotNone(report.cache.get(file, report._cache_key))
+        self.assertEqual(self.prepare(cache_dir=cache_dir).to_dict(), expected)
+
+        files[0].write_text(
+            files[0].read_text(encoding="utf-8").replace(",37,", ",1037,"),
+            encoding="utf-8",
+        )
+        self.assertIsNone(report.cache.get(files[0], report._cache_key))
+        self.assertIsNotNone(report.cache.get(files[1], report._cache_key))
+        changed = self.prepare(cache_dir=cache_dir).to_dict()
+        self.assertNotEqual(changed, expected)
+        self.assertEqual(changed, self.prepare().to_dict())
+
+    def test_professions(self):
+        professions = ("Программист", "Аналитик")
+        report = self.prepare(professions, granularity="month")
+        for profession in professions:
+            single = self.prepare((profession,), granularity="month")
+            self.assertEqual(
+                report.for_professions([profession]).to_dict(), single.to_dict()
+            )
+            self.assertEqual(
+                report.to_dict()["professions_years"][profession],
+                single.to_dict()["professions_years"][profession],
+            )
+
+    def test_quantiles(self):
+        quantiles = (0.1, 0.5, 0.9)
+        answer = self.prepare(quantiles=quantiles).to_dict()
+        self.assertEqual(
+            self.without(answer, ("quantiles", "cities_quantiles")),
+            self.prepare().to_dict(),
+        )
+        for year in (2019, 2020):
+            salaries = self.salaries(year)
+            for q in quantiles:
+                # Ранг оценки отличается от q не больше чем на 2%
+                value = answer["years"][str(year)]["quantiles"][str(q)]
+                self.assertGreaterEqual(
+                    value, salaries[int(len(salaries) * (q - 0.02))]
+                )
+                self.assertLessEqual(value, salaries[int(len(salaries) * (q + 0.02))])
+        self.assertEqual(set(answer["cities_quantiles"]), set(answer["cities_salary"]))
+
+    def test_distinct(self):
+        answer = self.prepare(distinct_precision=12).to_dict()
+        self.assertEqual(self.without(answer, ("distinct",)), self.prepare().to_dict())
+        for year in (2019, 2020):
+            vacancies = DataSet.from_file(str(self.dir / f"data_{year}.csv")).to_list()
+            for key in InputConnectReport.distinct_fields:
+                exact = len({getattr(i, key) for i in vacancies})
+                self.assertAlmostEqual(
+                    answer["distinct"][key][str(year)], exact, delta=exact * 0.05
+                )
+
+    def test_top_skills(self):
+        answer = self.prepare(top_skills=3).to_dict()
+        self.assertEqual(
+            self.without(
+                answer,
+                ("skills", "vacancy_skills", "skills_error", "vacancy_skills_error"),
+            ),
+            self.prepare().to_dict(),
+        )
+
+        def top(vacancies):
+            counts = Counter(skill for i in vacancies for skill in i.key_skills)
+            return sorted(counts.items(), key=lambda x: (-x[1], x[0]))[:3]
+
+        profession = []
+        for year in (2019, 2020):
+            vacancies = DataSet.from_file(str(self.dir / f"data_{year}.csv")).to_list()
+            profession += [i for i in vacancies if i.name.startswith("Программист")]
+            self.assertEqual(answer["skills"][str(year)], top(vacancies))
+            self.assertEqual(answer["skills_error"][str(year)], 0)
+        self.assertEqual(answer["vacancy_skills"], top(profession))
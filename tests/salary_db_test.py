@@ -0,0 +1,62 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.vasya.errors import VasyaException
+from src.vasya.input_connect import InputConnectReport, InputConnectReportSQLite
+from src.vasya.salary_db import SalaryDatabase
+
+
+class TestSalaryDatabase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cities = ("Москва", "Казань", "Пермь", "Тверь")
+        currencies = ("RUR", "USD", "EUR")
+        for year in (2019, 2020):
+            rows = "\n".join(
+                f"{'Программист' if i % 4 else 'Аналитик'} {i},{i * 37},{i * 91},"
+                f"{currencies[i % 3]},{cities[i % 4]},{year}-0{i % 9 + 1}-01T12:00:00+0300"
+                for i in range(1, 301)
+            )
+            (Path(cls.tmp.name) / f"data_{year}.csv").write_text(
+                "name,salary_from,salary_to,salary_currency,area_name,published_at\n"
+                + rows,
+                encoding="utf-8",
+            )
+        cls.db_name = str(Path(cls.tmp.name) / "salary.sqlite")
+        cls.professions = ["Программист", "Аналитик", "Тестировщик"]
+        cls.files = InputConnectReport(cls.tmp.name, cls.professions).get_files()
+        SalaryDatabase.from_csv(cls.files, cls.db_name).close()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_same_as_csv(self):
+        csv_report = InputConnectReport(
+            self.tmp.name, self.professions, backend="inline"
+        )
+        csv_report.prepare_data()
+
+        sqlite_report = InputConnectReportSQLite(self.db_name, self.professions)
+        sqlite_report.prepare_data()
+
+        self.assertEqual(sqlite_report.to_dict(), csv_report.to_dict())
+        self.assertEqual(sqlite_report.total_vacancies, 600)
+
+    def test_indexes(self):
+        with SalaryDatabase(self.db_name):
+            pass
+        with sqlite3.connect(self.db_name) as connection:
+            plan = connection.execute(
+                "EXPLAIN QUERY PLAN SELECT area_name, COUNT(salary), SUM(salary) "
+                "FROM salary WHERE salary IS NOT NULL GROUP BY area_name"
+            ).fetchall()
+        connection.close()
+        self.assertIn("COVERING INDEX salary_area", plan[0][-1])
+
+    def test_missing(self):
+        with self.assertRaises(VasyaException):
+            SalaryDatabase(str(Path(self.tmp.name) / "missing.sqlite"))
@@ -0,0 +1,69 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.vasya.sampling import ClusterMoments, sample_ranges
+
+
+class TestSampleRanges(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.file = Path(self.tmp.name) / "data_2020.csv"
+        rows = "".join(f"вакансия {i},{i * 100}\n" for i in range(200))
+        self.file.write_text("name,salary\n" + rows, encoding="utf-8")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read(self, ranges):
+        with open(self.file, "rb") as file:
+            data = file.read()
+        return b"".join(data[start:end] for start, end in ranges).decode("utf-8")
+
+    def test_all_blocks(self):
+        ranges, population = sample_ranges(str(self.file), 1, block_size=100)
+        self.assertEqual(len(ranges), population)
+        self.assertEqual(self.read(ranges), self.file.read_text(encoding="utf-8")[12:])
+
+    def test_fraction(self):
+        ranges, population = sample_ranges(str(self.file), 0.25, block_size=100)
+        self.assertEqual(len(ranges), round(population * 0.25))
+        for line in self.read(ranges).splitlines():
+            self.assertRegex(line, r"^вакансия \d+,\d+$")
+        self.assertEqual(ranges, sample_ranges(str(self.file), 0.25, block_size=100)[0])
+
+    def test_quoted(self):
+        rows = "".join(f'вакансия {i},"a\nb\n""c""",{i * 100}\n' for i in range(200))
+        self.file.write_text("name,skills,salary\n" + rows, encoding="utf-8")
+        ranges, population = sample_ranges(str(self.file), 1, block_size=100)
+        self.assertEqual(len(ranges), population)
+        self.assertEqual(self.read(ranges), rows)
+        ranges, _ = sample_ranges(str(self.file), 0.25, block_size=100)
+        for start, _ in ranges:
+            self.assertRegex(self.read([(start, start + 30)]), r"^вакансия \d+,")
+
+
+class TestClusterMoments(unittest.TestCase):
+    def make_moments(self, blocks, population):
+        moments = ClusterMoments(population=population)
+        for values in blocks:
+            moments.add_block(sum(values), len(values), sum(i * i for i in values))
+        return moments
+
+    def test_census(self):
+        moments = self.make_moments([[100, 200], [300], [400, 500]], 3)
+        self.assertEqual(moments.mean_error(), 0)
+        self.assertEqual(moments.total_error(), 0)
+        self.assertEqual(moments.effective_size(), 5)
+
+    def test_sample(self):
+        moments = self.make_moments([[100, 200], [300], [400, 500]], 30)
+        self.assertEqual(moments.scale, 10)
+        self.assertGreater(moments.mean_error(), 0)
+        self.assertGreater(moments.total_error(), 0)
+        self.assertLessEqual(moments.effective_size(), 5)
+
+        merged = self.make_moments([[100, 200]], 10).merge(
+            self.make_moments([[300], [400, 500]], 20)
+        )
+        self.assertEqual(merged, moments)
@@ -0,0 +1,83 @@
+import bisect
+import random
+import unittest
+from collections import Counter
+
+from src.vasya.sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+
+class TestKLLSketch(unittest.TestCase):
+    def test_quantiles(self):
+        rng = random.Random(0)
+        values = [rng.lognormvariate(11, 0.6) for _ in range(100000)]
+        parts = [KLLSketch() for _ in range(4)]
+        for n, value in enumerate(values):
+            parts[n % 4].update(value)
+
+        sketch = parts[0]
+        for part in parts[1:]:
+            sketch.merge(part)
+
+        self.assertEqual(sketch.count, len(values))
+        values.sort()
+        for q in (0.1, 0.5, 0.9):
+            rank = bisect.bisect(values, sketch.quantile(q)) / len(values)
+            self.assertAlmostEqual(rank, q, delta=0.02)
+
+    def test_empty(self):
+        self.assertIsNone(KLLSketch().quantile(0.5))
+
+
+class TestHyperLogLog(unittest.TestCase):
+    def test_count(self):
+        first, second = HyperLogLog(12), HyperLogLog(12)
+        for n in range(20000):
+            (first if n % 2 else second).add(f"Работодатель {n}")
+            first.add(f"Работодатель {n % 100}")
+
+        estimate = first.merge(second).count()
+        self.assertAlmostEqual(estimate, 20000, delta=20000 * 0.05)
+
+    def test_small_counts(self):
+        sketch = HyperLogLog(10)
+        for name in ("Москва", "Казань", "Москва"):
+            sketch.add(name)
+        self.assertEqual(sketch.count(), 2)
+
+    def test_merge_precision(self):
+        with self.assertRaises(ValueError):
+            HyperLogLog(10).merge(HyperLogLog(12))
+
+
+class TestSpaceSaving(unittest.TestCase):
+    def test_top(self):
+        rng = random.Random(1)
+        values = [f"Навык {int(rng.paretovariate(1.1))}" for _ in range(50000)]
+        parts = [SpaceSaving(100) for _ in range(3)]
+        for n, value in enumerate(values):
+            parts[n % 3].add(value)
+
+        sketch = parts[0]
+        for part in parts[1:]:
+            sketch.merge(part)
+
+        expected = Counter(values)
+        self.assertEqual(
+            [i for i, _ in sketch.top(5)], [i for i, _ in expected.most_common(5)]
+        )
+        for value, count in sketch.top(20):
+            self.assertLessEqual(expected[value], count)
+            self.assertGreaterEqual(expected[value], count - sketch.error)
+
+    def test_top_ties(self):
+        first, second = SpaceSaving(10), SpaceSaving(10)
+        for value in ("Git", "SQL", "SQL"):
+            first.add(value)
+        for value in ("Python", "Git", "Python"):
+            second.add(value)
+        merged = [
+            SpaceSaving(10).merge(a).merge(b)
+            for a, b in ((first, second), (second, first))
+        ]
+        self.assertEqual(merged[0].top(3), merged[1].top(3))
+        self.assertEqual(merged[0].top(3), [("Git", 2), ("Python", 2), ("SQL", 2)])
@@ -0,0 +1,55 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.vasya.dataset import DataSet
+from src.vasya.errors import VasyaException
+from src.vasya.synthetic import FULL_HEADER, generate
+
+
+class TestGenerate(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_deterministic(self):
+        first = generate(str(self.dir / "a.csv"), 1000, seed=1)
+        second = generate(str(self.dir / "b.csv"), 1000, seed=1)
+        third = generate(str(self.dir / "c.csv"), 1000, seed=2)
+        data = [Path(i[0]).read_bytes() for i in (first, second, third)]
+        self.assertEqual(data[0], data[1])
+        self.assertNotEqual(data[0], data[2])
+        self.assertEqual(data[0].count(b"\n"), 1001)
+
+    def test_split_by_year(self):
+        files = generate(
+            str(self.dir / "vac.csv"), 2000, split_by_year=True, years=(2020, 2022)
+        )
+        self.assertEqual(
+            [Path(i).name for i in files],
+            ["vac_2020.csv", "vac_2021.csv", "vac_2022.csv"],
+        )
+        total = 0
+        for file, year in zip(files, (2020, 2021, 2022)):
+            vacancies = DataSet.from_file(file).to_list()
+            total += len(vacancies)
+            self.assertTrue(all(i.published_at.year == year for i in vacancies))
+        self.assertGreater(total, 1800)
+
+    def test_full(self):
+        (file,) = generate(str(self.dir / "full.csv"), 500, full=True, incomplete=0)
+        vacancies = DataSet.from_file(file).to_list()
+        self.assertEqual(len(vacancies), 500)
+        self.assertTrue(all(i.key_skills and i.salary for i in vacancies))
+        self.assertNotIn("<", vacancies[0].description)
+        with open(file, encoding="utf-8") as f:
+            self.assertEqual(f.readline().strip(), ",".join(FULL_HEADER))
+
+    def test_errors(self):
+        with self.assertRaises(VasyaException):
+            generate(str(self.dir / "a.csv"), -1)
+        with self.assertRaises(VasyaException):
+            generate(str(self.dir / "a.csv"), 10, years=(2022, 2020))